@@ -0,0 +1,131 @@
+"""
+Background price alert monitor
+Polls every alerted ticker in one batch per cycle and checks the alerts
+against a sorted index of price levels, so each check is a bisect
+"""
+
+import bisect
+import threading
+
+import pandas as pd
+
+
+class AlertIndex:
+    """Sorted 'above' and 'below' price levels for one ticker"""
+
+    def __init__(self):
+        self.above = []
+        self.below = []
+
+    def __len__(self):
+        return len(self.above) + len(self.below)
+
+    def add(self, alert_type, price):
+        levels = self.above if alert_type == 'above' else self.below
+        bisect.insort(levels, price)
+
+    def remove(self, alert_type, price):
+        levels = self.above if alert_type == 'above' else self.below
+        i = bisect.bisect_left(levels, price)
+        if i < len(levels) and levels[i] == price:
+            del levels[i]
+
+    def pop_triggered(self, low, high):
+        """Remove and return alerts crossed by a bar with this low/high"""
+        # 'above' levels at or under the high were reached
+        k = bisect.bisect_right(self.above, high)
+        triggered = [('above', p) for p in self.above[:k]]
+        del self.above[:k]
+
+        # 'below' levels at or over the low were reached
+        k = bisect.bisect_left(self.below, low)
+        triggered += [('below', p) for p in self.below[k:]]
+        del self.below[k:]
+        return triggered
+
+
+class AlertMonitor:
+    """Checks price alerts on a background thread"""
+
+    def __init__(self, feed, on_trigger, interval=60):
+        # feed.price_ranges(tickers, since) -> {ticker: (last, high, low)}
+        self.feed = feed
+        # on_trigger(ticker, alert_type, level, last_price), called from the monitor thread
+        self.on_trigger = on_trigger
+        self.interval = interval
+
+        self.polls = 0
+        self._indexes = {}
+        self._since = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load(self, alerts):
+        """Replace all alerts from a {ticker: [{'type': ..., 'price': ...}]} mapping"""
+        with self._lock:
+            self._indexes = {}
+        for ticker, entries in alerts.items():
+            for alert in entries:
+                self.add(ticker, alert['type'], alert['price'])
+
+    def add(self, ticker, alert_type, price):
+        with self._lock:
+            self._indexes.setdefault(ticker, AlertIndex()).add(alert_type, price)
+
+    def remove(self, ticker, alert_type, price):
+        with self._lock:
+            index = self._indexes.get(ticker)
+            if index is not None:
+                index.remove(alert_type, price)
+                if not index:
+                    del self._indexes[ticker]
+
+    def tickers(self):
+        with self._lock:
+            return list(self._indexes)
+
+    def check_once(self):
+        """Poll once and fire any crossed alerts; returns what fired"""
+        tickers = self.tickers()
+        if not tickers:
+            return []
+
+        now = pd.Timestamp.now(tz='UTC')
+        ranges = self.feed.price_ranges(tickers, self._since)
+        self._since = now
+        self.polls += 1
+
+        fired = []
+        with self._lock:
+            for ticker, (last, high, low) in ranges.items():
+                index = self._indexes.get(ticker)
+                if index is None:
+                    continue
+                for alert_type, level in index.pop_triggered(low, high):
+                    fired.append((ticker, alert_type, level, last))
+                if not index:
+                    del self._indexes[ticker]
+
+        for alert in fired:
+            self.on_trigger(*alert)
+        return fired
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check_once()
+            except Exception:
+                # Network hiccup - try again next cycle
+                pass
+            self._stop.wait(self.interval)
@@ -0,0 +1,136 @@
+"""
+Latest-wins analysis scheduler
+Runs one analysis at a time on a single worker thread. A request for the
+ticker/period already queued or running is merged into it; anything else
+supersedes (cancels) the queued and running requests, so bursts of clicks
+never pile up fetches and only the newest request gets rendered.
+"""
+
+import threading
+
+
+class Superseded(Exception):
+    """Raised inside a job once a newer request has replaced it"""
+
+
+class AnalysisRequest:
+    """One queued analysis, identified by its key (e.g. ticker and period)"""
+
+    def __init__(self, key, seq):
+        self.key = key
+        self.seq = seq
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        """Stop the job here if it has been superseded"""
+        if self.cancelled:
+            raise Superseded(self.key)
+
+
+class AnalysisScheduler:
+    """Single-worker queue that keeps only the most recent request"""
+
+    def __init__(self, work, on_idle=None):
+        # work(request) runs on the worker thread and should call
+        # request.check() between stages; on_idle() runs there once the queue drains
+        self.work = work
+        self.on_idle = on_idle
+
+        self.submitted = 0
+        self.merged = 0
+        self.dropped = 0
+        self.completed = 0
+        self._seq = 0
+        self._pending = None
+        self._running = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, *key):
+        """Queue a request and return it (or the in-flight one it merged into)"""
+        with self._cond:
+            self.submitted += 1
+            if self._pending is not None:
+                if self._pending.key == key:
+                    self.merged += 1
+                    return self._pending
+                self._pending.cancel()
+                self._pending = None
+                self.dropped += 1
+
+            running = self._running
+            if running is not None and not running.cancelled:
+                if running.key == key:
+                    self.merged += 1
+                    return running
+                running.cancel()
+                self.dropped += 1
+
+            self._seq += 1
+            self._pending = AnalysisRequest(key, self._seq)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="analysis")
+                self._thread.start()
+            self._cond.notify()
+            return self._pending
+
+    def cancel_all(self):
+        """Drop the queued request and abandon the running one"""
+        with self._cond:
+            for request in (self._pending, self._running):
+                if request is not None and not request.cancelled:
+                    request.cancel()
+                    self.dropped += 1
+            self._pending = None
+
+    @property
+    def depth(self):
+        """Requests queued or running"""
+        with self._cond:
+            return (self._pending is not None) + (self._running is not None)
+
+    def stats(self):
+        """Return queue depth and request counters"""
+        with self._cond:
+            return {
+                'depth': (self._pending is not None) + (self._running is not None),
+                'submitted': self.submitted,
+                'merged': self.merged,
+                'dropped': self.dropped,
+                'completed': self.completed,
+            }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                request = self._running = self._pending
+                self._pending = None
+
+            try:
+                request.check()
+                self.work(request)
+            except Superseded:
+                pass
+            except Exception:
+                # The job reports its own errors; keep the worker alive
+                pass
+            else:
+                with self._cond:
+                    if not request.cancelled:
+                        self.completed += 1
+
+            with self._cond:
+                self._running = None
+                idle = self._pending is None
+            if idle and self.on_idle is not None:
+                self.on_idle()
@@ -0,0 +1,173 @@
+"""
+Composite-score backtester
+Turns the per-bar STRONG BUY ... STRONG SELL signals into positions and
+measures how they would have performed, using array operations only.
+Universes of tickers run in a process pool.
+
+Run: python backtest.py AAPL MSFT NVDA --period 10y
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from bar_cache import BarCache
+from indicator_engine import calculate_indicators
+
+TRADING_DAYS = 252
+
+# Bars in a regular 6.5-hour session at each intraday interval
+SESSION_BARS = {'1m': 390, '5m': 78, '1h': 7}
+
+# Scores at or above BUY go long; at or below SELL go short (or flat)
+BUY_SCORE = 2
+SELL_SCORE = -2
+
+
+def positions_from_scores(score, allow_short=False):
+    """Target position per bar: 1 long, -1 short, 0 flat; HOLD keeps the last one"""
+    short = -1.0 if allow_short else 0.0
+    raw = np.where(score >= BUY_SCORE, 1.0, np.where(score <= SELL_SCORE, short, np.nan))
+    return pd.DataFrame(raw, index=score.index, columns=score.columns).ffill().fillna(0.0)
+
+
+def bars_per_year(interval="1d"):
+    """Bars in a trading year at `interval`, for annualizing metrics"""
+    if interval == "1wk":
+        return 52
+    return TRADING_DAYS * SESSION_BARS.get(interval, 1)
+
+
+def run_backtest(close, score, allow_short=False, cost_bps=5.0, periods_per_year=TRADING_DAYS):
+    """Backtest one ticker (Series) or a panel of tickers (DataFrame columns).
+
+    Positions act on the bar after the signal. Returns the equity curve,
+    strategy returns, positions and metrics, annualized with
+    `periods_per_year` bars per year (see bars_per_year).
+    """
+    single = isinstance(close, pd.Series)
+    if single:
+        close, score = close.to_frame('value'), score.to_frame('value')
+
+    positions = positions_from_scores(score, allow_short).shift(1).fillna(0.0)
+    asset_returns = close.pct_change().fillna(0.0)
+    trades = positions.diff().abs().fillna(positions.abs())
+
+    returns = positions * asset_returns - trades * cost_bps / 10000
+    equity = (1 + returns).cumprod()
+    result = {
+        'equity': equity,
+        'returns': returns,
+        'positions': positions,
+        'metrics': backtest_metrics(equity, returns, positions, trades, periods_per_year),
+    }
+    if single:
+        result = {name: value['value'] if name != 'metrics' else value.loc['value']
+                  for name, value in result.items()}
+    return result
+
+
+def backtest_metrics(equity, returns, positions, trades, periods_per_year=TRADING_DAYS):
+    """Performance stats per column, one row per ticker"""
+    years = max(len(equity) / periods_per_year, 1 / periods_per_year)
+    drawdown = equity / equity.cummax() - 1
+    invested = positions != 0
+    wins = (returns > 0) & invested
+
+    total = equity.iloc[-1] - 1
+    vol = returns.std() * np.sqrt(periods_per_year)
+    return pd.DataFrame({
+        'Total Return %': total * 100,
+        'CAGR %': ((1 + total) ** (1 / years) - 1) * 100,
+        'Sharpe': returns.mean() * periods_per_year / vol.replace(0, np.nan),
+        'Max DD %': drawdown.min() * 100,
+        'Hit Rate %': wins.sum() / invested.sum().clip(lower=1) * 100,
+        'Exposure %': invested.mean() * 100,
+        'Turnover/yr': trades.sum() / years,
+        'Trades': (trades > 0).sum(),
+    })
+
+
+def backtest_frame(data, **options):
+    """Backtest an indicator frame (with Close and Score columns)"""
+    return run_backtest(data['Close'], data['Score'], **options)
+
+
+# Process pool workers
+
+_worker_cache = None
+
+
+def _init_worker(cache_dir):
+    global _worker_cache
+    _worker_cache = BarCache(cache_dir=cache_dir)
+
+
+def _backtest_ticker(args):
+    ticker, period, options = args
+    try:
+        data = _worker_cache.history(ticker, period)
+        if len(data) < 2:
+            raise ValueError("no data")
+        result = backtest_frame(calculate_indicators(data), **options)
+        return ticker, result['metrics'], result['equity'], None
+    except Exception as e:
+        return ticker, None, None, str(e)
+
+
+def backtest_universe(tickers, period="10y", workers=None, cache_dir="cache",
+                      on_result=None, **options):
+    """Backtest many tickers in a process pool.
+
+    Each worker fetches through its own bar cache, computes indicators and
+    runs the vectorized backtest. Returns (metrics table, equity panel, errors).
+    """
+    metrics, equity, errors = {}, {}, {}
+    jobs = [(t.upper(), period, options) for t in tickers]
+    # Spawned workers never inherit Tk or network state from the GUI process
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_dir,),
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        for ticker, m, eq, error in pool.map(_backtest_ticker, jobs, chunksize=4):
+            if error is None:
+                metrics[ticker] = m
+                equity[ticker] = eq
+            else:
+                errors[ticker] = error
+            if on_result is not None:
+                on_result(ticker, m, error)
+
+    table = pd.DataFrame(metrics).T
+    if not table.empty:
+        table = table.sort_values('Total Return %', ascending=False)
+    return table, pd.DataFrame(equity), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest composite-score signals")
+    parser.add_argument('tickers', nargs='+', help="ticker symbols")
+    parser.add_argument('--period', default="10y")
+    parser.add_argument('--short', action='store_true', help="short on SELL signals")
+    parser.add_argument('--cost-bps', type=float, default=5.0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table, _, errors = backtest_universe(args.tickers, args.period, args.workers,
+                                         allow_short=args.short, cost_bps=args.cost_bps)
+    elapsed = time.perf_counter() - start
+
+    with pd.option_context('display.width', 140, 'display.max_rows', 500):
+        print(table.round(2))
+    for ticker, error in errors.items():
+        print(f"❌ {ticker}: {error}")
+    print(f"\nBacktested {len(table)} tickers in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
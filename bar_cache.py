@@ -0,0 +1,193 @@
+"""
+On-disk OHLCV bar cache
+Serves any history period from local columnar files and only asks the
+provider for the bars that arrived since the last cached timestamp
+"""
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_sources import make_provider, period_start, session_count, slice_period
+from resample import finer_intervals, resample_bars
+
+
+class BarCache:
+    """Columnar bar cache keyed by ticker and interval"""
+
+    def __init__(self, provider=None, cache_dir="cache", refresh_after=60):
+        # Yahoo Finance, or local files when $STOCK_ANALYZER_DATA is set
+        self.provider = provider or make_provider()
+        self.cache_dir = cache_dir
+        # Seconds before a cached series is checked for new tail bars
+        self.refresh_after = refresh_after
+
+        self.hits = 0
+        self.tail_refreshes = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def history(self, ticker, period="1y", interval="1d"):
+        """Return bars for `period`, fetching only what the cache lacks"""
+        ticker = ticker.upper()
+        if getattr(self.provider, 'local', False):
+            # Local files are read straight from their memory map
+            self._count('hits')
+            return self.provider.fetch(ticker, interval=interval, period=period)
+        with self._key_lock(ticker, interval):
+            data, meta = self._load(ticker, interval)
+
+            if data is None or not self._covers(data, meta, period):
+                data = self._fetch_full(ticker, interval, period, meta)
+                self._count('misses')
+            elif time.time() - meta['checked'] >= self.refresh_after:
+                data = self._fetch_tail(ticker, interval, data, meta)
+                self._count('tail_refreshes')
+            else:
+                self._count('hits')
+
+        return slice_period(data, period).copy()
+
+    def bars(self, ticker, period="1y", interval="1d"):
+        """Bars at `interval`: cached ones first, then resampled from finer cached
+        bars that cover `period`, and only then fetched"""
+        # Bars held at this interval always win, so a chart never changes with
+        # what else was viewed (Yahoo's intraday bars are not dividend-adjusted)
+        if self.covers(ticker, period, interval):
+            return self.history(ticker, period, interval)
+        for source in finer_intervals(interval):
+            if self.covers(ticker, period, source):
+                return resample_bars(self.history(ticker, period, source), interval)
+        return self.history(ticker, period, interval)
+
+    def covers(self, ticker, period, interval="1d"):
+        """Check whether the cache already holds `period` at `interval`"""
+        ticker = ticker.upper()
+        if getattr(self.provider, 'local', False):
+            return self.provider.available(ticker, interval)
+        with self._key_lock(ticker, interval):
+            data, meta = self._load(ticker, interval)
+        return data is not None and not data.empty and self._covers(data, meta, period)
+
+    def stats(self):
+        """Return hit/miss counters"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'tail_refreshes': self.tail_refreshes,
+                'misses': self.misses,
+            }
+
+    def clear(self, ticker=None):
+        """Delete cached files for one ticker, or all of them"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        prefix = f"{ticker.upper()}_" if ticker else ""
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name.endswith(".npz"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    # Internals
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _key_lock(self, ticker, interval):
+        with self._lock:
+            return self._key_locks.setdefault((ticker, interval), threading.Lock())
+
+    def _path(self, ticker, interval):
+        return os.path.join(self.cache_dir, f"{ticker}_{interval}.npz")
+
+    def _covers(self, data, meta, period):
+        """Check whether the cached series reaches back far enough"""
+        if meta['covers_max']:
+            return True
+        if period == "max":
+            return False
+        if period.endswith("d"):
+            return session_count(data) >= int(period[:-1])
+        start = period_start(period, pd.Timestamp.now(tz=data.index.tz))
+        return meta['start'] is not None and meta['start'] <= start.value
+
+    def _fetch_full(self, ticker, interval, period, meta):
+        data = self.provider.fetch(ticker, interval=interval, period=period)
+        if data.empty:
+            return data
+
+        if period == "max":
+            start = None
+        elif period.endswith("d"):
+            start = data.index[0].value
+        else:
+            start = period_start(period, pd.Timestamp.now(tz=data.index.tz)).value
+
+        # Keep older coverage when a shorter period refetch overlaps it
+        if meta is not None and meta['start'] is not None and start is not None:
+            start = min(start, meta['start'])
+        self._save(ticker, interval, data, {'start': start, 'covers_max': period == "max"})
+        return data
+
+    def _fetch_tail(self, ticker, interval, data, meta):
+        """Fetch bars from the last cached timestamp onwards and merge them"""
+        last = data.index[-1]
+        try:
+            tail = self.provider.fetch(ticker, interval=interval, start=last.normalize())
+        except Exception:
+            # Offline or rate limited - serve what we have
+            return data
+
+        if not tail.empty:
+            # The last cached bar may still have been forming, so replace it
+            tail = tail[data.columns.intersection(tail.columns)]
+            data = pd.concat([data[data.index < tail.index[0]], tail])
+        self._save(ticker, interval, data, meta)
+        return data
+
+    def _load(self, ticker, interval):
+        path = self._path(ticker, interval)
+        if not os.path.exists(path):
+            return None, None
+        try:
+            with np.load(path) as npz:
+                meta = json.loads(str(npz['__meta__']))
+                index = pd.to_datetime(npz['__ts__'], utc=True)
+                if meta['tz']:
+                    index = index.tz_convert(meta['tz'])
+                else:
+                    index = index.tz_localize(None)
+                columns = {name: npz[name] for name in meta['columns']}
+        except Exception:
+            # Corrupt or old-format file - refetch
+            return None, None
+        data = pd.DataFrame(columns, index=pd.DatetimeIndex(index, name=meta['index_name']))
+        return data, meta
+
+    def _save(self, ticker, interval, data, meta):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tz = data.index.tz
+        index = data.index.tz_convert('UTC') if tz is not None else data.index
+        meta = {
+            'start': meta['start'],
+            'covers_max': meta['covers_max'],
+            'checked': time.time(),
+            'tz': str(tz) if tz is not None else None,
+            'index_name': data.index.name,
+            'columns': [str(c) for c in data.columns],
+        }
+        arrays = {str(c): data[c].to_numpy() for c in data.columns}
+        arrays['__ts__'] = index.as_unit('ns').asi8
+        arrays['__meta__'] = np.array(json.dumps(meta))
+
+        # Write to a temp file first so a crash never leaves a torn cache
+        path = self._path(ticker, interval)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
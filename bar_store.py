@@ -0,0 +1,182 @@
+"""
+In-memory bar store
+Keeps many tickers' bars (and indicator columns) as compact contiguous
+arrays - int64 epoch timestamps and float32 wherever the values survive the
+round trip - under a memory budget, evicting the least recently used series.
+Series are keyed by ticker and interval; shorter periods are sliced from the
+longest one stored, and frames read back are views over the stored arrays.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data_sources import PERIOD_DAYS, slice_period
+
+# Relative error a column may pick up from float32 storage
+FLOAT32_RTOL = 1e-6
+
+
+def compact_column(values):
+    """Smallest lossless-enough contiguous array for a column"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        limits = np.iinfo(np.int32)
+        fits = not len(values) or (values.min() >= limits.min and values.max() <= limits.max)
+        return np.ascontiguousarray(values, dtype=np.int32 if fits else np.int64)
+
+    values = values.astype(np.float64, copy=False)
+    small = values.astype(np.float32)
+    finite = np.isfinite(values)
+    # Overflow to inf, or more than FLOAT32_RTOL of error, keeps float64
+    lossless = (np.array_equal(np.isfinite(small), finite) and
+                np.allclose(small[finite], values[finite], rtol=FLOAT32_RTOL, atol=0))
+    return small if lossless else np.ascontiguousarray(values)
+
+
+class StoredBars:
+    """One series held as contiguous column arrays, covering `period`"""
+
+    def __init__(self, data, period="max"):
+        self.period = period
+        index = data.index
+        self.tz = str(index.tz) if index.tz is not None else None
+        utc = index.tz_convert('UTC') if index.tz is not None else index
+        self.timestamps = np.ascontiguousarray(utc.as_unit('ns').asi8)
+        self.index_name = index.name
+        self.columns = {str(c): compact_column(data[c].to_numpy()) for c in data.columns}
+        for array in [self.timestamps, *self.columns.values()]:
+            array.flags.writeable = False
+        self._index = None
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def nbytes(self):
+        return self.timestamps.nbytes + sum(a.nbytes for a in self.columns.values())
+
+    def covers(self, period):
+        """Whether the stored history reaches back at least `period`"""
+        return PERIOD_DAYS.get(period, float('inf')) <= PERIOD_DAYS.get(self.period, 0)
+
+    def column(self, name, period=None):
+        """Read-only view of one column, optionally the last `period` of it (no copy)"""
+        return self.columns[name][self._start(period):]
+
+    def index(self):
+        """The DatetimeIndex the series was stored with"""
+        if self._index is None:
+            index = pd.to_datetime(self.timestamps, utc=True)
+            index = index.tz_convert(self.tz) if self.tz else index.tz_localize(None)
+            self._index = pd.DatetimeIndex(index, name=self.index_name)
+        return self._index
+
+    def to_frame(self, columns=None, period=None):
+        """Read-only DataFrame over the stored arrays in their compact dtypes,
+        optionally the last `period` of them (no copy)"""
+        start = self._start(period)
+        names = columns or list(self.columns)
+        return pd.DataFrame({name: self.columns[name][start:] for name in names},
+                            index=self.index()[start:], copy=False)
+
+    # Internals
+
+    def _start(self, period):
+        """Position of the first bar inside `period`, by slice_period's rules"""
+        if period is None or period == self.period or not len(self):
+            return 0
+        positions = slice_period(pd.Series(np.arange(len(self)), index=self.index()), period)
+        return int(positions.iloc[0]) if len(positions) else len(self)
+
+
+class BarStore:
+    """LRU cache of compact bar series with a memory budget"""
+
+    def __init__(self, budget=256 * 1024 * 1024):
+        # Bytes of array data to keep before evicting old series
+        self.budget = budget
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._series = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, key, data, period="max"):
+        """Store a bar frame covering `period` under `key` (e.g. ticker, interval)"""
+        stored = StoredBars(data, period)
+        with self._lock:
+            old = self._series.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._series[key] = stored
+            self._bytes += stored.nbytes
+            self._evict(keep=key)
+        return stored
+
+    def get(self, key, period=None):
+        """Stored series for `key`, or None (also when it is shorter than `period`)"""
+        with self._lock:
+            stored = self._series.get(key)
+            if stored is None or (period is not None and not stored.covers(period)):
+                self.misses += 1
+                return None
+            self._series.move_to_end(key)
+            self.hits += 1
+            return stored
+
+    def frame(self, key, columns=None, period=None):
+        """The last `period` of the series stored for `key` as a read-only
+        DataFrame (see StoredBars.to_frame), or None"""
+        stored = self.get(key, period)
+        return stored.to_frame(columns, period) if stored is not None else None
+
+    def discard(self, key):
+        with self._lock:
+            stored = self._series.pop(key, None)
+            if stored is not None:
+                self._bytes -= stored.nbytes
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._series
+
+    def __len__(self):
+        with self._lock:
+            return len(self._series)
+
+    def bytes_per_ticker(self):
+        """Array bytes held per ticker (the first part of tuple keys)"""
+        with self._lock:
+            usage = {}
+            for key, stored in self._series.items():
+                ticker = key[0] if isinstance(key, tuple) else key
+                usage[ticker] = usage.get(ticker, 0) + stored.nbytes
+            return usage
+
+    def stats(self):
+        """Return memory usage and hit/miss/eviction counters"""
+        with self._lock:
+            return {
+                'series': len(self._series),
+                'bytes': self._bytes,
+                'budget': self.budget,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    # Internals
+
+    def _evict(self, keep):
+        while self._bytes > self.budget and len(self._series) > 1:
+            key = next(iter(self._series))
+            if key == keep:
+                break
+            self._bytes -= self._series.pop(key).nbytes
+            self.evictions += 1
@@ -0,0 +1,68 @@
+"""
+Candlestick rendering benchmark
+Compares the old one-artist-per-bar loop with the batched collections in
+chart_render at 250, 2,500 and 25,000 bars on an off-screen Agg canvas
+
+Run: python benchmarks/bench_candlesticks.py
+"""
+
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from chart_render import plot_candlesticks
+from synthetic import make_ohlcv
+
+UP = '#3fb950'
+DOWN = '#f85149'
+SIZES = [250, 2500, 25000]
+
+
+def plot_candlesticks_per_bar(ax, data):
+    """The previous implementation: one line and one Rectangle per bar"""
+    width = 0.6
+    for idx in range(len(data)):
+        date = mdates.date2num(data.index[idx])
+        open_price = data['Open'].iloc[idx]
+        close_price = data['Close'].iloc[idx]
+        high = data['High'].iloc[idx]
+        low = data['Low'].iloc[idx]
+        color = UP if close_price >= open_price else DOWN
+        ax.plot([date, date], [low, high], color=color, linewidth=1, alpha=0.8, zorder=3)
+        height = max(abs(close_price - open_price), 0.001)
+        bottom = min(open_price, close_price)
+        ax.add_patch(Rectangle((date - width/2, bottom), width, height,
+                               facecolor=color, edgecolor=color, alpha=0.9, zorder=3))
+
+
+def time_render(plot, data):
+    """Seconds to build the artists and draw the figure once"""
+    fig = Figure(figsize=(15, 10))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    start = time.perf_counter()
+    plot(ax, data)
+    ax.autoscale_view()
+    fig.canvas.draw()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'bars':>8} {'per-bar (s)':>12} {'batched (s)':>12} {'speedup':>8}")
+    for n in SIZES:
+        data = make_ohlcv(n)
+        old = time_render(plot_candlesticks_per_bar, data)
+        new = time_render(lambda ax, d: plot_candlesticks(ax, d, UP, DOWN), data)
+        print(f"{n:>8} {old:>12.3f} {new:>12.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
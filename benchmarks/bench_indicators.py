@@ -0,0 +1,116 @@
+"""
+Indicator kernel benchmark
+Compares the previous pandas implementation of calculate_indicators (one
+rolling pass per indicator, MA_20 computed twice) with the fused
+cumulative-sum kernel, and checks both produce the same numbers. The
+streaming IndicatorEngine is checked against the batch output too: seeded
+from a prefix, fed the rest bar by bar, with the last bar revised in place.
+
+Run: python benchmarks/bench_indicators.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from indicator_engine import INDICATOR_COLUMNS, IndicatorEngine, calculate_indicators
+from signals import score_series
+from synthetic import make_ohlcv
+
+SIZES = [1000, 10000, 100000, 1000000]
+
+
+def calculate_indicators_pandas(data):
+    """The previous implementation: separate pandas rolling passes"""
+    data['MA_20'] = data['Close'].rolling(window=20).mean()
+    data['MA_50'] = data['Close'].rolling(window=50).mean()
+    data['MA_200'] = data['Close'].rolling(window=200).mean()
+
+    delta = data['Close'].diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = -delta.where(delta < 0, 0).rolling(window=14).mean()
+    rs = gain / loss
+    data['RSI'] = 100 - (100 / (1 + rs))
+
+    ema_12 = data['Close'].ewm(span=12, adjust=False).mean()
+    ema_26 = data['Close'].ewm(span=26, adjust=False).mean()
+    data['MACD'] = ema_12 - ema_26
+    data['MACD_Signal'] = data['MACD'].ewm(span=9, adjust=False).mean()
+    data['MACD_Hist'] = data['MACD'] - data['MACD_Signal']
+
+    sma = data['Close'].rolling(window=20).mean()
+    std = data['Close'].rolling(window=20).std()
+    data['BB_Upper'] = sma + (std * 2)
+    data['BB_Lower'] = sma - (std * 2)
+
+    data['Volume_MA'] = data['Volume'].rolling(window=20).mean()
+    data['Score'] = score_series(data)
+    return data
+
+
+def best_time(func, bars, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        frame = bars.copy()
+        start = time.perf_counter()
+        func(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def max_relative_error(expected, actual):
+    """Largest |difference| relative to the column's scale, NaNs must line up"""
+    worst = 0.0
+    for name in INDICATOR_COLUMNS:
+        a = expected[name].to_numpy()
+        b = actual[name].to_numpy()
+        if not np.array_equal(np.isnan(a), np.isnan(b)):
+            raise AssertionError(f"{name}: NaN positions differ")
+        finite = np.isfinite(a)
+        scale = max(np.abs(a[finite]).max(), 1e-12) if finite.any() else 1.0
+        worst = max(worst, np.abs(a[finite] - b[finite]).max() / scale if finite.any() else 0.0)
+    return worst
+
+
+def check_streaming(bars, prefix=300):
+    """Largest relative error of the streaming engine against the batch output"""
+    expected = calculate_indicators(bars.copy())
+
+    engine = IndicatorEngine().seed(expected.iloc[:prefix])
+    tail = bars.iloc[prefix:]
+    streamed = engine.update_frame(tail.iloc[:-1].copy())
+
+    # The last bar first arrives half formed, then is revised to its final values
+    ts = tail.index[-1]
+    engine.update(ts, tail['Open'].iloc[-1], tail['Volume'].iloc[-1] // 2)
+    last = engine.update(ts, tail['Close'].iloc[-1], tail['Volume'].iloc[-1])
+    streamed.loc[ts] = {**tail.iloc[-1].to_dict(), **last}
+
+    return max_relative_error(expected.iloc[prefix:], streamed)
+
+
+def main():
+    print(f"{'bars':>9} {'pandas (ms)':>12} {'fused (ms)':>11} {'speedup':>8} {'max rel err':>12}")
+    for n in SIZES:
+        bars = make_ohlcv(n)
+        old = best_time(calculate_indicators_pandas, bars)
+        new = best_time(calculate_indicators, bars)
+        error = max_relative_error(calculate_indicators_pandas(bars.copy()),
+                                   calculate_indicators(bars.copy()))
+        print(f"{n:>9} {old * 1000:>12.2f} {new * 1000:>11.2f} {old / new:>7.1f}x {error:>12.1e}")
+
+    # Streamed values must match the batch kernel, forming-bar revisions and
+    # missing closes and volumes (halted or partial bars) included
+    gappy = make_ohlcv(5000)
+    gappy.iloc[[100, 298, 1000, 2500, 2501, 4990], gappy.columns.get_loc('Close')] = np.nan
+    gappy.iloc[[250, 3000], gappy.columns.get_loc('Volume')] = np.nan
+    error = max(check_streaming(make_ohlcv(5000)), check_streaming(gappy))
+    print(f"\nstreaming engine vs batch: max rel err {error:.1e}")
+    assert error < 1e-9, "streaming indicators differ from calculate_indicators"
+
+
+if __name__ == "__main__":
+    main()
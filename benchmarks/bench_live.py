@@ -0,0 +1,100 @@
+"""
+Live mode benchmark
+Replays synthetic 1-minute bars as ticks into a LiveSession drawn by an
+off-screen ChartView in live mode, with the redraw capped at LIVE_FPS as in
+the app, and reports ticks/sec processed and dropped, frame rate and frame
+times. Frames that only revise the forming bar are blitted; frames that add
+a bar (and scroll the view) are full draws.
+
+Run: python benchmarks/bench_live.py --bars 2000 --rate 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+from bench_suite import COLORS
+from chart_view import ChartView
+from indicator_engine import INDICATOR_COLUMNS, calculate_indicators
+from live_quotes import LIVE_FPS, LiveSession, ReplayFeed
+from synthetic import make_ohlcv
+
+
+def run(bars, replay, ticks_per_bar, rate, fps):
+    data = make_ohlcv(bars + replay)
+    data.index = pd.date_range('2024-03-04 09:30', periods=len(data), freq='1min',
+                               tz='America/New_York', name='Datetime')
+    data = calculate_indicators(data)
+    head, tail = data.iloc[:-replay].copy(), data.iloc[-replay:]
+
+    view = ChartView(None, COLORS)
+    view.show(head, 'SYN')
+    view.set_live(True)
+    view.canvas.draw()
+
+    session = LiveSession(head, '1m')
+    feed = ReplayFeed(tail, ticks_per_bar=ticks_per_bar, rate=rate)
+    ended = []
+    feed.start(session.on_tick, on_end=lambda: ended.append(True))
+    session.metrics.snapshot()
+
+    blits, draws = [], []
+    began = time.perf_counter()
+    while True:
+        frame_start = time.perf_counter()
+        done = bool(ended)
+        if session.apply():
+            view.update_live(session.data)
+            if view._draw_pending:
+                view.canvas.draw()
+                draws.append(time.perf_counter() - frame_start)
+            else:
+                blits.append(time.perf_counter() - frame_start)
+        if done:
+            break
+        time.sleep(max(1 / fps - (time.perf_counter() - frame_start), 0))
+    elapsed = time.perf_counter() - began
+    stats = session.metrics.snapshot()
+
+    # The streamed frame must equal a batch calculation over the same bars
+    streamed = session.data
+    assert len(streamed) == len(data) and streamed.index.equals(data.index), \
+        "live frame has different bars than batch"
+    for column in ['Open', 'High', 'Low', 'Close', 'Volume', *INDICATOR_COLUMNS]:
+        assert np.allclose(streamed[column], data[column], rtol=1e-9, atol=0, equal_nan=True), \
+            f"live {column} differs from batch"
+    assert np.array_equal(streamed['Score'], data['Score']), "live Score differs from batch"
+
+    print(f"{len(tail)} bars replayed as {stats['received']} ticks in {elapsed:.2f} s")
+    print(f"  processed      {stats['processed'] / elapsed:>10.0f} ticks/s")
+    print(f"  dropped        {stats['dropped'] / elapsed:>10.0f} ticks/s")
+    print(f"  frames         {stats['frames'] / elapsed:>10.1f} fps "
+          f"({stats['ticks_per_frame']:.1f} ticks/frame)")
+    print(f"  apply          {stats['apply_ms']:>10.2f} ms/frame")
+    if blits:
+        print(f"  blit frame     {np.median(blits) * 1000:>10.1f} ms median ({len(blits)} frames)")
+    if draws:
+        print(f"  full frame     {np.median(draws) * 1000:>10.1f} ms median ({len(draws)} frames)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live mode benchmark")
+    parser.add_argument('--bars', type=int, default=2000, help="bars on the chart")
+    parser.add_argument('--replay', type=int, default=10, help="bars replayed as ticks")
+    parser.add_argument('--ticks-per-bar', type=int, default=1000)
+    parser.add_argument('--rate', type=float, default=2000, help="ticks per second")
+    parser.add_argument('--fps', type=float, default=LIVE_FPS, help="redraw cap")
+    args = parser.parse_args()
+    run(args.bars, args.replay, args.ticks_per_bar, args.rate, args.fps)
+
+
+if __name__ == "__main__":
+    main()
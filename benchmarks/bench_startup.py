@@ -0,0 +1,99 @@
+"""
+GUI startup benchmark
+Measures, in a fresh interpreter per run, how long stock_analyzer_gui takes
+to import, to put its window on screen and to draw its first chart (from
+synthetic bars, so the network is never involved)
+
+Run: python benchmarks/bench_startup.py [--runs 5] [--max-window 0.5] [--max-chart 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = ['import', 'window', 'first_chart']
+
+
+def child():
+    """One cold start; prints the stage timings as JSON"""
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    import tkinter as tk
+    import stock_analyzer_gui as gui
+    timings = {'import': time.perf_counter() - start}
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        timings['error'] = f"no display ({e})"
+        print(json.dumps(timings))
+        return
+    app = gui.StockAnalyzerPremium(root)
+    root.update()
+    timings['window'] = time.perf_counter() - start
+
+    # First chart: the deferred imports plus one full indicator + draw pass
+    app.ensure_services()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from synthetic import make_ohlcv
+    data = make_ohlcv(250)
+    data = app.calculate_indicators(data)
+    app.create_chart(data, 'SYN')
+    root.update()
+    timings['first_chart'] = time.perf_counter() - start
+
+    app.alert_monitor.stop()
+    root.destroy()
+    print(json.dumps(timings))
+
+
+def run_once():
+    # A scratch working directory keeps the run away from real watchlists and caches
+    with tempfile.TemporaryDirectory() as cwd:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child'],
+                             cwd=cwd, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI startup benchmark")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-window', type=float, help="fail if time-to-window exceeds this (s)")
+    parser.add_argument('--max-chart', type=float, help="fail if time-to-first-chart exceeds this (s)")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    runs = [run_once() for _ in range(args.runs)]
+    for run in runs:
+        if 'error' in run:
+            print(f"⚠️  {run['error']} - only the import time was measured")
+            break
+
+    print(f"{'stage':<12} {'median (s)':>11} {'min (s)':>9}")
+    medians = {}
+    for stage in STAGES:
+        values = [run[stage] for run in runs if stage in run]
+        if values:
+            medians[stage] = statistics.median(values)
+            print(f"{stage:<12} {medians[stage]:>11.3f} {min(values):>9.3f}")
+
+    failed = False
+    for stage, budget in (('window', args.max_window), ('first_chart', args.max_chart)):
+        if budget is not None and stage in medians and medians[stage] > budget:
+            print(f"❌ {stage} took {medians[stage]:.3f}s (budget {budget:.3f}s)")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Hot-path benchmark suite
+Times indicator calculation, RSI, candlestick rendering, the full chart
+view and the composite scoring at 1k, 10k and 100k synthetic bars, headless
+and offline. Results are written to benchmarks/results/latest.json and
+compared against a stored baseline.
+
+Run:           python benchmarks/bench_suite.py
+New baseline:  python benchmarks/bench_suite.py --save-baseline
+CI check:      python benchmarks/bench_suite.py --fail --threshold 1.5
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+from chart_render import plot_candlesticks
+from chart_view import ChartView
+from indicator_engine import calculate_indicators
+from signals import recommendation, score_series
+from stock_analyzer import calculate_rsi
+from synthetic import make_ohlcv
+
+SIZES = [1000, 10000, 100000]
+BASELINE = os.path.join(HERE, 'baseline.json')
+OUTPUT = os.path.join(HERE, 'results', 'latest.json')
+
+COLORS = {
+    'bg': '#0d1117', 'card': '#161b22', 'sidebar': '#1c2128', 'accent': '#58a6ff',
+    'success': '#3fb950', 'danger': '#f85149', 'warning': '#d29922',
+    'text': '#c9d1d9', 'text_dim': '#8b949e', 'border': '#30363d', 'hover': '#21262d',
+}
+
+# Repeat each case until this much time is spent (at least once, at most MAX_REPEATS)
+TIME_BUDGET = 1.0
+MAX_REPEATS = 7
+
+
+# Cases - each takes the bars and indicator frame and returns the call to time
+
+def case_indicators(bars, indicators):
+    return lambda: calculate_indicators(bars.copy())
+
+
+def case_rsi(bars, indicators):
+    close = bars['Close']
+    return lambda: calculate_rsi(close)
+
+
+def case_candlesticks(bars, indicators):
+    def run():
+        fig = Figure(figsize=(15, 10))
+        FigureCanvasAgg(fig)
+        plot_candlesticks(fig.add_subplot(), bars, COLORS['success'], COLORS['danger'])
+        fig.canvas.draw()
+    return run
+
+
+def case_chart(bars, indicators):
+    def run():
+        view = ChartView(None, COLORS)
+        view.show(indicators, 'SYN')
+        view.canvas.draw()
+    return run
+
+
+def case_scoring(bars, indicators):
+    def run():
+        score = score_series(indicators)
+        return recommendation(int(score.iloc[-1]))
+    return run
+
+
+CASES = {
+    'calculate_indicators': case_indicators,
+    'calculate_rsi': case_rsi,
+    'plot_candlesticks': case_candlesticks,
+    'create_chart': case_chart,
+    'scoring': case_scoring,
+}
+
+
+def time_call(call):
+    """Best wall time over repeated calls"""
+    best = float('inf')
+    spent = 0.0
+    for _ in range(MAX_REPEATS):
+        start = time.perf_counter()
+        call()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= TIME_BUDGET:
+            break
+    return best
+
+
+def run_suite(sizes, cases):
+    results = {name: {} for name in cases}
+    for n in sizes:
+        bars = make_ohlcv(n)
+        indicators = calculate_indicators(bars.copy())
+        for name in cases:
+            results[name][str(n)] = time_call(CASES[name](bars, indicators))
+    return {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'matplotlib': matplotlib.__version__,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print timings next to the baseline; returns the regressed cases"""
+    regressions = []
+    print(f"{'case':<22} {'bars':>7} {'time (ms)':>10} {'baseline':>10} {'ratio':>7}")
+    print("-" * 60)
+    for name, timings in current['results'].items():
+        for size, seconds in timings.items():
+            base = baseline.get('results', {}).get(name, {}).get(size) if baseline else None
+            if base:
+                ratio = seconds / base
+                flag = "  ❌ slower" if ratio > threshold else ""
+                if ratio > threshold:
+                    regressions.append((name, size, ratio))
+                print(f"{name:<22} {size:>7} {seconds * 1000:>10.2f} {base * 1000:>10.2f} "
+                      f"{ratio:>6.2f}x{flag}")
+            else:
+                print(f"{name:<22} {size:>7} {seconds * 1000:>10.2f} {'-':>10} {'-':>7}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path benchmark suite")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--output', default=OUTPUT)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument('--fail', action='store_true', help="exit non-zero on regressions")
+    args = parser.parse_args()
+
+    current = run_suite(args.sizes, args.cases)
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline} - run with --save-baseline to create one")
+    elif regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold:.2f}x baseline")
+    else:
+        print("\nNo regressions")
+
+    if args.fail and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Synthetic OHLCV data for benchmarks
+Deterministic random-walk bars on business days, with overnight gaps and
+volume spikes, so every run times exactly the same input without a network
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_ohlcv(n, seed=0, gap_rate=0.02, spike_rate=0.03):
+    """Random-walk OHLCV bars on business days.
+
+    A `gap_rate` share of sessions open well away from the previous close,
+    and a `spike_rate` share trade 3-10x the usual volume.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.roll(close, 1) * (1 + rng.normal(0, 0.003, n))
+    open_[0] = close[0]
+
+    # Overnight gaps move the open by 2-6% either way
+    gaps = rng.random(n) < gap_rate
+    open_[gaps] *= 1 + rng.choice([-1, 1], gaps.sum()) * rng.uniform(0.02, 0.06, gaps.sum())
+
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    volume = rng.lognormal(14, 0.4, n)
+    spikes = rng.random(n) < spike_rate
+    volume[spikes] *= rng.uniform(3, 10, spikes.sum())
+
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + spread,
+        'Low': np.minimum(open_, close) - spread,
+        'Close': close,
+        'Volume': volume.round().astype(np.int64),
+    }, index=pd.bdate_range('1990-01-01', periods=n, name='Date'))
@@ -0,0 +1,158 @@
+"""
+Chart rendering helpers
+Candlesticks and coloured bars are drawn as a handful of collections built
+from vectorized arrays instead of one artist per bar
+"""
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+
+
+def date_numbers(index):
+    """Matplotlib date numbers for a DatetimeIndex"""
+    return np.asarray(mdates.date2num(index), dtype=float)
+
+
+def bar_spacing(x):
+    """Typical distance between bars, so widths work for any interval"""
+    if len(x) < 2:
+        return 1.0
+    return float(np.median(np.diff(x)))
+
+
+def color_array(mask, up_color, down_color, alpha=1.0):
+    """RGBA rows picked by a boolean mask"""
+    up = to_rgba(up_color, alpha)
+    down = to_rgba(down_color, alpha)
+    return np.where(mask[:, None], up, down)
+
+
+def rectangle_verts(x, bottom, top, width):
+    """Vertices of axis-aligned rectangles, shape (n, 4, 2)"""
+    left = x - width / 2
+    right = x + width / 2
+    verts = np.empty((len(x), 4, 2))
+    verts[:, 0, 0] = left
+    verts[:, 1, 0] = left
+    verts[:, 2, 0] = right
+    verts[:, 3, 0] = right
+    verts[:, 0, 1] = bottom
+    verts[:, 1, 1] = top
+    verts[:, 2, 1] = top
+    verts[:, 3, 1] = bottom
+    return verts
+
+
+def candlestick_geometry(x, open_, high, low, close, width):
+    """Wick segments and body rectangles for a set of bars"""
+    segments = np.empty((len(x), 2, 2))
+    segments[:, 0, 0] = x
+    segments[:, 1, 0] = x
+    segments[:, 0, 1] = low
+    segments[:, 1, 1] = high
+
+    bottom = np.minimum(open_, close)
+    height = np.maximum(np.abs(close - open_), 0.001)
+    return segments, rectangle_verts(x, bottom, bottom + height, width)
+
+
+def plot_candlesticks(ax, data, up_color, down_color, width=0.6, x=None):
+    """Plot candlesticks as one wick collection and one body collection"""
+    if x is None:
+        x = date_numbers(data.index)
+    open_ = data['Open'].to_numpy(dtype=float)
+    close = data['Close'].to_numpy(dtype=float)
+    high = data['High'].to_numpy(dtype=float)
+    low = data['Low'].to_numpy(dtype=float)
+
+    segments, verts = candlestick_geometry(x, open_, high, low, close,
+                                           width * bar_spacing(x))
+    up = close >= open_
+
+    wicks = LineCollection(segments, colors=color_array(up, up_color, down_color, 0.8),
+                           linewidths=1, zorder=3)
+    body_colors = color_array(up, up_color, down_color, 0.9)
+    bodies = PolyCollection(verts, facecolors=body_colors, edgecolors=body_colors,
+                            zorder=3)
+    ax.add_collection(wicks)
+    ax.add_collection(bodies)
+    ax.autoscale_view()
+    return wicks, bodies
+
+
+def plot_colored_bars(ax, x, heights, up_mask, up_color, down_color,
+                      width=0.8, alpha=0.6):
+    """Plot bars from zero as a single collection coloured by a mask"""
+    heights = np.asarray(heights, dtype=float)
+    verts = rectangle_verts(x, np.zeros_like(heights), heights, width * bar_spacing(x))
+    bars = PolyCollection(verts, facecolors=color_array(up_mask, up_color, down_color, alpha),
+                          linewidths=0)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+# Level of detail
+
+def bucket_starts(n, buckets):
+    """Start index of each of `buckets` near-equal runs covering n points"""
+    return np.unique(np.linspace(0, n, buckets + 1).astype(np.int64)[:-1])
+
+
+def _bucket_extremes(y, starts):
+    """Indices of the first minimum and first maximum in every bucket"""
+    sizes = np.diff(np.append(starts, len(y)))
+    ids = np.repeat(np.arange(len(starts)), sizes)
+    picks = []
+    for reduce in (np.fmin, np.fmax):
+        # fmin/fmax skip NaN, so only all-NaN buckets come back empty
+        extreme = reduce.reduceat(y, starts)
+        hits = np.flatnonzero(y == extreme[ids])
+        _, first = np.unique(ids[hits], return_index=True)
+        picks.append(hits[first])
+    return np.union1d(*picks)
+
+
+def minmax_downsample(x, y, buckets):
+    """Keep each bucket's min and max point, in order, so no peak is lost"""
+    y = np.asarray(y, dtype=float)
+    if len(y) <= 2 * buckets:
+        return x, y
+    keep = _bucket_extremes(y, bucket_starts(len(y), buckets))
+    return x[keep], y[keep]
+
+
+def ohlc_downsample(x, open_, high, low, close, volume, buckets):
+    """Merge runs of bars into OHLC buckets centred on their time span.
+
+    Volume keeps each bucket's peak, so spikes stay the height they were.
+    """
+    starts = bucket_starts(len(x), buckets)
+    ends = np.append(starts[1:], len(x)) - 1
+    return (
+        (x[starts] + x[ends]) / 2,
+        open_[starts],
+        np.fmax.reduceat(high, starts),
+        np.fmin.reduceat(low, starts),
+        close[ends],
+        np.fmax.reduceat(volume, starts),
+    )
+
+
+def envelope_downsample(x, upper, lower, buckets):
+    """Widest upper/lower band per bucket, for filled bands"""
+    starts = bucket_starts(len(x), buckets)
+    ends = np.append(starts[1:], len(x)) - 1
+    return ((x[starts] + x[ends]) / 2, np.fmax.reduceat(upper, starts),
+            np.fmin.reduceat(lower, starts))
+
+
+def signed_peak_downsample(x, values, buckets):
+    """Largest-magnitude value per bucket, for bars drawn from zero"""
+    starts = bucket_starts(len(x), buckets)
+    ends = np.append(starts[1:], len(x)) - 1
+    hi = np.fmax.reduceat(values, starts)
+    lo = np.fmin.reduceat(values, starts)
+    return (x[starts] + x[ends]) / 2, np.where(np.abs(hi) >= np.abs(lo), hi, lo)
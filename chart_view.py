@@ -0,0 +1,630 @@
+"""
+Persistent chart view
+Keeps one figure, canvas and toolbar alive and updates artist data,
+visibility and axis limits in place. The toggleable overlays (MAs,
+Bollinger Bands, legend) are animated artists blitted over a cached
+background, so switching them on or off never redraws the whole figure.
+Long histories are decimated to the canvas width for the visible x-range
+and re-decimated whenever the toolbar pans or zooms. A crosshair with a
+tooltip for the bar under the cursor is blitted the same way, and so are
+the bars themselves in live mode, where the last bar changes many times a
+second.
+"""
+
+import tkinter as tk
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.gridspec import GridSpec
+from matplotlib.legend import Legend
+from matplotlib.ticker import FuncFormatter
+
+from chart_render import (bar_spacing, candlestick_geometry, color_array, date_numbers,
+                          envelope_downsample, minmax_downsample, ohlc_downsample,
+                          rectangle_verts, signed_peak_downsample)
+
+# Fixed margins instead of tight_layout, so layout changes cost nothing
+LAYOUT = dict(left=0.06, right=0.98, top=0.95, bottom=0.07, hspace=0.05)
+
+# Narrowest candle (in pixels) before bars are merged into OHLC buckets
+CANDLE_PIXELS = 3
+
+# Crosshair repaints per second at most; motion in between is coalesced
+CROSSHAIR_FPS = 60
+
+
+def _padded(*series, pad=0.05):
+    """Axis limits spanning every finite value of the given series"""
+    values = np.concatenate([np.ravel(s) for s in series])
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return 0, 1
+    lo, hi = values.min(), values.max()
+    if lo == hi:
+        lo, hi = lo - 1, hi + 1
+    span = hi - lo
+    return lo - span * pad, hi + span * pad
+
+
+def _floats(series):
+    """A column's values as a float array; float columns (float32 ones from
+    the bar store included) are used as they are, without a copy"""
+    values = series.to_numpy()
+    return values if values.dtype.kind == 'f' else values.astype(float)
+
+
+def _band_verts(x, upper, lower):
+    """Closed polygon between two series, skipping the NaN warm-up"""
+    valid = np.isfinite(upper) & np.isfinite(lower)
+    if not valid.any():
+        return []
+    xv = x[valid]
+    poly = np.concatenate([
+        np.column_stack([xv, upper[valid]]),
+        np.column_stack([xv[::-1], lower[valid][::-1]]),
+    ])
+    return [poly]
+
+
+class ChartView:
+    """Price, volume and MACD panels drawn into one long-lived Tk canvas.
+
+    With parent=None the view renders off-screen on an Agg canvas without a
+    toolbar (for exports and benchmarks), and only draws when asked to -
+    by canvas.draw() or savefig().
+    """
+
+    # Series drawn, by name, and the frame column each comes from
+    COLUMNS = {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close',
+               'ma20': 'MA_20', 'ma50': 'MA_50', 'ma200': 'MA_200', 'rsi': 'RSI',
+               'bb_upper': 'BB_Upper', 'bb_lower': 'BB_Lower', 'volume': 'Volume',
+               'volume_ma': 'Volume_MA', 'macd': 'MACD', 'signal': 'MACD_Signal',
+               'hist': 'MACD_Hist'}
+
+    def __init__(self, parent, colors):
+        self.colors = colors
+        self.data = None
+        self.x = None
+        self.series = {}
+        self._lod_key = None
+        self.settings = {}
+        self._background = None
+        self._overlay_background = None
+        self._draw_pending = False
+        self._exporting = False
+
+        self.fig = Figure(figsize=(15, 10), facecolor=colors['card'])
+        self.interactive = parent is not None
+        if parent is None:
+            self.canvas = FigureCanvasAgg(self.fig)
+            self.toolbar = None
+            self._crosshair_timer = None
+        else:
+            self.canvas = FigureCanvasTkAgg(self.fig, parent)
+
+            # Toolbar
+            self.toolbar = NavigationToolbar2Tk(self.canvas, parent)
+            self.toolbar.update()
+            self.toolbar.config(bg=colors['sidebar'])
+            for child in self.toolbar.winfo_children():
+                if isinstance(child, tk.Button):
+                    child.config(bg=colors['sidebar'], fg=colors['text'])
+
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+            self._crosshair_timer = self.canvas.new_timer(interval=1000 // CROSSHAIR_FPS)
+            self._crosshair_timer.single_shot = True
+            self._crosshair_timer.add_callback(self._paint_crosshair)
+
+        self._build_axes()
+        self._build_artists()
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', lambda event: self._update_lod())
+        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+        self.canvas.mpl_connect('figure_leave_event', lambda event: self._hide_crosshair())
+        self.ax_price.callbacks.connect('xlim_changed', lambda ax: self._update_lod())
+
+    # Setup
+
+    def _build_axes(self):
+        self.grid_full = GridSpec(3, 1, figure=self.fig, height_ratios=[3, 1, 1], **LAYOUT)
+        self.grid_short = GridSpec(2, 1, figure=self.fig, height_ratios=[3, 1], **LAYOUT)
+
+        self.ax_price = self.fig.add_subplot(self.grid_full[0])
+        self.ax_volume = self.fig.add_subplot(self.grid_full[1], sharex=self.ax_price)
+        self.ax_macd = self.fig.add_subplot(self.grid_full[2], sharex=self.ax_price)
+        self.axes = [self.ax_price, self.ax_volume, self.ax_macd]
+
+        for ax in self.axes:
+            ax.set_facecolor(self.colors['card'])
+            for spine in ax.spines.values():
+                spine.set_color(self.colors['border'])
+            ax.tick_params(colors=self.colors['text_dim'], labelsize=9)
+            ax.grid(True, alpha=0.2, color=self.colors['border'], linestyle='-')
+
+        # Shared x axis uses plain date numbers
+        locator = mdates.AutoDateLocator()
+        self.ax_price.xaxis.set_major_locator(locator)
+        self.ax_price.xaxis.set_major_formatter(mdates.AutoDateFormatter(locator))
+
+        label = dict(color=self.colors['text'], fontweight='bold')
+        self.ax_price.set_ylabel('Price ($)', fontsize=11, **label)
+        self.ax_volume.set_ylabel('Volume', fontsize=10, **label)
+        self.ax_macd.set_ylabel('MACD', fontsize=10, **label)
+        self.ax_volume.yaxis.set_major_formatter(FuncFormatter(
+            lambda x, p: f'{x/1e6:.1f}M' if x >= 1e6 else f'{x/1e3:.0f}K'))
+
+    def _build_artists(self):
+        c = self.colors
+        ax1, ax2, ax3 = self.axes
+
+        # Price layer
+        self.wicks = ax1.add_collection(LineCollection([], linewidths=1, zorder=3))
+        self.bodies = ax1.add_collection(PolyCollection([], zorder=3))
+        self.close_line, = ax1.plot([], [], linewidth=2.5, color=c['accent'],
+                                    label='Close', zorder=5)
+
+        # Overlays - animated so they can be blitted over the cached background
+        self.ma20_line, = ax1.plot([], [], linewidth=2, label='MA 20',
+                                   color=c['success'], alpha=0.8, zorder=4)
+        self.ma50_line, = ax1.plot([], [], linewidth=2, label='MA 50',
+                                   color=c['warning'], alpha=0.8, zorder=4)
+        self.bb_fill = ax1.add_collection(PolyCollection([], facecolors=c['accent'],
+                                                         alpha=0.1, zorder=1))
+        self.bb_upper, = ax1.plot([], [], linewidth=1, color=c['accent'],
+                                  alpha=0.3, linestyle='--', zorder=2)
+        self.bb_lower, = ax1.plot([], [], linewidth=1, color=c['accent'],
+                                  alpha=0.3, linestyle='--', zorder=2)
+        self.overlays = {
+            'ma20': [self.ma20_line],
+            'ma50': [self.ma50_line],
+            'bollinger': [self.bb_fill, self.bb_upper, self.bb_lower],
+        }
+        for artists in self.overlays.values():
+            for artist in artists:
+                artist.set_animated(True)
+        self.legend = None
+
+        # Volume
+        self.volume_bars = ax2.add_collection(PolyCollection([], linewidths=0))
+        self.volume_ma, = ax2.plot([], [], linewidth=2, color=c['warning'],
+                                   label='Volume MA', alpha=0.8)
+        self._style_legend(ax2.legend(loc='upper left'))
+
+        # MACD
+        self.macd_line, = ax3.plot([], [], linewidth=2, color=c['accent'], label='MACD')
+        self.signal_line, = ax3.plot([], [], linewidth=2, color=c['warning'], label='Signal')
+        self.hist_bars = ax3.add_collection(PolyCollection([], linewidths=0))
+        ax3.axhline(0, color=c['border'], linewidth=1)
+        self._style_legend(ax3.legend(loc='upper left'))
+
+        # Crosshair and tooltip, blitted on mouse motion
+        cross = dict(color=c['text_dim'], linewidth=0.8, linestyle='--',
+                     animated=True, visible=False)
+        self.cross_v = [ax.axvline(0, **cross) for ax in self.axes]
+        self.cross_h = ax1.axhline(0, **cross)
+        self.tooltip = ax1.text(0.99, 0.97, '', transform=ax1.transAxes, ha='right', va='top',
+                                fontsize=9, family='monospace', color=c['text'], zorder=10,
+                                animated=True, visible=False,
+                                bbox=dict(boxstyle='square,pad=0.5', facecolor=c['card'],
+                                          edgecolor=c['border']))
+        self.crosshair = [*self.cross_v, self.cross_h, self.tooltip]
+
+        # Bars, indicator lines and the legends over them, blitted in live mode
+        self.series_artists = [self.wicks, self.bodies, self.close_line, self.volume_bars,
+                               self.volume_ma, ax2.get_legend(), self.macd_line,
+                               self.signal_line, self.hist_bars, ax3.get_legend()]
+        self.live = False
+        self._cursor = None
+        self._tooltip_image = None
+        self._legend_images = {}
+        self._motion = None
+
+    def _style_legend(self, legend):
+        legend.get_frame().set_facecolor(self.colors['card'])
+        legend.get_frame().set_edgecolor(self.colors['border'])
+        legend.get_frame().set_alpha(0.9)
+        for text in legend.get_texts():
+            text.set_fontsize(9)
+        return legend
+
+    # Public API
+
+    def show(self, data, ticker, chart_type="candlestick", show_ma20=True,
+             show_ma50=True, show_bollinger=True, show_macd=True):
+        """Load a new data set into the existing artists and redraw"""
+        self.data = None
+        self.x = x = date_numbers(data.index)
+        spacing = bar_spacing(x)
+        self.series = {name: _floats(data[column]) for name, column in self.COLUMNS.items()}
+        s = self.series
+        c = self.colors
+        low, high, close = s['low'], s['high'], s['close']
+        macd, signal, hist = s['macd'], s['signal'], s['hist']
+        volume = s['volume']
+
+        # Limits cover every overlay, so toggling one never needs a rescale
+        self.ax_price.set_xlim(x[0] - spacing, x[-1] + spacing)
+        self.ax_price.set_ylim(*_padded(low, high, close, s['ma20'], s['ma50'],
+                                        s['bb_upper'], s['bb_lower']))
+        self.ax_volume.set_ylim(0, max(np.nanmax(volume), 1) * 1.05)
+        self.ax_macd.set_ylim(*_padded(macd, signal, hist))
+
+        self.ax_price.set_title(f'{ticker} Technical Analysis', color=c['text'],
+                                fontsize=13, fontweight='bold', pad=15)
+
+        # Artist data follows the x-range, so fill it once the range is set
+        self.data = data
+        self.score = data['Score'].to_numpy() if 'Score' in data else None
+        self._lod_key = None
+        self._hide_crosshair(blit=False)
+        self._update_lod()
+
+        # New data invalidates the toolbar's zoom/pan history
+        if self.toolbar is not None:
+            self.toolbar.update()
+
+        self.settings = {}
+        self.apply_settings(chart_type, show_ma20, show_ma50, show_bollinger, show_macd,
+                            force_draw=True)
+
+    def apply_settings(self, chart_type, show_ma20, show_ma50, show_bollinger, show_macd,
+                       force_draw=False):
+        """Apply chart type and indicator toggles with the cheapest redraw"""
+        settings = {
+            'chart_type': chart_type,
+            'ma20': show_ma20,
+            'ma50': show_ma50,
+            'bollinger': show_bollinger,
+            'macd': show_macd,
+        }
+        previous = self.settings
+        self.settings = settings
+        if self.data is None:
+            return
+
+        for name in ('ma20', 'ma50', 'bollinger'):
+            for artist in self.overlays[name]:
+                artist.set_visible(settings[name])
+        self._rebuild_legend()
+
+        layout_changed = (previous.get('chart_type') != chart_type or
+                          previous.get('macd') != show_macd)
+        if force_draw or layout_changed or self._draw_pending or self._background is None:
+            candle = chart_type == "candlestick"
+            self.wicks.set_visible(candle)
+            self.bodies.set_visible(candle)
+            self.close_line.set_visible(not candle)
+            self._set_layout(show_macd)
+            self._draw_pending = True
+            if self.interactive:
+                self.canvas.draw_idle()
+        else:
+            self._blit_overlays()
+
+    def set_live(self, live):
+        """Switch live mode, where the bars are blitted like the overlays, so a
+        revised last bar repaints without redrawing the axes, ticks and labels"""
+        self.live = live
+        for artist in self.series_artists:
+            artist.set_animated(live)
+        self._draw_pending = True
+        if self.interactive:
+            self.canvas.draw_idle()
+
+    def update_live(self, data):
+        """Take in a frame whose last bar changed or grew, keeping zoom and pan.
+
+        Only the tail of each series is copied. Axis limits grow to fit new
+        values, and a view that shows the latest bar scrolls with new bars.
+        In live mode, an update that leaves the limits alone is only blitted.
+        """
+        if self.data is None:
+            return
+        old = len(self.x)
+        start = old - 1
+        tail = data.iloc[start:]
+        x = self.x
+        if len(data) > old:
+            x = np.concatenate([x, date_numbers(data.index[old:])])
+        for name, column in self.COLUMNS.items():
+            values = tail[column].to_numpy(dtype=float)
+            series = self.series[name]
+            # Arrays taken from a frame are read-only views; the first update copies
+            if len(data) > old or not series.flags.writeable:
+                self.series[name] = np.concatenate([series[:start], values])
+            else:
+                series[start:] = values
+        if self.score is not None:
+            self.score = data['Score'].to_numpy()
+        self.data = data
+
+        s = {name: values[start:] for name, values in self.series.items()}
+        rescaled = False
+        for ax, limits in ((self.ax_price, _padded(s['low'], s['high'])),
+                           (self.ax_volume, (0, np.nanmax(s['volume']) * 1.05)),
+                           (self.ax_macd, _padded(s['macd'], s['signal'], s['hist']))):
+            bottom, top = ax.get_ylim()
+            if limits[0] < bottom or limits[1] > top:
+                ax.set_ylim(min(bottom, limits[0]), max(top, limits[1]))
+                rescaled = True
+
+        # Follow new bars while the latest one is in view
+        lo, hi = self.ax_price.get_xlim()
+        shift = x[-1] - self.x[-1] if hi >= self.x[-1] else 0
+        self.x = x
+        self._lod_key = None
+        if shift:
+            self.ax_price.set_xlim(lo + shift, hi + shift)
+        else:
+            self._update_lod()
+
+        if self.live and not (shift or rescaled or self._draw_pending) \
+                and self._background is not None:
+            self._blit_overlays()
+            return
+        self._draw_pending = True
+        if self.interactive:
+            self.canvas.draw_idle()
+
+    def savefig(self, filename, **kwargs):
+        """Save the chart, including the animated overlays"""
+        animated = [a for a in self._overlay_artists() if a.get_animated()]
+        self._exporting = True
+        try:
+            for artist in animated:
+                artist.set_animated(False)
+            self.fig.savefig(filename, **kwargs)
+        finally:
+            for artist in animated:
+                artist.set_animated(True)
+            self._exporting = False
+            if self.interactive:
+                self.canvas.draw_idle()
+
+    # Internals
+
+    def _update_lod(self):
+        """Fill the artists with the bars in view, decimated to the canvas width"""
+        if self.data is None:
+            return
+        x = self.x
+        lo, hi = self.ax_price.get_xlim()
+        # One bar of margin each side keeps lines running off the edges
+        i0 = max(int(np.searchsorted(x, lo)) - 1, 0)
+        i1 = min(int(np.searchsorted(x, hi, side='right')) + 1, len(x))
+        if i1 <= i0:
+            return
+        pixels = max(int(self.ax_price.bbox.width), 100)
+        key = (i0, i1, pixels)
+        if key == self._lod_key:
+            return
+        self._lod_key = key
+
+        s = {name: values[i0:i1] for name, values in self.series.items()}
+        xv = x[i0:i1]
+        c = self.colors
+
+        # Candles and volume: whole bars below the pixel limit, OHLC buckets above
+        candles = pixels // CANDLE_PIXELS
+        if len(xv) > candles:
+            xb, open_, high, low, close, volume = ohlc_downsample(
+                xv, s['open'], s['high'], s['low'], s['close'], s['volume'], candles)
+        else:
+            xb, open_, high, low, close, volume = (xv, s['open'], s['high'], s['low'],
+                                                  s['close'], s['volume'])
+        spacing = bar_spacing(xb)
+        up = close >= open_
+        segments, verts = candlestick_geometry(xb, open_, high, low, close, 0.6 * spacing)
+        self.wicks.set_segments(segments)
+        self.wicks.set_color(color_array(up, c['success'], c['danger'], 0.8))
+        body_colors = color_array(up, c['success'], c['danger'], 0.9)
+        self.bodies.set_verts(verts)
+        self.bodies.set_facecolor(body_colors)
+        self.bodies.set_edgecolor(body_colors)
+        self.volume_bars.set_verts(rectangle_verts(xb, np.zeros_like(volume), volume,
+                                                   0.8 * spacing))
+        self.volume_bars.set_facecolor(color_array(up, c['success'], c['danger'], 0.6))
+
+        # Lines keep every bucket's min and max, so no extreme disappears
+        for line, name in ((self.close_line, 'close'), (self.ma20_line, 'ma20'),
+                           (self.ma50_line, 'ma50'), (self.bb_upper, 'bb_upper'),
+                           (self.bb_lower, 'bb_lower'), (self.volume_ma, 'volume_ma'),
+                           (self.macd_line, 'macd'), (self.signal_line, 'signal')):
+            line.set_data(*minmax_downsample(xv, s[name], pixels))
+
+        if len(xv) > pixels:
+            xf, upper, lower = envelope_downsample(xv, s['bb_upper'], s['bb_lower'], pixels)
+            xh, hist = signed_peak_downsample(xv, s['hist'], candles)
+        else:
+            xf, upper, lower = xv, s['bb_upper'], s['bb_lower']
+            xh, hist = xv, s['hist']
+        self.bb_fill.set_verts(_band_verts(xf, upper, lower))
+        self.hist_bars.set_verts(rectangle_verts(xh, np.zeros_like(hist), hist,
+                                                 0.8 * bar_spacing(xh)))
+        self.hist_bars.set_facecolor(color_array(hist >= 0, c['success'], c['danger'], 0.5))
+
+    def _overlay_artists(self):
+        artists = [a for group in self.overlays.values() for a in group]
+        if self.legend is not None:
+            artists.append(self.legend)
+        if self.live:
+            # Painted bottom to top, as a full draw would
+            artists = sorted(self.series_artists + artists, key=lambda a: a.get_zorder())
+        return artists
+
+    # Crosshair
+
+    def _bar_at(self, xdata):
+        """Index of the bar nearest to an x position (binary search)"""
+        x = self.x
+        i = int(np.searchsorted(x, xdata))
+        if i == len(x):
+            return i - 1
+        if i > 0 and xdata - x[i - 1] < x[i] - xdata:
+            return i - 1
+        return i
+
+    def _on_motion(self, event):
+        if self.data is None or self._overlay_background is None or self._draw_pending:
+            return
+        if event.inaxes not in self.axes or event.xdata is None:
+            self._hide_crosshair()
+            return
+
+        # Keep only the latest position; the timer paints it on the next frame
+        scheduled = self._motion is not None
+        self._motion = (event.inaxes, event.xdata, event.ydata, event.y)
+        if self._crosshair_timer is None:
+            self._paint_crosshair()
+        elif not scheduled:
+            self._crosshair_timer.start()
+
+    def _paint_crosshair(self):
+        motion, self._motion = self._motion, None
+        if motion is None or self.data is None or self._overlay_background is None \
+                or self._draw_pending:
+            return
+        ax, xdata, ydata, y = motion
+
+        i = self._bar_at(xdata)
+        on_price = ax is self.ax_price
+        cursor = (i, round(y) if on_price else None)
+        if cursor == self._cursor:
+            return
+        if self._cursor is None or cursor[0] != self._cursor[0]:
+            self._tooltip_image = None
+        self._cursor = cursor
+
+        for axis, line in zip(self.axes, self.cross_v):
+            line.set_xdata([self.x[i], self.x[i]])
+            line.set_visible(axis.get_visible())
+        self.cross_h.set_visible(on_price)
+        if on_price:
+            self.cross_h.set_ydata([ydata, ydata])
+        if self._tooltip_image is None:
+            self.tooltip.set_text(self._tooltip_text(i))
+        self.tooltip.set_visible(True)
+        self._blit_crosshair()
+
+    def _hide_crosshair(self, blit=True):
+        self._motion = None
+        if self._cursor is None:
+            return
+        self._cursor = None
+        for artist in self.crosshair:
+            artist.set_visible(False)
+        if blit and self._overlay_background is not None and not self._draw_pending:
+            self._blit_crosshair()
+
+    def _tooltip_text(self, i):
+        """OHLCV and every indicator for bar i"""
+        v = {name: values[i] for name, values in self.series.items()}
+        date = self.data.index[i]
+        date_format = '%Y-%m-%d %H:%M' if date.hour or date.minute else '%Y-%m-%d'
+
+        def num(value, spec='.2f'):
+            return format(value, spec) if np.isfinite(value) else '—'
+
+        def vol(value):
+            if not np.isfinite(value):
+                return '—'
+            return f'{value/1e6:.1f}M' if value >= 1e6 else f'{value/1e3:.0f}K'
+
+        lines = [
+            date.strftime(date_format),
+            f"O {num(v['open'])}  H {num(v['high'])}  L {num(v['low'])}  C {num(v['close'])}",
+            f"Vol {vol(v['volume'])}  MA {vol(v['volume_ma'])}",
+            f"MA20 {num(v['ma20'])}  MA50 {num(v['ma50'])}  MA200 {num(v['ma200'])}",
+            f"BB {num(v['bb_upper'])} / {num(v['bb_lower'])}",
+            f"RSI {num(v['rsi'], '.1f')}  MACD {num(v['macd'], '.3f')}  "
+            f"Sig {num(v['signal'], '.3f')}  Hist {num(v['hist'], '.3f')}",
+        ]
+        if self.score is not None:
+            lines.append(f"Score {self.score[i]:+d}")
+        return "\n".join(lines)
+
+    def _rebuild_legend(self):
+        if self.legend is not None:
+            self.legend.remove()
+        handles = [self.close_line] if self.settings['chart_type'] != "candlestick" else []
+        handles += [line for name, line in (('ma20', self.ma20_line), ('ma50', self.ma50_line))
+                    if self.settings[name]]
+        if handles:
+            self.legend = self._style_legend(self.ax_price.legend(handles=handles,
+                                                                  loc='upper left'))
+            self.legend.set_animated(True)
+        else:
+            self.legend = None
+
+    def _set_layout(self, show_macd):
+        grid = self.grid_full if show_macd else self.grid_short
+        self.ax_price.set_subplotspec(grid[0])
+        self.ax_volume.set_subplotspec(grid[1])
+        self.ax_macd.set_visible(show_macd)
+
+        bottom = self.ax_macd if show_macd else self.ax_volume
+        for ax in self.axes:
+            ax.tick_params(labelbottom=ax is bottom)
+            ax.set_xlabel('')
+        bottom.set_xlabel('Date', color=self.colors['text'], fontsize=10)
+
+    def _on_draw(self, event):
+        """Cache the static layers after every full draw, then paint overlays"""
+        if self._exporting:
+            return
+        self._draw_pending = False
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._tooltip_image = None
+        self._legend_images = {}
+        self._draw_overlays()
+
+    def _draw_overlays(self):
+        """Paint the indicator overlays, cache that layer, then the crosshair"""
+        for artist in self._overlay_artists():
+            if not (artist.get_visible() and artist.axes.get_visible()):
+                continue
+            if self.live and isinstance(artist, Legend):
+                # Legend text costs as much as the bars, so in live mode each
+                # legend is rendered once per full draw and pasted back after
+                image = self._legend_images.get(artist)
+                if image is None:
+                    self.fig.draw_artist(artist)
+                    self._legend_images[artist] = self.canvas.copy_from_bbox(
+                        artist.get_window_extent())
+                else:
+                    self.canvas.restore_region(image)
+            else:
+                self.fig.draw_artist(artist)
+        self._overlay_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_crosshair()
+
+    def _draw_crosshair(self):
+        for artist in self.crosshair[:-1]:
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+        if not self.tooltip.get_visible():
+            return
+        # Text is the slow part, so the opaque tooltip is rendered once per bar
+        # and pasted back while the cursor moves within that bar
+        if self._tooltip_image is None:
+            self.fig.draw_artist(self.tooltip)
+            extent = self.tooltip.get_bbox_patch().get_window_extent().expanded(1.02, 1.05)
+            self._tooltip_image = self.canvas.copy_from_bbox(extent)
+        else:
+            self.canvas.restore_region(self._tooltip_image)
+
+    def _blit_overlays(self):
+        self.canvas.restore_region(self._background)
+        self._draw_overlays()
+        self.canvas.blit(self.fig.bbox)
+
+    def _blit_crosshair(self):
+        # Mouse motion only repaints the crosshair over the cached overlay layer
+        self.canvas.restore_region(self._overlay_background)
+        self._draw_crosshair()
+        self.canvas.blit(self.fig.bbox)
@@ -0,0 +1,105 @@
+"""
+Multi-ticker comparison engine
+Aligns many tickers into one dates x tickers panel and computes returns and
+indicators across the ticker axis with whole-panel array operations
+"""
+
+import numpy as np
+import pandas as pd
+
+from signals import recommendation, score_arrays
+
+TRADING_DAYS = 252
+
+
+def _daily_index(index):
+    """Drop timezones and intraday times so exchanges line up by date"""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def build_panel(frames, column='Close'):
+    """Dates x tickers frame of one column, aligned on the union of dates"""
+    series = {}
+    for ticker, data in frames.items():
+        s = data[column].copy()
+        s.index = _daily_index(s.index)
+        series[ticker] = s[~s.index.duplicated(keep='last')]
+    panel = pd.concat(series, axis=1).sort_index()
+    listed = panel.ffill()
+    if column == 'Volume':
+        # Nothing traded on another exchange's holiday; pre-listing stays NaN
+        return panel.fillna(0.0).where(listed.notna())
+    # Carry prices over other exchanges' holidays; pre-listing stays NaN
+    return listed
+
+
+def normalized_returns(closes):
+    """Percent return of every ticker since its first available close"""
+    first = closes.bfill().iloc[0]
+    return (closes / first - 1) * 100
+
+
+def panel_indicators(closes, volumes):
+    """The calculate_indicators set computed for every ticker at once"""
+    ma20 = closes.rolling(window=20).mean()
+    std = closes.rolling(window=20).std()
+
+    delta = closes.diff()
+    gain = delta.clip(lower=0).rolling(window=14).mean()
+    loss = (-delta).clip(lower=0).rolling(window=14).mean()
+
+    ema_12 = closes.ewm(span=12, adjust=False).mean()
+    ema_26 = closes.ewm(span=26, adjust=False).mean()
+    macd = ema_12 - ema_26
+    macd_signal = macd.ewm(span=9, adjust=False).mean()
+
+    return {
+        'MA_20': ma20,
+        'MA_50': closes.rolling(window=50).mean(),
+        'RSI': 100 - (100 / (1 + gain / loss)),
+        'MACD': macd,
+        'MACD_Signal': macd_signal,
+        'BB_Upper': ma20 + std * 2,
+        'BB_Lower': ma20 - std * 2,
+        'Volume_MA': volumes.rolling(window=20).mean(),
+    }
+
+
+def summary_table(closes, volumes, indicators):
+    """Side-by-side latest indicators and performance stats per ticker"""
+    returns = closes.pct_change()
+    drawdown = closes / closes.cummax() - 1
+    last = {name: frame.iloc[-1] for name, frame in indicators.items()}
+    close = closes.iloc[-1]
+
+    score = score_arrays(close, last['MA_20'], last['MA_50'], last['RSI'],
+                         last['MACD'], last['MACD_Signal'],
+                         volumes.iloc[-1], last['Volume_MA'])
+
+    table = pd.DataFrame({
+        'Price': close,
+        'Return %': normalized_returns(closes).iloc[-1],
+        'Volatility %': returns.std() * np.sqrt(TRADING_DAYS) * 100,
+        'Max DD %': drawdown.min() * 100,
+        'RSI': last['RSI'],
+        'MACD': np.where(last['MACD'] > last['MACD_Signal'], "Bullish", "Bearish"),
+        'Trend': np.where(last['MA_20'] > last['MA_50'], "Up", "Down"),
+        'Score': score,
+    }, index=closes.columns)
+    table['Signal'] = [recommendation(s) for s in score]
+    return table.sort_values('Return %', ascending=False)
+
+
+def compare(frames):
+    """Build the panel, returns, indicators and summary for a set of frames"""
+    closes = build_panel(frames, 'Close')
+    volumes = build_panel(frames, 'Volume')
+    indicators = panel_indicators(closes, volumes)
+    return {
+        'closes': closes,
+        'returns': normalized_returns(closes),
+        'indicators': indicators,
+        'summary': summary_table(closes, volumes, indicators),
+    }
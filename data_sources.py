@@ -0,0 +1,369 @@
+"""
+Data sources for Stock Analyzer
+Providers return OHLCV DataFrames indexed by timestamp, the same shape as
+yf.Ticker(...).history(). Besides Yahoo Finance, bars can come from local
+CSV, Parquet or NumPy files for offline use and reproducible runs.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Company fields shown in the info panel
+FUNDAMENTAL_FIELDS = ['longName', 'marketCap', 'sector', 'trailingPE']
+
+# Approximate calendar length of each history period
+PERIOD_DAYS = {'1d': 1, '5d': 5, '1mo': 31, '3mo': 92, '6mo': 183, 'ytd': 366,
+               '1y': 366, '2y': 731, '5y': 1827, 'max': float('inf')}
+
+# Yahoo only serves intraday bars this many days back
+INTRADAY_LIMITS = {'1m': 7, '5m': 60, '1h': 730}
+
+# Environment variable naming a directory of local bar files to use instead of Yahoo
+DATA_DIR_ENV = "STOCK_ANALYZER_DATA"
+
+# Columns local providers return, in order
+OHLCV = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Rows parsed per chunk when converting CSV/Parquet files
+CHUNK_ROWS = 200_000
+
+# Record layout of converted local files: int64 nanosecond timestamps and OHLCV
+TABLE_DTYPE = np.dtype([('timestamp', '<i8')] + [(name, '<f8') for name in OHLCV])
+
+# Column names recognised as the bar timestamp, lower-cased
+DATE_COLUMNS = ['date', 'datetime', 'timestamp', 'time', '__index_level_0__']
+
+
+def period_start(period, end):
+    """Return the calendar start of a history period ending at `end`.
+
+    Returns None for "max" and for day-count periods ("1d", "5d"), which
+    Yahoo counts in bars rather than calendar days.
+    """
+    if period == "max" or period.endswith("d"):
+        return None
+    if period == "ytd":
+        return end.normalize().replace(month=1, day=1)
+    if period.endswith("mo"):
+        return end - pd.DateOffset(months=int(period[:-2]))
+    if period.endswith("y"):
+        return end - pd.DateOffset(years=int(period[:-1]))
+    raise ValueError(f"Unsupported period: {period}")
+
+
+def clamp_period(period, interval):
+    """The longest period up to `period` that the provider serves at `interval`"""
+    limit = INTRADAY_LIMITS.get(interval)
+    if limit is None or PERIOD_DAYS.get(period, 0) <= limit:
+        return period
+    allowed = [p for p, days in PERIOD_DAYS.items() if days <= limit]
+    return max(allowed, key=PERIOD_DAYS.get)
+
+
+def session_count(data):
+    """Number of distinct trading dates in a bar frame"""
+    return len(data.index.normalize().unique())
+
+
+def slice_period(data, period):
+    """Trim a bar frame down to the requested history period"""
+    if data.empty or period == "max":
+        return data
+    if period.endswith("d"):
+        # Day periods count sessions, which is one bar each at daily interval
+        days = data.index.normalize()
+        first = days.unique()[-int(period[:-1]):][0]
+        return data[days >= first]
+    start = period_start(period, data.index[-1])
+    return data[data.index >= start]
+
+
+def make_provider(data_dir=None):
+    """Local files from `data_dir` (or $STOCK_ANALYZER_DATA), otherwise Yahoo Finance"""
+    data_dir = data_dir or os.environ.get(DATA_DIR_ENV)
+    if data_dir:
+        return LocalFileProvider(data_dir)
+    return YFinanceProvider()
+
+
+class YFinanceProvider:
+    """Fetch bars from Yahoo Finance"""
+
+    # Network fetches are worth caching on disk
+    local = False
+
+    def fetch(self, ticker, interval="1d", period=None, start=None):
+        """Fetch bars either for a whole period or from `start` onwards"""
+        import yfinance as yf
+
+        stock = yf.Ticker(ticker)
+        if start is not None:
+            return stock.history(start=start, interval=interval)
+        return stock.history(period=period or "1y", interval=interval)
+
+    def fundamentals(self, ticker):
+        """Company fields from Yahoo's quote summary (a slow network call)"""
+        import yfinance as yf
+
+        info = yf.Ticker(ticker).info or {}
+        return {field: info.get(field) for field in FUNDAMENTAL_FIELDS}
+
+    def price_ranges(self, tickers, since=None):
+        """Last price and intrabar high/low per ticker since `since`.
+
+        One batched download covers every ticker. Returns
+        {ticker: (last, high, low)} for tickers that have data.
+        """
+        import yfinance as yf
+
+        data = yf.download(list(tickers), period="1d", interval="1m",
+                           group_by='ticker', progress=False, threads=True)
+        ranges = {}
+        for ticker in tickers:
+            try:
+                bars = data[ticker].dropna(subset=['Close'])
+            except KeyError:
+                continue
+            if bars.empty:
+                continue
+            # The minute bar in progress at `since` still counts
+            recent = bars[bars.index >= since.floor('min')] if since is not None else bars.iloc[-1:]
+            if recent.empty:
+                recent = bars.iloc[-1:]
+            ranges[ticker] = (recent['Close'].iloc[-1], recent['High'].max(), recent['Low'].min())
+        return ranges
+
+
+class LocalFileProvider:
+    """Read bars from local files, for offline use.
+
+    Files are named TICKER_INTERVAL.ext (or TICKER.ext for daily bars) and
+    can be NumPy structured arrays (.npy, with a 'timestamp' field), Parquet
+    or CSV. CSV and Parquet files are converted once, in chunks, to a .npy
+    file in `cache_dir`; every read memory-maps the .npy and copies only the
+    rows in the requested date range, so files larger than RAM work and
+    nothing is parsed again until the source file changes.
+    """
+
+    # Already fast local reads, so the bar cache passes them straight through
+    local = True
+
+    # Search order when several formats exist for one series
+    EXTENSIONS = ['.npy', '.parquet', '.csv']
+
+    def __init__(self, root, cache_dir=os.path.join("cache", "local")):
+        self.root = root
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def available(self, ticker, interval="1d"):
+        """Check whether a file exists for `ticker` at `interval`"""
+        return self._source(ticker, interval) is not None
+
+    def fetch(self, ticker, interval="1d", period=None, start=None):
+        """Bars either for a whole period (ending at the last bar on file) or from `start` onwards"""
+        table, tz = self._table(ticker, interval)
+        timestamps = table['timestamp']
+        if not len(timestamps):
+            return _empty_frame()
+
+        if start is not None:
+            first = _stamp(start, tz)
+        else:
+            period = period or "1y"
+            first = _window_start(period, _to_index(timestamps[-1:], tz)[0])
+        i = 0 if first is None else int(np.searchsorted(timestamps, first))
+
+        # Only the rows in range are copied out of the memory map
+        rows = np.array(table[i:])
+        data = pd.DataFrame({name: rows[name] for name in OHLCV},
+                            index=_to_index(rows['timestamp'], tz, name='Date'))
+        return data if start is not None else slice_period(data, period)
+
+    def fundamentals(self, ticker):
+        """Fields from fundamentals.json in the data directory, if there is one"""
+        path = os.path.join(self.root, "fundamentals.json")
+        info = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                info = json.load(f).get(ticker.upper(), {})
+        return {field: info.get(field) for field in FUNDAMENTAL_FIELDS}
+
+    def price_ranges(self, tickers, since=None):
+        """Last close and high/low of each ticker's most recent bar on file"""
+        ranges = {}
+        for ticker in tickers:
+            for interval in ('1m', '5m', '1h', '1d'):
+                if self.available(ticker, interval):
+                    break
+            else:
+                continue
+            table, _ = self._table(ticker, interval)
+            if len(table):
+                last = table[-1]
+                ranges[ticker] = (float(last['Close']), float(last['High']), float(last['Low']))
+        return ranges
+
+    # Internals
+
+    def _source(self, ticker, interval):
+        ticker = ticker.upper()
+        names = [f"{ticker}_{interval}"] + ([ticker] if interval == "1d" else [])
+        for name in names:
+            for ext in self.EXTENSIONS:
+                path = os.path.join(self.root, name + ext)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def _table(self, ticker, interval):
+        """Memory-mapped structured array for a series and its time zone"""
+        path = self._source(ticker, interval)
+        if path is None:
+            raise FileNotFoundError(f"No local data for {ticker.upper()} at {interval} in {self.root}")
+        if path.endswith('.npy'):
+            return _open_table(path), None
+
+        stat = os.stat(path)
+        target = os.path.join(self.cache_dir, os.path.basename(path) + ".npy")
+        meta_path = target + ".json"
+        # One conversion at a time; other readers wait for its result
+        with self._lock:
+            meta = None
+            if os.path.exists(target) and os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    meta = json.load(f)
+            if meta is None or meta['mtime'] != stat.st_mtime or meta['size'] != stat.st_size:
+                tz = _convert(path, target)
+                meta = {'mtime': stat.st_mtime, 'size': stat.st_size, 'tz': tz}
+                with open(meta_path, 'w') as f:
+                    json.dump(meta, f)
+        return _open_table(target), meta['tz']
+
+
+# Local file helpers
+
+def _empty_frame():
+    return pd.DataFrame({name: np.array([], dtype=float) for name in OHLCV},
+                        index=pd.DatetimeIndex([], name='Date'))
+
+
+def _open_table(path):
+    table = np.load(path, mmap_mode='r')
+    fields = table.dtype.fields
+    if fields is None or 'timestamp' not in fields:
+        raise ValueError(f"{path} is not a structured array with a 'timestamp' field")
+    stamp = fields['timestamp'][0]
+    if stamp == np.dtype('<M8[ns]'):
+        # Reinterpret datetime64 as plain nanoseconds without copying the map
+        table = table.view(np.dtype({
+            'names': list(fields),
+            'formats': ['<i8' if name == 'timestamp' else fields[name][0] for name in fields],
+            'offsets': [fields[name][1] for name in fields],
+            'itemsize': table.dtype.itemsize,
+        }))
+    elif stamp != np.dtype('<i8'):
+        raise ValueError(f"{path}: 'timestamp' must be int64 nanoseconds or datetime64[ns]")
+    return table
+
+
+def _to_index(timestamps, tz, name=None):
+    """DatetimeIndex from int64 nanoseconds (UTC when the series has a time zone)"""
+    index = pd.DatetimeIndex(np.asarray(timestamps, dtype=np.int64).view('M8[ns]'), name=name)
+    return index.tz_localize('UTC').tz_convert(tz) if tz is not None else index
+
+
+def _stamp(when, tz):
+    """Nanosecond value of a timestamp in the table's clock"""
+    when = pd.Timestamp(when)
+    if tz is None:
+        return when.tz_localize(None).value if when.tz is not None else when.value
+    return (when.tz_localize(tz) if when.tz is None else when).value
+
+
+def _window_start(period, end):
+    """First timestamp worth reading for `period` ending at `end` (None for all)"""
+    if period == "max":
+        return None
+    if period.endswith("d"):
+        # Sessions, not calendar days - read a generous window, slice_period trims it
+        start = end.normalize() - pd.Timedelta(days=2 * int(period[:-1]) + 7)
+    else:
+        start = period_start(period, end)
+    return start.value
+
+
+def _normalize_chunk(chunk):
+    """Timestamp column plus OHLCV columns, whatever the vendor called them"""
+    if isinstance(chunk.index, pd.DatetimeIndex):
+        chunk = chunk.reset_index()
+    names = {str(c).strip().lower(): c for c in chunk.columns}
+    date = next((names[n] for n in DATE_COLUMNS if n in names), chunk.columns[0])
+    columns = {}
+    for name in OHLCV:
+        column = names.get(name.lower())
+        if column is None:
+            raise ValueError(f"Missing {name} column")
+        columns[name] = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=float)
+    return chunk[date], columns
+
+
+def _chunks(path):
+    """DataFrames of at most CHUNK_ROWS rows from a CSV or Parquet file"""
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files needs pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=CHUNK_ROWS):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=CHUNK_ROWS)
+
+
+def _convert(path, target):
+    """Stream a CSV/Parquet file into a sorted .npy table; returns its time zone"""
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    raw = target + ".raw"
+    rows = 0
+    tz = None
+    previous = None
+    ordered = True
+    with open(raw, 'wb') as out:
+        for chunk in _chunks(path):
+            dates, columns = _normalize_chunk(chunk)
+            if rows == 0:
+                # Zone-aware stamps are stored as UTC and converted back on read;
+                # fixed offsets (which change with daylight saving) stay UTC
+                first = pd.Timestamp(dates.iloc[0]) if len(dates) else None
+                if first is not None and first.tz is not None:
+                    tz = getattr(first.tz, 'key', None) or getattr(first.tz, 'zone', None) or 'UTC'
+            stamps = pd.to_datetime(dates, utc=tz is not None)
+            table = np.empty(len(stamps), dtype=TABLE_DTYPE)
+            table['timestamp'] = pd.DatetimeIndex(stamps).as_unit('ns').asi8
+            for name, values in columns.items():
+                table[name] = values
+            if len(table):
+                ordered &= bool(np.all(np.diff(table['timestamp']) >= 0))
+                ordered &= previous is None or table['timestamp'][0] >= previous
+                previous = table['timestamp'][-1]
+            table.tofile(out)
+            rows += len(table)
+
+    tmp = target + ".tmp.npy"
+    source = np.memmap(raw, dtype=TABLE_DTYPE, mode='r', shape=(rows,)) if rows else \
+        np.empty(0, dtype=TABLE_DTYPE)
+    order = None if ordered else np.argsort(source['timestamp'], kind='stable')
+    table = np.lib.format.open_memmap(tmp, mode='w+', dtype=TABLE_DTYPE, shape=(rows,))
+    for i in range(0, rows, CHUNK_ROWS):
+        table[i:i + CHUNK_ROWS] = source[i:i + CHUNK_ROWS] if order is None \
+            else source[order[i:i + CHUNK_ROWS]]
+    table.flush()
+    del table, source
+    os.replace(tmp, target)
+    os.remove(raw)
+    return tz
@@ -0,0 +1,153 @@
+"""
+Background exports
+Chart images and data files are written by one worker thread, so the window
+never waits on savefig or a disk write. Charts are re-rendered off-screen
+from the stored data rather than copied from the live canvas, and indicator
+frames can be written as CSV, Parquet or Feather (the last two need pyarrow).
+"""
+
+import importlib.util
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from chart_view import ChartView
+
+# File extension per data format
+DATA_FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}
+
+
+def available_formats():
+    """Data formats this install can write"""
+    formats = ['csv']
+    if importlib.util.find_spec('pyarrow') is not None:
+        formats += ['parquet', 'feather']
+    return formats
+
+
+def write_frame(data, path, fmt):
+    """Write an indicator frame in `fmt`, replacing `path` only once complete"""
+    if fmt not in DATA_FORMATS:
+        raise ValueError(f"Unknown data format: {fmt}")
+    if fmt not in available_formats():
+        raise ImportError(f"{fmt.capitalize()} export needs pyarrow (pip install pyarrow)")
+
+    tmp = path + ".tmp"
+    if fmt == 'csv':
+        data.to_csv(tmp)
+    elif fmt == 'parquet':
+        data.to_parquet(tmp)
+    else:
+        # Feather stores plain columns, so the dates become one
+        data.reset_index().to_feather(tmp)
+    os.replace(tmp, path)
+
+
+def render_chart(data, ticker, colors, filename, settings=None, **savefig_kwargs):
+    """Draw the chart for `data` on an off-screen canvas and save it"""
+    view = ChartView(None, colors)
+    view.show(data, ticker, **(settings or {}))
+    view.savefig(filename, **savefig_kwargs)
+
+
+class ExportJob:
+    """One queued export: a label and the steps that write its files"""
+
+    def __init__(self, label, steps, workers=1):
+        self.label = label
+        # (name, call) pairs; a failing step is recorded and the rest still run
+        self.steps = steps
+        self.workers = workers
+        self.done = 0
+        self.errors = []
+        self._cancelled = threading.Event()
+
+    @property
+    def total(self):
+        return len(self.steps)
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+class ExportQueue:
+    """Runs export jobs one after another on a background thread"""
+
+    def __init__(self, on_progress=None, on_done=None):
+        # on_progress(job) after every step and on_done(job) at the end,
+        # both called from the worker thread
+        self.on_progress = on_progress
+        self.on_done = on_done
+
+        self._jobs = []
+        self._running = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, label, steps, workers=1):
+        """Queue a job; with workers > 1 its steps run on that many threads"""
+        job = ExportJob(label, list(steps), workers)
+        with self._cond:
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="export")
+                self._thread.start()
+            self._cond.notify()
+        return job
+
+    def cancel_all(self):
+        """Drop queued jobs and stop the running one after its current step"""
+        with self._cond:
+            for job in self._jobs:
+                job.cancel()
+            self._jobs.clear()
+            if self._running is not None:
+                self._running.cancel()
+
+    @property
+    def depth(self):
+        """Jobs queued or running"""
+        with self._cond:
+            return len(self._jobs) + (self._running is not None)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._cond.wait()
+                job = self._running = self._jobs.pop(0)
+
+            if job.workers > 1:
+                with ThreadPoolExecutor(max_workers=job.workers,
+                                        thread_name_prefix="export") as pool:
+                    futures = [pool.submit(self._step, job, name, call)
+                               for name, call in job.steps]
+                    for _ in as_completed(futures):
+                        self._progress(job)
+            else:
+                for name, call in job.steps:
+                    self._step(job, name, call)
+                    self._progress(job)
+
+            with self._cond:
+                self._running = None
+            if self.on_done is not None:
+                self.on_done(job)
+
+    def _step(self, job, name, call):
+        if job.cancelled:
+            return
+        try:
+            call()
+        except Exception as e:
+            job.errors.append((name, e))
+
+    def _progress(self, job):
+        job.done += 1
+        if self.on_progress is not None:
+            self.on_progress(job)
@@ -0,0 +1,119 @@
+"""
+Fundamentals cache
+Company fields (name, market cap, sector, P/E) kept in a JSON file with a
+time-to-live. Lookups never touch the network; stale or missing entries are
+refreshed on a background thread and handed to a callback.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from data_sources import make_provider
+
+
+class FundamentalsCache:
+    """Persistent TTL cache of per-ticker fundamentals"""
+
+    def __init__(self, provider=None, path=os.path.join("cache", "fundamentals.json"),
+                 ttl=6 * 3600, max_workers=2):
+        self.provider = provider or make_provider()
+        self.path = path
+        # Seconds before a cached entry is fetched again
+        self.ttl = ttl
+
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._in_flight = set()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="fundamentals")
+
+    def get(self, ticker):
+        """Cached fields for `ticker` (or None) and whether they are still fresh"""
+        with self._lock:
+            entry = self._entries.get(ticker.upper())
+        if entry is None:
+            return None, False
+        return entry['fields'], time.time() - entry['fetched'] < self.ttl
+
+    def lookup(self, ticker, on_update):
+        """Return cached fields now and refresh them in the background if needed.
+
+        on_update(ticker, fields) is called from a worker thread once fresh
+        fields arrive; it is not called when the cached entry is fresh.
+        """
+        ticker = ticker.upper()
+        fields, fresh = self.get(ticker)
+        if fresh:
+            self._count('hits')
+            return fields
+        self._count('stale' if fields is not None else 'misses')
+
+        with self._lock:
+            if ticker in self._in_flight:
+                return fields
+            self._in_flight.add(ticker)
+        self._pool.submit(self._refresh, ticker, on_update)
+        return fields
+
+    def stats(self):
+        """Return hit/stale/miss counters"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'stale': self.stale,
+                'misses': self.misses,
+            }
+
+    def clear(self, ticker=None):
+        """Forget one ticker, or everything"""
+        with self._lock:
+            if ticker:
+                self._entries.pop(ticker.upper(), None)
+            else:
+                self._entries = {}
+            self._save()
+
+    # Internals
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _refresh(self, ticker, on_update):
+        try:
+            fields = self.provider.fundamentals(ticker)
+        except Exception:
+            # Offline or rate limited - keep serving the old entry
+            with self._lock:
+                self._in_flight.discard(ticker)
+            return
+
+        with self._lock:
+            self._entries[ticker] = {'fields': fields, 'fetched': time.time()}
+            self._in_flight.discard(ticker)
+            self._save()
+        on_update(ticker, fields)
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temp file first so a crash never leaves a torn cache
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp, self.path)
@@ -0,0 +1,359 @@
+"""
+Technical indicators
+Batch calculation over a whole frame, plus a streaming engine that updates
+the same set (MAs, RSI, MACD, Bollinger Bands, Volume MA) in constant time
+per bar, for new bars or a revised last bar
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from signals import score_series
+
+INDICATOR_COLUMNS = ['MA_20', 'MA_50', 'MA_200', 'RSI', 'MACD', 'MACD_Signal',
+                     'MACD_Hist', 'BB_Upper', 'BB_Lower', 'Volume_MA']
+
+# Running sums are rebuilt from the window this often to stop float drift
+RESYNC_EVERY = 1024
+
+
+def _cumsum0(values):
+    """Cumulative sum with a leading zero, so window sums are differences"""
+    out = np.empty(len(values) + 1)
+    out[0] = 0.0
+    np.cumsum(values, out=out[1:])
+    return out
+
+
+def _window_sums(cumsum, window, out, missing=None):
+    """Write trailing `window` sums into `out` (NaN until the window fills)"""
+    out[:window - 1] = np.nan
+    np.subtract(cumsum[window:], cumsum[:-window], out=out[window - 1:])
+    if missing is not None:
+        # Windows holding a missing value are NaN, like pandas' rolling()
+        out[window - 1:][missing[window:] - missing[:-window] > 0] = np.nan
+    return out
+
+
+def _trailing_nonneg_sums(values, window):
+    """Window sums of a non-negative series, with cumsum round-off snapped to 0"""
+    cumsum = _cumsum0(values)
+    sums = _window_sums(cumsum, window, np.empty(len(values)))
+    sums[sums < cumsum[-1] * 1e-13] = 0.0
+    return sums
+
+
+def _run_lengths(values):
+    """How many consecutive equal values end at each position"""
+    positions = np.arange(len(values))
+    changed = np.ones(len(values), dtype=bool)
+    changed[1:] = values[1:] != values[:-1]
+    return positions - np.maximum.accumulate(np.where(changed, positions, 0)) + 1
+
+
+def calculate_indicators(data):
+    """Calculate technical indicators.
+
+    Every rolling indicator comes from one set of cumulative sums: the close
+    windows (MAs, Bollinger mean and std) share a sum and a sum of squares,
+    and each result is written straight into a preallocated output row.
+    """
+    close = data['Close'].to_numpy(dtype=float)
+    volume = data['Volume'].to_numpy(dtype=float)
+    n = len(close)
+    out = np.empty((len(INDICATOR_COLUMNS), n))
+    rows = dict(zip(INDICATOR_COLUMNS, out))
+
+    # Close windows - shifted by the first close so the sums of squares
+    # stay small enough not to lose precision
+    missing = np.isnan(close)
+    valid = close[~missing]
+    ref = valid[0] if len(valid) else 0.0
+    shifted = np.where(missing, 0.0, close - ref)
+    close_sums = _cumsum0(shifted)
+    close_missing = _cumsum0(missing)
+    # Flat windows (halted or illiquid stretches) are exact, as in pandas,
+    # so a close equal to its MA is not nudged above or below it by round-off
+    runs = _run_lengths(close)
+
+    # Moving averages
+    for name, window in (('MA_20', 20), ('MA_50', 50), ('MA_200', 200)):
+        ma = _window_sums(close_sums, window, rows[name], close_missing)
+        ma /= window
+        ma += ref
+        flat = runs >= window
+        ma[flat] = close[flat]
+
+    # Bollinger Bands reuse the 20-bar sum behind MA_20
+    sum20 = (rows['MA_20'] - ref) * 20
+    upper, lower = rows['BB_Upper'], rows['BB_Lower']
+    _window_sums(_cumsum0(shifted * shifted), 20, upper, close_missing)
+    np.subtract(upper, sum20 * sum20 / 20, out=upper)
+    np.maximum(upper, 0.0, out=upper)
+    upper[runs >= 20] = 0.0
+    np.sqrt(upper / 19, out=upper)
+    np.multiply(upper, -2, out=lower)
+    lower += rows['MA_20']
+    upper *= 2
+    upper += rows['MA_20']
+
+    # RSI - gains and losses in the same window, so the ratio of sums is the ratio of means
+    delta = np.diff(close, prepend=np.nan)
+    gains = _trailing_nonneg_sums(np.where(delta > 0, delta, 0.0), 14)
+    losses = _trailing_nonneg_sums(np.where(delta < 0, -delta, 0.0), 14)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rows['RSI'][:] = 100 - 100 / (1 + gains / losses)
+
+    # MACD
+    close_series = pd.Series(close)
+    macd = (close_series.ewm(span=12, adjust=False).mean() -
+            close_series.ewm(span=26, adjust=False).mean())
+    rows['MACD'][:] = macd.to_numpy()
+    rows['MACD_Signal'][:] = macd.ewm(span=9, adjust=False).mean().to_numpy()
+    np.subtract(rows['MACD'], rows['MACD_Signal'], out=rows['MACD_Hist'])
+
+    # Volume MA
+    volume_missing = np.isnan(volume)
+    ma = _window_sums(_cumsum0(np.where(volume_missing, 0.0, volume)), 20,
+                      rows['Volume_MA'], _cumsum0(volume_missing))
+    ma /= 20
+
+    for name in INDICATOR_COLUMNS:
+        data[name] = rows[name]
+
+    # Composite score for every bar
+    data['Score'] = score_series(data)
+
+    return data
+
+
+class RollingWindow:
+    """Fixed-size window with a running sum and sum of squares.
+
+    Missing (NaN) values stay out of the sums; while one is in the window
+    the mean and std are NaN, as with pandas' rolling().
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.missing = 0
+        self._pushes = 0
+
+    def push(self, x):
+        if len(self.values) == self.size:
+            self._drop(self.values[0])
+        self.values.append(x)
+        self._add(x)
+
+        self._pushes += 1
+        if self._pushes % RESYNC_EVERY == 0:
+            self.resync()
+
+    def replace_last(self, x):
+        self._drop(self.values[-1])
+        self.values[-1] = x
+        self._add(x)
+
+    def resync(self):
+        present = [v for v in self.values if v == v]
+        self.total = math.fsum(present)
+        self.total_sq = math.fsum(v * v for v in present)
+
+    @property
+    def full(self):
+        return len(self.values) == self.size
+
+    def mean(self):
+        return self.total / self.size if self.full and not self.missing else math.nan
+
+    def std(self):
+        """Sample standard deviation (ddof=1, same as pandas)"""
+        if not self.full or self.missing:
+            return math.nan
+        n = self.size
+        var = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return math.sqrt(var) if var > 0 else 0.0
+
+    def _add(self, x):
+        if x == x:
+            self.total += x
+            self.total_sq += x * x
+        else:
+            self.missing += 1
+
+    def _drop(self, x):
+        if x == x:
+            self.total -= x
+            self.total_sq -= x * x
+        else:
+            self.missing -= 1
+
+
+def _ema_step(prev, x, span, gap=0):
+    """One adjust=False EMA step, after `gap` missing values (as pandas' ewm() weighs them)"""
+    if prev is None or prev != prev:
+        return x
+    alpha = 2.0 / (span + 1)
+    if gap:
+        old = (1 - alpha) ** (gap + 1)
+        return (old * prev + alpha * x) / (old + alpha)
+    return alpha * x + (1 - alpha) * prev
+
+
+class IndicatorEngine:
+    """Stateful indicator calculator fed one bar at a time"""
+
+    def __init__(self):
+        self.ma20 = RollingWindow(20)
+        self.ma50 = RollingWindow(50)
+        self.ma200 = RollingWindow(200)
+        self.gains = RollingWindow(14)
+        self.losses = RollingWindow(14)
+        self.volume = RollingWindow(20)
+
+        # EMA state after the last bar, and before it so the bar can be revised;
+        # the gap counts missing closes since the close the EMAs last took in
+        self.ema12 = self.ema26 = self.signal = None
+        self._gap = 0
+        self._prev_ema = (None, None, None, 0)
+
+        self.prev_close = None
+        self.last_close = None
+        self.last_timestamp = None
+        self.count = 0
+
+    def update(self, timestamp, close, volume):
+        """Apply a bar and return its indicator values.
+
+        A bar with the same timestamp as the previous one revises it in place
+        (e.g. the forming bar of a live session); older timestamps are rejected.
+        """
+        if self.last_timestamp is not None and timestamp == self.last_timestamp:
+            self._revise(close, volume)
+        elif self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError(f"Bar at {timestamp} is older than {self.last_timestamp}")
+        else:
+            self._append(close, volume)
+            self.last_timestamp = timestamp
+        return self.values()
+
+    def values(self):
+        """Indicator values for the latest bar"""
+        ma20 = self.ma20.mean()
+        std = self.ma20.std()
+        macd = self.ema12 - self.ema26
+
+        if not self.gains.full:
+            rsi = math.nan
+        elif self.losses.total > 0:
+            rsi = 100 - 100 / (1 + self.gains.total / self.losses.total)
+        else:
+            rsi = 100.0 if self.gains.total > 0 else math.nan
+
+        return {
+            'MA_20': ma20,
+            'MA_50': self.ma50.mean(),
+            'MA_200': self.ma200.mean(),
+            'RSI': rsi,
+            'MACD': macd,
+            'MACD_Signal': self.signal,
+            'MACD_Hist': macd - self.signal,
+            'BB_Upper': ma20 + std * 2,
+            'BB_Lower': ma20 - std * 2,
+            'Volume_MA': self.volume.mean(),
+        }
+
+    def seed(self, data):
+        """Load state from a bar frame so later bars continue from its end"""
+        close = data['Close'].to_numpy(dtype=float)
+        volume = data['Volume'].to_numpy(dtype=float)
+        if len(close) < 2:
+            for ts, c, v in zip(data.index, close, volume):
+                self.update(ts, c, v)
+            return self
+
+        # EMA state comes from a vectorized pass over the whole history
+        ema12 = pd.Series(close).ewm(span=12, adjust=False).mean().to_numpy()
+        ema26 = pd.Series(close).ewm(span=26, adjust=False).mean().to_numpy()
+        signal = pd.Series(ema12 - ema26).ewm(span=9, adjust=False).mean().to_numpy()
+
+        # Windows are filled up to the second-to-last bar ...
+        delta = np.diff(close, prepend=close[0])
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+        body = slice(max(0, len(close) - 201), len(close) - 1)
+        for c, v, gain, loss in zip(close[body], volume[body], gains[body], losses[body]):
+            self.ma20.push(c)
+            self.ma50.push(c)
+            self.ma200.push(c)
+            self.volume.push(v)
+            self.gains.push(gain)
+            self.losses.push(loss)
+        self.ema12, self.ema26, self.signal = ema12[-2], ema26[-2], signal[-2]
+        present = np.flatnonzero(~np.isnan(close[:-1]))
+        self._gap = len(close) - 2 - present[-1] if len(present) else 0
+        self.last_close = close[-2]
+        self.last_timestamp = data.index[-2]
+        self.count = len(close) - 1
+
+        # ... and the last bar goes through update() so it stays revisable
+        self.update(data.index[-1], close[-1], volume[-1])
+        return self
+
+    def update_frame(self, data):
+        """Run every bar of `data` through the engine, writing indicator columns"""
+        close = data['Close'].to_numpy(dtype=float)
+        volume = data['Volume'].to_numpy(dtype=float)
+        out = {name: np.empty(len(data)) for name in INDICATOR_COLUMNS}
+        for i, (ts, c, v) in enumerate(zip(data.index, close, volume)):
+            for name, value in self.update(ts, c, v).items():
+                out[name][i] = value
+        for name in INDICATOR_COLUMNS:
+            data[name] = out[name]
+        return data
+
+    # Internals
+
+    def _append(self, close, volume):
+        # A move to or from a missing close counts as no change, as in the batch RSI
+        delta = close - self.last_close if self.last_close is not None else 0.0
+        for window in (self.ma20, self.ma50, self.ma200):
+            window.push(close)
+        self.volume.push(volume)
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+
+        self._prev_ema = (self.ema12, self.ema26, self.signal, self._gap)
+        self._step_ema(close)
+
+        self.prev_close = self.last_close
+        self.last_close = close
+        self.count += 1
+
+    def _revise(self, close, volume):
+        delta = close - self.prev_close if self.prev_close is not None else 0.0
+        for window in (self.ma20, self.ma50, self.ma200):
+            window.replace_last(close)
+        self.volume.replace_last(volume)
+        self.gains.replace_last(delta if delta > 0 else 0.0)
+        self.losses.replace_last(-delta if delta < 0 else 0.0)
+
+        self.ema12, self.ema26, self.signal, self._gap = self._prev_ema
+        self._step_ema(close)
+        self.last_close = close
+
+    def _step_ema(self, close):
+        if close == close or self.ema12 is None:
+            self.ema12 = _ema_step(self.ema12, close, 12, self._gap)
+            self.ema26 = _ema_step(self.ema26, close, 26, self._gap)
+            self._gap = 0
+        else:
+            # A missing close holds the EMAs; the next close makes up for the gap
+            self._gap += 1
+        self.signal = _ema_step(self.signal, self.ema12 - self.ema26, 9)
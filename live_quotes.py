@@ -0,0 +1,335 @@
+"""
+Live quote mode
+Streams trades for one ticker into the forming bar of an indicator frame.
+Ticks are folded into their bar as they arrive, on the feed's thread; once
+per UI frame the bars touched since the last frame go through the
+IndicatorEngine once each (revising the last bar or appending a new one),
+so a burst of ticks costs one indicator update and one redraw. A replay
+feed plays stored bars back as ticks, standing in for the exchange stream
+offline.
+"""
+
+import math
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from indicator_engine import IndicatorEngine
+from resample import INTRADAY_STEPS
+from signals import score_arrays
+
+# Chart redraws per second at most; ticks in between are coalesced
+LIVE_FPS = 10
+
+# Bars held back from the chart and replayed as ticks by the offline feed
+REPLAY_BARS = 120
+
+_DAY = pd.Timedelta(days=1).value
+
+
+class LiveMetrics:
+    """Tick counters, with rates per second between snapshots"""
+
+    def __init__(self):
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+        self.frames = 0
+        self.apply_seconds = 0.0
+        self._lock = threading.Lock()
+        self._last = (time.perf_counter(), 0, 0, 0)
+
+    def snapshot(self):
+        """Totals plus ticks/sec processed and dropped since the last snapshot"""
+        now = time.perf_counter()
+        with self._lock:
+            processed, dropped, frames = self.processed, self.dropped, self.frames
+            then, processed_before, dropped_before, frames_before = self._last
+            self._last = (now, processed, dropped, frames)
+        elapsed = max(now - then, 1e-9)
+        return {
+            'received': self.received,
+            'processed': processed,
+            'dropped': dropped,
+            'frames': frames,
+            'ticks_per_sec': (processed - processed_before) / elapsed,
+            'dropped_per_sec': (dropped - dropped_before) / elapsed,
+            'fps': (frames - frames_before) / elapsed,
+            'ticks_per_frame': processed / frames if frames else 0.0,
+            'apply_ms': self.apply_seconds / frames * 1000 if frames else 0.0,
+        }
+
+    def frame(self, ticks, seconds):
+        """Count one applied frame that took in `ticks` ticks"""
+        with self._lock:
+            self.processed += ticks
+            self.frames += 1
+            self.apply_seconds += seconds
+
+
+class LiveSession:
+    """An indicator frame kept current from a stream of ticks.
+
+    on_tick(time_ns, price, size) may be called from any thread; tick times
+    are nanoseconds since the epoch on the same clock as the frame's index
+    (UTC for a tz-aware index). Ticks older than the forming bar, or without
+    a positive finite price, are dropped and counted.
+    """
+
+    def __init__(self, data, interval):
+        if interval not in INTRADAY_STEPS and interval not in ('1d', '1wk'):
+            raise ValueError(f"Live mode does not support {interval} bars")
+        if data.empty:
+            raise ValueError("Not enough bars for live mode")
+        # Volumes become fractional-safe floats, as ticks add to them, and
+        # float32 columns (from the bar store) float64, as rows are written in place
+        self.data = data = data.astype({c: float for c in data.columns
+                                        if c == 'Volume' or data[c].dtype == np.float32})
+        self.interval = interval
+        self.engine = IndicatorEngine().seed(data)
+        self.metrics = LiveMetrics()
+
+        self._tz = data.index.tz
+        self._anchor = self._last_start = int(data.index.as_unit('ns').asi8[-1])
+        last = data.iloc[-1]
+        start, end = self._bucket(self._anchor)
+        self._bar = [start, end, float(last['Open']), float(last['High']),
+                     float(last['Low']), float(last['Close']), float(last['Volume'])]
+        # Bars changed since the last apply(), by start time, oldest first
+        self._touched = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def on_tick(self, time_ns, price, size=0.0):
+        """Fold one trade into its bar"""
+        m = self.metrics
+        with self._lock:
+            m.received += 1
+            bar = self._bar
+            if not (price > 0 and math.isfinite(price)) or time_ns < bar[0]:
+                m.dropped += 1
+                return
+            if time_ns < bar[1]:
+                if price > bar[3]:
+                    bar[3] = price
+                elif price < bar[4]:
+                    bar[4] = price
+                bar[5] = price
+                bar[6] += size
+            else:
+                start, end = self._bucket(time_ns)
+                bar = self._bar = [start, end, price, price, price, price, float(size)]
+            self._touched[bar[0]] = bar
+            self._pending += 1
+
+    def apply(self):
+        """Move the touched bars into the frame; returns whether anything changed"""
+        with self._lock:
+            if not self._touched:
+                return False
+            bars = [(start, bar[2:]) for start, bar in self._touched.items()]
+            ticks = self._pending
+            self._touched.clear()
+            self._pending = 0
+
+        began = time.perf_counter()
+        appended = []
+        for start, values in bars:
+            timestamp, row = self._apply_bar(start, *values)
+            if start == self._last_start:
+                # The forming bar: overwrite its row in place
+                data = self.data
+                columns = [c for c in row if c in data.columns]
+                data.iloc[-1, [data.columns.get_loc(c) for c in columns]] = \
+                    [row[c] for c in columns]
+            else:
+                appended.append((timestamp, row))
+                self._last_start = start
+        if appended:
+            # New bars are added in one concat per frame
+            data = self.data
+            index = pd.DatetimeIndex([timestamp for timestamp, _ in appended],
+                                     name=data.index.name).as_unit(data.index.unit)
+            new = pd.DataFrame({c: [row.get(c, 0.0) for _, row in appended]
+                                for c in data.columns}, index=index)
+            self.data = pd.concat([data, new])
+        self.metrics.frame(ticks, time.perf_counter() - began)
+        return True
+
+    # Internals
+
+    def _bucket(self, time_ns):
+        """Start and end (ns) of the bar a tick at `time_ns` belongs to"""
+        step = INTRADAY_STEPS.get(self.interval)
+        if step is not None:
+            # Intraday bars continue the frame's own grid, like resample_bars
+            step = step.value
+            start = self._anchor + (time_ns - self._anchor) // step * step
+            return start, start + step
+        moment = pd.Timestamp(time_ns, tz='UTC').tz_convert(self._tz) if self._tz \
+            else pd.Timestamp(time_ns)
+        day = moment.normalize()
+        if self.interval == '1wk':
+            return (day - pd.Timedelta(days=day.weekday())).value, \
+                (day + pd.Timedelta(days=7 - day.weekday())).value
+        return day.value, day.value + _DAY
+
+    def _timestamp(self, start):
+        if self._tz is not None:
+            return pd.Timestamp(start, tz='UTC').tz_convert(self._tz)
+        return pd.Timestamp(start)
+
+    def _apply_bar(self, start, open_, high, low, close, volume):
+        """Run one bar through the engine; returns its timestamp and frame row"""
+        timestamp = self._timestamp(start)
+        values = self.engine.update(timestamp, close, volume)
+        score = int(score_arrays(close, values['MA_20'], values['MA_50'], values['RSI'],
+                                 values['MACD'], values['MACD_Signal'], volume,
+                                 values['Volume_MA']))
+        return timestamp, {'Open': open_, 'High': high, 'Low': low, 'Close': close,
+                           'Volume': volume, **values, 'Score': score}
+
+
+class ReplayFeed:
+    """Plays bars back as ticks: open, the high and low in a random order,
+    a few prices in between, then the close, spread over each bar's time.
+
+    rate is ticks per second (None plays as fast as possible).
+    """
+
+    name = "Replay"
+
+    def __init__(self, bars, ticks_per_bar=8, rate=40, seed=0):
+        self.bars = bars
+        self.ticks_per_bar = max(ticks_per_bar, 4)
+        self.rate = rate
+        self.seed = seed
+        self._stop = threading.Event()
+        self._thread = None
+
+    def ticks(self):
+        """(time_ns, price, size) arrays for every tick of the replay"""
+        n, k = len(self.bars), self.ticks_per_bar
+        rng = np.random.default_rng(self.seed)
+        open_, high, low, close, volume = (self.bars[c].to_numpy(dtype=float)
+                                           for c in ('Open', 'High', 'Low', 'Close', 'Volume'))
+
+        prices = low[:, None] + rng.random((n, k)) * (high - low)[:, None]
+        prices[:, 0] = open_
+        prices[:, -1] = close
+        # The extremes land on two distinct middle ticks
+        high_at = rng.integers(1, k - 1, n)
+        low_at = (high_at + rng.integers(1, k - 2, n) - 1) % (k - 2) + 1
+        rows = np.arange(n)
+        prices[rows, high_at] = high
+        prices[rows, low_at] = low
+
+        sizes = np.diff(np.floor(volume[:, None] * np.linspace(0, 1, k + 1)), axis=1)
+
+        # Ticks stay inside their bar: a bar spans the typical spacing at most,
+        # so gaps (nights, weekends) never push ticks into a bar of their own
+        starts = self.bars.index.as_unit('ns').asi8
+        spacing = np.diff(starts)
+        typical = np.median(spacing) if len(spacing) else INTRADAY_STEPS['1m'].value
+        span = np.minimum(np.append(spacing, typical), typical).astype(np.int64)
+        times = starts[:, None] + (span[:, None] * np.arange(k) // k)
+        return times.ravel(), prices.ravel(), sizes.ravel()
+
+    def start(self, on_tick, on_error=None, on_end=None):
+        self._thread = threading.Thread(target=self._run, args=(on_tick, on_end),
+                                        daemon=True, name="replay")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, on_tick, on_end):
+        times, prices, sizes = self.ticks()
+        began = time.perf_counter()
+        for i, (t, price, size) in enumerate(zip(times.tolist(), prices.tolist(),
+                                                 sizes.tolist())):
+            if self.rate is not None:
+                wait = began + i / self.rate - time.perf_counter()
+                if wait > 0 and self._stop.wait(wait):
+                    return
+            if self._stop.is_set():
+                return
+            on_tick(t, price, size)
+        if on_end is not None:
+            on_end()
+
+
+class YahooQuoteFeed:
+    """Trades for one ticker from Yahoo Finance's streaming quote websocket"""
+
+    name = "Yahoo"
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self._socket = None
+        self._day_volume = None
+        self._stop = threading.Event()
+
+    def start(self, on_tick, on_error=None, on_end=None):
+        threading.Thread(target=self._run, args=(on_tick, on_error, on_end),
+                         daemon=True, name="quotes").start()
+
+    def stop(self):
+        self._stop.set()
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except Exception:
+                pass
+
+    def _run(self, on_tick, on_error, on_end):
+        import yfinance as yf
+
+        def handle(message):
+            on_tick(*self._parse(message))
+
+        try:
+            self._socket = yf.WebSocket(verbose=False)
+            self._socket.subscribe([self.ticker])
+            self._socket.listen(handle)
+        except Exception as e:
+            if not self._stop.is_set() and on_error is not None:
+                on_error(e)
+            return
+        if not self._stop.is_set() and on_end is not None:
+            on_end()
+
+    def _parse(self, message):
+        """(time_ns, price, size) from a decoded pricing message"""
+        try:
+            price = float(message['price'])
+            time_ns = int(message['time']) * 1_000_000
+        except (KeyError, TypeError, ValueError):
+            # Counted as dropped by the session
+            return 0, math.nan, 0.0
+        # Size comes from the change in cumulative day volume
+        size = 0.0
+        if 'day_volume' in message:
+            day_volume = float(message['day_volume'])
+            if self._day_volume is not None and day_volume >= self._day_volume:
+                size = day_volume - self._day_volume
+            self._day_volume = day_volume
+        return time_ns, price, size
+
+
+def make_feed(provider, ticker, data):
+    """Live feed for `ticker` and the frame to start from.
+
+    Offline (local-file) providers get a replay of the last REPLAY_BARS bars
+    of `data`, which are cut from the returned frame; otherwise the frame is
+    `data` itself and quotes stream from Yahoo Finance. Raises ValueError
+    when `data` is too short for either.
+    """
+    if getattr(provider, 'local', False):
+        held = min(REPLAY_BARS, len(data) // 2)
+        if held == 0:
+            raise ValueError("Not enough bars for live mode")
+        return ReplayFeed(data.iloc[-held:]), data.iloc[:-held].copy()
+    return YahooQuoteFeed(ticker), data.copy()
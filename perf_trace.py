@@ -0,0 +1,129 @@
+"""
+Latency tracing
+Times the stages of one operation (fetch, indicators, chart, draw, ...),
+keeps a rolling history of finished traces and exports it as JSON. Profiling
+is opt-in: with it on, each span also records a cProfile summary and the
+peak traced memory.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+# Functions listed per span in a profile capture
+PROFILE_LINES = 15
+
+# cProfile and tracemalloc's peak are process-wide, so one span profiles at a
+# time; spans that overlap it (on other threads) are only timed
+_profiling = threading.Lock()
+
+
+class Trace:
+    """Stage timings for one operation"""
+
+    def __init__(self, name, profile=False):
+        self.name = name
+        self.profile = profile
+        self.started = time.time()
+        self.spans = []
+        self.profiles = {}
+        self.peak_memory = {}
+
+    @contextmanager
+    def span(self, stage):
+        """Time the enclosed block as `stage`"""
+        profiler = None
+        if self.profile and _profiling.acquire(blocking=False):
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((stage, time.perf_counter() - start))
+            if profiler is not None:
+                profiler.disable()
+                self.peak_memory[stage] = tracemalloc.get_traced_memory()[1]
+                _profiling.release()
+                out = io.StringIO()
+                pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(PROFILE_LINES)
+                self.profiles[stage] = out.getvalue()
+
+    @property
+    def total(self):
+        return sum(seconds for _, seconds in self.spans)
+
+    def summary(self):
+        """Compact breakdown, e.g. 'fetch 120ms · indicators 8ms · total 190ms'"""
+        parts = [f"{stage} {seconds * 1000:.0f}ms" for stage, seconds in self.spans]
+        parts.append(f"total {self.total * 1000:.0f}ms")
+        return " · ".join(parts)
+
+    def to_dict(self):
+        record = {
+            'name': self.name,
+            'started': self.started,
+            'spans': {stage: seconds for stage, seconds in self.spans},
+            'total': self.total,
+        }
+        if self.profile:
+            record['peak_memory'] = self.peak_memory
+            record['profiles'] = self.profiles
+        return record
+
+
+class TraceLog:
+    """Rolling history of finished traces"""
+
+    def __init__(self, maxlen=200):
+        # Set to capture cProfile and tracemalloc data in new traces
+        self.profiling = False
+        self._traces = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def start(self, name):
+        """A new trace, profiled if profiling is switched on"""
+        return Trace(name, profile=self.profiling)
+
+    def record(self, trace):
+        with self._lock:
+            self._traces.append(trace)
+
+    def traces(self):
+        with self._lock:
+            return list(self._traces)
+
+    def set_profiling(self, enabled):
+        self.profiling = enabled
+        if not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def stage_stats(self):
+        """Median and worst seconds per stage over the history"""
+        samples = {}
+        for trace in self.traces():
+            for stage, seconds in trace.spans:
+                samples.setdefault(stage, []).append(seconds)
+            samples.setdefault('total', []).append(trace.total)
+        return {stage: {'count': len(values),
+                        'median': statistics.median(values),
+                        'max': max(values)}
+                for stage, values in samples.items()}
+
+    def export_json(self, path):
+        """Write the history and per-stage stats to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump({
+                'traces': [trace.to_dict() for trace in self.traces()],
+                'stages': self.stage_stats(),
+            }, f, indent=2)
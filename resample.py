@@ -0,0 +1,60 @@
+"""
+Bar resampling
+Builds coarser OHLCV bars (5m, 1h, 1d, 1wk) from finer ones already on hand.
+Intraday buckets are anchored at each session's first bar and never span
+two sessions; daily and weekly bars follow the exchange's calendar dates.
+"""
+
+import pandas as pd
+
+# Chart intervals, finest first
+INTERVALS = ['1m', '5m', '1h', '1d', '1wk']
+
+INTRADAY_STEPS = {
+    '1m': pd.Timedelta(minutes=1),
+    '5m': pd.Timedelta(minutes=5),
+    '1h': pd.Timedelta(hours=1),
+}
+
+# How each column combines when bars merge
+AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+    'Dividends': 'sum',
+    'Stock Splits': 'max',
+}
+
+
+def finer_intervals(interval):
+    """Intervals that `interval` bars can be built from, coarsest first"""
+    return INTERVALS[:INTERVALS.index(interval)][::-1]
+
+
+def bucket_keys(index, interval):
+    """Start timestamp of the `interval` bar each timestamp belongs to"""
+    days = index.normalize()
+    if interval == '1d':
+        return days
+    if interval == '1wk':
+        return days - pd.to_timedelta(days.weekday, unit='D')
+
+    # Intraday: count steps from the session's first bar
+    step = INTRADAY_STEPS[interval]
+    session_open = pd.Series(index, index=index).groupby(days).transform('min')
+    session_open = pd.DatetimeIndex(session_open)
+    return session_open + ((index - session_open) // step) * step
+
+
+def resample_bars(data, interval):
+    """Aggregate bars into `interval` bars with OHLCV semantics"""
+    if data.empty:
+        return data
+    columns = [c for c in data.columns if c in AGGREGATION]
+    keys = bucket_keys(data.index, interval)
+    bars = data[columns].groupby(keys, sort=True).agg(
+        {c: AGGREGATION[c] for c in columns})
+    bars.index.name = 'Datetime' if interval in INTRADAY_STEPS else 'Date'
+    return bars
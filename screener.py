@@ -0,0 +1,269 @@
+"""
+Universe screener
+Keeps the latest bar and indicator values of every ticker in one columnar
+table, so a screen such as "RSI < 30 and MA_20 > MA_50" is a single
+vectorized filter over that table instead of a recompute per symbol. Rows
+are replaced as tickers refresh, and the table is saved to disk so a large
+universe can be screened right after start.
+"""
+
+import ast
+import json
+import operator
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from indicator_engine import INDICATOR_COLUMNS
+
+# Values kept per ticker: the last bar, its indicators, the score and the
+# percent change from the previous close
+SCREEN_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', *INDICATOR_COLUMNS,
+                  'Score', 'Change']
+
+_COMPARISONS = {ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+                ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne}
+_ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+               ast.Div: operator.truediv}
+_FUNCTIONS = {'abs': np.abs}
+
+
+class QueryError(ValueError):
+    """A screen expression that cannot be parsed or uses unknown names"""
+
+
+class Query:
+    """A parsed screen expression, evaluated over whole columns at once.
+
+    Supports column names, numbers, + - * /, comparisons (chained too),
+    and/or/not and abs(). Names match SCREEN_COLUMNS case-insensitively.
+    Comparisons involving NaN are false.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        if not self.expression:
+            raise QueryError("Empty screen")
+        try:
+            tree = ast.parse(self.expression, mode='eval')
+        except SyntaxError as e:
+            raise QueryError(f"Invalid screen: {e.msg}")
+        self._names = {name.lower(): name for name in SCREEN_COLUMNS}
+        self._tree = tree.body
+        # Only conditions select rows; "RSI" or "Close * 2" are caught here, not mid-screen
+        self._condition(self._tree)
+        self.columns = sorted(self._check(self._tree))
+
+    def evaluate(self, columns):
+        """Boolean mask over the rows of a {column: array} table"""
+        result = self._eval(self._tree, columns)
+        if np.ndim(result) == 0:
+            # Constant screens like "1 < 2" select every row or none
+            length = len(next(iter(columns.values()))) if columns else 0
+            return np.full(length, bool(result))
+        if result.dtype != bool:
+            raise QueryError("The screen must be a condition, e.g. RSI < 30")
+        return result
+
+    def _condition(self, node):
+        """Require a comparison, and/or or not, so no bare value (NaN included)
+        is taken as true or false"""
+        if not (isinstance(node, (ast.Compare, ast.BoolOp)) or
+                (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not))):
+            raise QueryError("The screen must be a condition, e.g. RSI < 30")
+
+    def _check(self, node):
+        """Validate the tree and return the columns it reads"""
+        if isinstance(node, ast.BoolOp):
+            for value in node.values:
+                self._condition(value)
+            return set().union(*(self._check(v) for v in node.values))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            self._condition(node.operand)
+            return self._check(node.operand)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            return self._check(node.operand)
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            return self._check(node.left) | self._check(node.right)
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            return set().union(self._check(node.left), *(self._check(c) for c in node.comparators))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and node.func.id in _FUNCTIONS and len(node.args) == 1 and not node.keywords:
+            return self._check(node.args[0])
+        if isinstance(node, ast.Name):
+            if node.id.lower() not in self._names:
+                raise QueryError(f"Unknown column: {node.id}")
+            return {self._names[node.id.lower()]}
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return set()
+        raise QueryError(f"Unsupported expression: {ast.unparse(node)}")
+
+    def _eval(self, node, columns):
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = self._eval(node.values[0], columns)
+            for value in node.values[1:]:
+                result = combine(result, self._eval(value, columns))
+            return result
+        if isinstance(node, ast.UnaryOp):
+            value = self._eval(node.operand, columns)
+            if isinstance(node.op, ast.Not):
+                return np.logical_not(value)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return _ARITHMETIC[type(node.op)](self._eval(node.left, columns),
+                                                  self._eval(node.right, columns))
+        if isinstance(node, ast.Compare):
+            # a < b < c means a < b and b < c
+            left = self._eval(node.left, columns)
+            result = True
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._eval(comparator, columns)
+                result = np.logical_and(result, _COMPARISONS[type(op)](left, right))
+                left = right
+            return result
+        if isinstance(node, ast.Call):
+            return _FUNCTIONS[node.func.id](self._eval(node.args[0], columns))
+        if isinstance(node, ast.Name):
+            return columns[self._names[node.id.lower()]]
+        return node.value
+
+
+class LatestTable:
+    """Latest indicator values per ticker, one contiguous array per column"""
+
+    def __init__(self, path=os.path.join("cache", "screener.npz")):
+        self.path = path
+        self.tickers = []
+        self.updates = 0
+
+        self._rows = {}
+        self._values = np.full((len(SCREEN_COLUMNS), 64), np.nan)
+        self._bar_times = np.zeros(64, dtype=np.int64)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.tickers)
+
+    def __contains__(self, ticker):
+        with self._lock:
+            return ticker.upper() in self._rows
+
+    def update(self, ticker, data):
+        """Replace a ticker's row with the last bar of its indicator frame"""
+        if len(data) == 0:
+            return
+        last = data.iloc[-1]
+        values = np.array([last[name] if name in last.index else np.nan
+                           for name in SCREEN_COLUMNS[:-1]], dtype=float)
+        prev_close = data['Close'].iloc[-2] if len(data) > 1 else np.nan
+        change = (last['Close'] - prev_close) / prev_close * 100
+
+        ticker = ticker.upper()
+        with self._lock:
+            row = self._rows.get(ticker)
+            if row is None:
+                row = self._add_row(ticker)
+            self._values[:-1, row] = values
+            self._values[-1, row] = change
+            self._bar_times[row] = pd.Timestamp(data.index[-1]).value
+            self.updates += 1
+            self._dirty = True
+
+    def remove(self, ticker):
+        """Drop a ticker; the last row moves into its place"""
+        ticker = ticker.upper()
+        with self._lock:
+            row = self._rows.pop(ticker, None)
+            if row is None:
+                return
+            last = len(self.tickers) - 1
+            if row != last:
+                moved = self.tickers[last]
+                self.tickers[row] = moved
+                self._rows[moved] = row
+                self._values[:, row] = self._values[:, last]
+                self._bar_times[row] = self._bar_times[last]
+            self.tickers.pop()
+            self._values[:, last] = np.nan
+            self._dirty = True
+
+    def columns(self):
+        """The ticker array, a copy of every column ({name: array}) and the bar times"""
+        with self._lock:
+            n = len(self.tickers)
+            columns = {name: self._values[i, :n].copy() for i, name in enumerate(SCREEN_COLUMNS)}
+            return (np.array(self.tickers, dtype=object), columns,
+                    self._bar_times[:n].copy())
+
+    def screen(self, query, sort_by='Score', ascending=False):
+        """Rows matching `query` (a Query or an expression) as a DataFrame"""
+        if not isinstance(query, Query):
+            query = Query(query)
+        tickers, columns, bar_times = self.columns()
+        mask = query.evaluate(columns)
+        result = pd.DataFrame({name: values[mask] for name, values in columns.items()},
+                              index=pd.Index(tickers[mask], name='Ticker'))
+        # When each row's bar closed, to spot tickers that have not refreshed lately
+        result['As Of'] = pd.to_datetime(bar_times[mask])
+        if sort_by is not None:
+            result = result.sort_values(sort_by, ascending=ascending, na_position='last')
+        return result
+
+    def save(self):
+        """Write the table to disk if it changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            n = len(self.tickers)
+            arrays = {'values': self._values[:, :n], 'bar_times': self._bar_times[:n],
+                      '__meta__': np.array(json.dumps({'tickers': self.tickers,
+                                                       'columns': SCREEN_COLUMNS}))}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, self.path)
+
+    def load(self):
+        """Read the saved table; a missing or outdated file leaves it empty"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as npz:
+                meta = json.loads(str(npz['__meta__']))
+                values = npz['values']
+                bar_times = npz['bar_times']
+        except Exception:
+            return
+        if meta['columns'] != SCREEN_COLUMNS:
+            return
+        with self._lock:
+            self.tickers = list(meta['tickers'])
+            self._rows = {ticker: i for i, ticker in enumerate(self.tickers)}
+            capacity = max(64, len(self.tickers))
+            self._values = np.full((len(SCREEN_COLUMNS), capacity), np.nan)
+            self._values[:, :len(self.tickers)] = values
+            self._bar_times = np.zeros(capacity, dtype=np.int64)
+            self._bar_times[:len(self.tickers)] = bar_times
+
+    # Internals
+
+    def _add_row(self, ticker):
+        row = len(self.tickers)
+        if row == self._values.shape[1]:
+            # Double the capacity so adding a universe stays amortised O(1)
+            grown = np.full((len(SCREEN_COLUMNS), row * 2), np.nan)
+            grown[:, :row] = self._values
+            self._values = grown
+            self._bar_times = np.concatenate([self._bar_times, np.zeros(row, dtype=np.int64)])
+        self.tickers.append(ticker)
+        self._rows[ticker] = row
+        return row
@@ -0,0 +1,69 @@
+"""
+Trading signal scoring
+The composite score rules behind the AI Recommendation panel
+"""
+
+import numpy as np
+import pandas as pd
+
+# Lowest score for each recommendation, best first
+RECOMMENDATIONS = [
+    (5, "STRONG BUY"),
+    (2, "BUY"),
+    (-1, "HOLD"),
+    (-4, "SELL"),
+    (None, "STRONG SELL"),
+]
+
+
+def recommendation(score):
+    """Map a composite score to its recommendation label"""
+    for threshold, label in RECOMMENDATIONS:
+        if threshold is None or score >= threshold:
+            return label
+
+
+def score_components(close, ma20, ma50, rsi, macd, macd_signal, volume, volume_ma):
+    """Points from each scoring rule, element-wise over arrays of any shape"""
+    close, ma20, ma50, rsi, macd, macd_signal, volume, volume_ma = (
+        np.asarray(a, dtype=float)
+        for a in (close, ma20, ma50, rsi, macd, macd_signal, volume, volume_ma))
+
+    # MA crossover only counts once both averages exist
+    have_mas = ~np.isnan(ma20) & ~np.isnan(ma50)
+    return {
+        'ma_cross': np.where(have_mas, np.where(ma20 > ma50, 2, -2), 0),
+        'price_vs_ma': np.where(close > ma20, 1, -1),
+        'rsi': np.where(rsi > 70, -1, np.where(rsi < 30, 2, 0)),
+        'macd': np.where(macd > macd_signal, 2, -2),
+        'volume': np.where(volume > volume_ma * 1.5, 1, 0),
+    }
+
+
+def score_arrays(close, ma20, ma50, rsi, macd, macd_signal, volume, volume_ma):
+    """Composite score, element-wise over arrays of any (matching) shape"""
+    components = score_components(close, ma20, ma50, rsi, macd, macd_signal,
+                                  volume, volume_ma)
+    return sum(components.values()).astype(np.int64)
+
+
+def score_series(data):
+    """Composite score for every bar of an indicator frame"""
+    score = score_arrays(data['Close'], data['MA_20'], data['MA_50'], data['RSI'],
+                         data['MACD'], data['MACD_Signal'],
+                         data['Volume'], data['Volume_MA'])
+    return pd.Series(score, index=data.index, name='Score')
+
+
+def recommendation_series(score):
+    """Recommendation label for every value of a score series"""
+    thresholds = [t for t, _ in RECOMMENDATIONS[:-1]]
+    labels = np.array([label for _, label in RECOMMENDATIONS])
+    # Thresholds run high to low, so count how many each score misses
+    index = (np.asarray(score)[..., None] < np.array(thresholds)).sum(axis=-1)
+    return pd.Series(labels[index], index=getattr(score, 'index', None), name='Recommendation')
+
+
+def composite_score(data):
+    """Composite score for the last bar of an indicator frame"""
+    return int(score_series(data.iloc[-1:]).iloc[0])
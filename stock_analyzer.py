@@ -1,6 +1,20 @@
-import yfinance as yf
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from bar_cache import BarCache
+from data_sources import DATA_DIR_ENV, make_provider
+
+bar_cache = BarCache()
 
 def calculate_rsi(prices, window=14):
     """Calculate RSI (Relative Strength Index)"""
@@ -11,53 +25,101 @@ def calculate_rsi(prices, window=14):
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
-def analyze_stock(ticker):
-    """Analyze a stock and generate signals"""
-    print(f"\nFetching data for {ticker.upper()}...")
-    
-    try:
-        stock = yf.Ticker(ticker)
-        data = stock.history(period="6mo")
-        
-        if data.empty:
-            print(f"❌ No data found for {ticker.upper()}. Please check the ticker symbol.")
-            return
-            
-        print(f"Got {len(data)} days of data")
-        print(f"Price range: ${data['Close'].min():.2f} - ${data['Close'].max():.2f}")
+def calculate_report_indicators(data):
+    """Indicators shown on the report chart"""
+    data['MA_20'] = data['Close'].rolling(window=20).mean()
+    data['MA_50'] = data['Close'].rolling(window=50).mean()
+    data['RSI'] = calculate_rsi(data['Close'])
+    return data
 
-        # Calculate indicators
-        data['MA_20'] = data['Close'].rolling(window=20).mean()
-        data['MA_50'] = data['Close'].rolling(window=50).mean()
-        data['RSI'] = calculate_rsi(data['Close'])
+class ReportTemplate:
+    """Price/RSI report figure built once and refilled for every ticker"""
 
-        # Create charts
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), height_ratios=[3, 1])
+    def __init__(self):
+        self.fig = Figure(figsize=(12, 10))
+        FigureCanvasAgg(self.fig)
+        self.ax1, self.ax2 = self.fig.subplots(2, 1, height_ratios=[3, 1])
+        ax1, ax2 = self.ax1, self.ax2
 
         # Price chart
-        ax1.plot(data.index, data['Close'], linewidth=2, label=f'{ticker.upper()} Close Price', color='blue')
-        ax1.plot(data.index, data['MA_20'], linewidth=1.5, label='20-day MA', color='orange')
-        ax1.plot(data.index, data['MA_50'], linewidth=1.5, label='50-day MA', color='red')
-        ax1.set_title(f'{ticker.upper()} Stock Analysis - Last 6 Months')
+        self.close_line, = ax1.plot([], [], linewidth=2, color='blue')
+        self.ma20_line, = ax1.plot([], [], linewidth=1.5, label='20-day MA', color='orange')
+        self.ma50_line, = ax1.plot([], [], linewidth=1.5, label='50-day MA', color='red')
         ax1.set_ylabel('Price ($)')
-        ax1.legend()
         ax1.grid(True, alpha=0.3)
 
         # RSI chart
-        ax2.plot(data.index, data['RSI'], linewidth=2, label='RSI', color='purple')
+        self.rsi_line, = ax2.plot([], [], linewidth=2, label='RSI', color='purple')
         ax2.axhline(y=70, color='r', linestyle='--', alpha=0.7, label='Overbought (70)')
         ax2.axhline(y=30, color='g', linestyle='--', alpha=0.7, label='Oversold (30)')
-        ax2.fill_between(data.index, 70, 100, alpha=0.1, color='red')
-        ax2.fill_between(data.index, 0, 30, alpha=0.1, color='green')
+        ax2.axhspan(70, 100, alpha=0.1, color='red')
+        ax2.axhspan(0, 30, alpha=0.1, color='green')
         ax2.set_ylabel('RSI')
         ax2.set_xlabel('Date')
         ax2.set_ylim(0, 100)
         ax2.legend()
         ax2.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        for ax in (ax1, ax2):
+            locator = mdates.AutoDateLocator()
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(mdates.AutoDateFormatter(locator))
+
+        self.fig.tight_layout()
+
+    def render(self, data, ticker, title, filename, dpi=300, thumbnail=None, thumb_dpi=40):
+        """Draw one ticker's report and save it (plus an optional thumbnail)"""
+        x = mdates.date2num(data.index)
+        self.close_line.set_data(x, data['Close'])
+        self.close_line.set_label(f'{ticker} Close Price')
+        self.ma20_line.set_data(x, data['MA_20'])
+        self.ma50_line.set_data(x, data['MA_50'])
+        self.rsi_line.set_data(x, data['RSI'])
+
+        self.ax1.set_title(title)
+        self.ax1.legend()
+        for ax in (self.ax1, self.ax2):
+            ax.set_xlim(x[0], x[-1])
+        prices = pd.concat([data['Close'], data['MA_20'], data['MA_50']])
+        low, high = prices.min(), prices.max()
+        pad = (high - low) * 0.05 or 1
+        self.ax1.set_ylim(low - pad, high + pad)
+
+        self.fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+        if thumbnail:
+            # Low-cost preview: tiny dpi and no tight-bbox pass
+            self.fig.savefig(thumbnail, dpi=thumb_dpi)
+
+_template = None
+
+def get_template():
+    """The report template for this process"""
+    global _template
+    if _template is None:
+        _template = ReportTemplate()
+    return _template
+
+def analyze_stock(ticker):
+    """Analyze a stock and generate signals"""
+    print(f"\nFetching data for {ticker.upper()}...")
+
+    try:
+        data = bar_cache.history(ticker, "6mo")
+
+        if data.empty:
+            print(f"❌ No data found for {ticker.upper()}. Please check the ticker symbol.")
+            return
+
+        print(f"Got {len(data)} days of data")
+        print(f"Price range: ${data['Close'].min():.2f} - ${data['Close'].max():.2f}")
+
+        # Calculate indicators
+        data = calculate_report_indicators(data)
+
+        # Create charts
         filename = f'{ticker.upper()}_analysis.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        get_template().render(data, ticker.upper(),
+                              f'{ticker.upper()} Stock Analysis - Last 6 Months', filename)
         print(f"Chart saved as {filename}")
 
         # Analysis
@@ -92,26 +154,100 @@ def analyze_stock(ticker):
         else:
             print("\n⏸️  OVERALL: HOLD - Mixed signals")
 
-        plt.close()
-        
     except Exception as e:
         print(f"❌ Error analyzing {ticker}: {e}")
 
-# Main program
-if __name__ == "__main__":
+def _report_worker(args):
+    """Render one ticker's report inside a pool worker"""
+    ticker, period, out_dir, dpi, thumbnails, thumb_dpi = args
+    timing = {'ticker': ticker, 'bars': 0, 'fetch': 0.0, 'render': 0.0, 'error': None}
+    try:
+        start = time.perf_counter()
+        data = bar_cache.history(ticker, period)
+        timing['fetch'] = time.perf_counter() - start
+        if data.empty:
+            raise ValueError("no data")
+        timing['bars'] = len(data)
+
+        start = time.perf_counter()
+        data = calculate_report_indicators(data)
+        filename = os.path.join(out_dir, f'{ticker}_analysis.png')
+        thumbnail = os.path.join(out_dir, f'{ticker}_thumb.png') if thumbnails else None
+        get_template().render(data, ticker, f'{ticker} Stock Analysis - {period.upper()}',
+                              filename, dpi=dpi, thumbnail=thumbnail, thumb_dpi=thumb_dpi)
+        timing['render'] = time.perf_counter() - start
+    except Exception as e:
+        timing['error'] = str(e)
+    return timing
+
+def batch_reports(tickers, period="6mo", out_dir=".", dpi=300, thumbnails=False,
+                  thumb_dpi=40, workers=None):
+    """Render report charts for many tickers in a process pool"""
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(t.upper(), period, out_dir, dpi, thumbnails, thumb_dpi) for t in tickers]
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        return list(pool.map(_report_worker, jobs))
+
+def print_timing_summary(timings, elapsed):
+    """Per-ticker timing table for a batch run"""
+    print(f"\n{'Ticker':<8} {'Bars':>6} {'Fetch (s)':>10} {'Render (s)':>11}  Status")
+    print("-" * 50)
+    for t in timings:
+        status = "✓" if t['error'] is None else f"❌ {t['error']}"
+        print(f"{t['ticker']:<8} {t['bars']:>6} {t['fetch']:>10.3f} {t['render']:>11.3f}  {status}")
+    done = sum(1 for t in timings if t['error'] is None)
+    print(f"\nRendered {done}/{len(timings)} reports in {elapsed:.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Stock Market Analyzer")
+    parser.add_argument('--batch', nargs='+', metavar='TICKER',
+                        help="render reports for these tickers and exit")
+    parser.add_argument('--batch-file', help="file with one ticker per line")
+    parser.add_argument('--period', default="6mo")
+    parser.add_argument('--out-dir', default=".")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--thumbnails', action='store_true', help="also save small previews")
+    parser.add_argument('--thumb-dpi', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--data-dir', help="read bars from local CSV/Parquet/NumPy files "
+                                           "in this directory instead of Yahoo Finance")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        # Report workers are spawned fresh and pick the directory up from the environment
+        os.environ[DATA_DIR_ENV] = args.data_dir
+        bar_cache.provider = make_provider(args.data_dir)
+
+    tickers = list(args.batch or [])
+    if args.batch_file:
+        with open(args.batch_file) as f:
+            tickers += [line.strip() for line in f if line.strip()]
+
+    if tickers:
+        start = time.perf_counter()
+        timings = batch_reports(tickers, args.period, args.out_dir, args.dpi,
+                                args.thumbnails, args.thumb_dpi, args.workers)
+        print_timing_summary(timings, time.perf_counter() - start)
+        return
+
     print("🚀 Stock Market Analyzer")
     print("=" * 40)
     print("Analyze any stock with technical indicators!")
     print("Try: AAPL, TSLA, GOOGL, MSFT, NVDA, etc.")
-    
+
     while True:
         ticker = input("\nEnter stock ticker (or 'quit' to exit): ").strip()
-        
+
         if ticker.lower() in ['quit', 'exit', 'q']:
             print("Thanks for using Stock Analyzer! 👋")
             break
-            
+
         if ticker:
             analyze_stock(ticker)
         else:
             print("Please enter a valid ticker symbol.")
+
+# Main program
+if __name__ == "__main__":
+    main()
@@ -5,20 +5,111 @@ Advanced stock analysis with modern UI and professional features
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import yfinance as yf
-import pandas as pd
-import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.patches import Rectangle
-import matplotlib.dates as mdates
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import os
 
+from analysis_scheduler import AnalysisScheduler, Superseded
+from perf_trace import TraceLog
+from watchlist_view import VirtualList
+
+# The data and plotting stacks dominate cold start, so they are imported by
+# load_heavy_modules() - warmed in the background once the window is up and
+# awaited by any code path that needs them first
+yf = pd = np = None
+Figure = FigureCanvasTkAgg = None
+AlertMonitor = BarCache = BarStore = ChartView = ExportQueue = FundamentalsCache = None
+FLOAT32_RTOL = None
+IndicatorEngine = LatestTable = Query = QueryError = SCREEN_COLUMNS = WatchlistRefresher = None
+DATA_FORMATS = available_formats = render_chart = write_frame = None
+LIVE_FPS = LiveSession = make_feed = None
+backtest_frame = backtest_universe = bars_per_year = calculate_indicators = clamp_period = compare = None
+recommendation = score_series = None
+
+# Screener: history refreshed per ticker (enough for the 200-day MA) and
+# the most result rows listed at once
+SCREEN_PERIOD = "1y"
+SCREEN_MAX_ROWS = 1000
+
+# Seconds between live price polls in the watchlist
+WATCHLIST_POLL_SECONDS = 30
+
+_heavy_lock = threading.Lock()
+_heavy_loaded = False
+
+def load_heavy_modules():
+    """Import yfinance, pandas, numpy, matplotlib and the analysis modules"""
+    global yf, pd, np, Figure, FigureCanvasTkAgg
+    global AlertMonitor, BarCache, BarStore, ChartView, ExportQueue, FundamentalsCache
+    global FLOAT32_RTOL
+    global IndicatorEngine, LatestTable, Query, QueryError, SCREEN_COLUMNS, WatchlistRefresher
+    global DATA_FORMATS, available_formats, render_chart, write_frame
+    global LIVE_FPS, LiveSession, make_feed
+    global backtest_frame, backtest_universe, bars_per_year, calculate_indicators, clamp_period, compare
+    global recommendation, score_series, _heavy_loaded
+    
+    with _heavy_lock:
+        if _heavy_loaded:
+            return
+        
+        import yfinance
+        import pandas
+        import numpy
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib import figure
+        from matplotlib.backends import backend_tkagg
+        
+        import alert_monitor
+        import backtest
+        import bar_cache
+        import bar_store
+        import chart_view
+        import compare as compare_module
+        import data_sources
+        import export_queue
+        import fundamentals_cache
+        import indicator_engine
+        import live_quotes
+        import screener
+        import signals
+        import watchlist_refresh
+        
+        yf, pd, np = yfinance, pandas, numpy
+        Figure = figure.Figure
+        FigureCanvasTkAgg = backend_tkagg.FigureCanvasTkAgg
+        AlertMonitor = alert_monitor.AlertMonitor
+        BarCache = bar_cache.BarCache
+        BarStore = bar_store.BarStore
+        FLOAT32_RTOL = bar_store.FLOAT32_RTOL
+        ChartView = chart_view.ChartView
+        ExportQueue = export_queue.ExportQueue
+        FundamentalsCache = fundamentals_cache.FundamentalsCache
+        IndicatorEngine = indicator_engine.IndicatorEngine
+        LatestTable = screener.LatestTable
+        Query = screener.Query
+        QueryError = screener.QueryError
+        SCREEN_COLUMNS = screener.SCREEN_COLUMNS
+        WatchlistRefresher = watchlist_refresh.WatchlistRefresher
+        DATA_FORMATS = export_queue.DATA_FORMATS
+        available_formats = export_queue.available_formats
+        render_chart = export_queue.render_chart
+        write_frame = export_queue.write_frame
+        LIVE_FPS = live_quotes.LIVE_FPS
+        LiveSession = live_quotes.LiveSession
+        make_feed = live_quotes.make_feed
+        backtest_frame = backtest.backtest_frame
+        backtest_universe = backtest.backtest_universe
+        bars_per_year = backtest.bars_per_year
+        calculate_indicators = indicator_engine.calculate_indicators
+        clamp_period = data_sources.clamp_period
+        compare = compare_module.compare
+        recommendation = signals.recommendation
+        score_series = signals.score_series
+        _heavy_loaded = True
+
 class StockAnalyzerPremium:
     def __init__(self, root):
         self.root = root
@@ -73,7 +164,27 @@ class StockAnalyzerPremium:
         self.alerts = self.load_alerts()
         self.current_ticker = None
         self.chart_data = None
+        self.chart_interval = "1d"
         self.current_canvas = None
+        self.bar_cache = None
+        self.bar_store = None
+        self.fundamentals = None
+        self.alert_monitor = None
+        self.export_queue = None
+        self.screener_table = None
+        self.screener_universe = None
+        self.indicator_state = None
+        # (session, feed) while the chart streams live quotes
+        self.live = None
+        self._services_lock = threading.Lock()
+        self.services_loaded = threading.Event()
+        
+        # Stage timings of recent analyses
+        self.trace_log = TraceLog()
+        
+        # One analysis at a time; newer requests supersede older ones
+        self.analysis_scheduler = AnalysisScheduler(
+            self._analyze_thread, on_idle=lambda: self.root.after(0, self._analysis_idle))
         
         # Indicator settings
         self.show_ma20 = tk.BooleanVar(value=True)
@@ -85,19 +196,79 @@ class StockAnalyzerPremium:
         # Build UI
         self.build_ui()
         
+        # Load the data stack once the window is on screen
+        self.root.after(50, lambda: threading.Thread(target=self.ensure_services,
+                                                     daemon=True).start())
+    
+    def ensure_services(self):
+        """Import the heavy modules and start the cache and alert monitor"""
+        load_heavy_modules()
+        with self._services_lock:
+            if self.bar_cache is not None:
+                return
+            self.bar_cache = BarCache()
+            # Analysed series stay in memory, compactly, for multi-ticker views
+            self.bar_store = BarStore()
+            self.fundamentals = FundamentalsCache(self.bar_cache.provider)
+            # Latest indicator values per ticker, kept current as tickers refresh
+            self.screener_table = LatestTable()
+            
+            # Files are written in the background, progress goes to the status bar
+            self.export_queue = ExportQueue(
+                on_progress=lambda job: self.root.after(0, self._export_progress, job),
+                on_done=lambda job: self.root.after(0, self._export_done, job))
+            
+            # Price alerts are checked in the background
+            self.alert_monitor = AlertMonitor(self.bar_cache.provider, self._alert_triggered)
+            self.alert_monitor.load(self.alerts)
+            self.alert_monitor.start()
+            self.services_loaded.set()
+    
+    def services_ready(self, action, *args):
+        """True once the data services are up. Before that, load them off the
+        Tk thread and run action(*args) on it when they are, so a click during
+        warm-up never freezes the window on the heavy imports"""
+        if self.services_loaded.is_set():
+            return True
+        self.status_label.config(text="Loading data services...")
+        
+        def load():
+            try:
+                self.ensure_services()
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Error",
+                                f"Could not load data services:\n{e}")
+                return
+            self.root.after(0, lambda: [self.status_label.config(text="Ready • Premium Edition"),
+                                        action(*args)])
+        
+        threading.Thread(target=load, daemon=True).start()
+        return False
+        
     def load_watchlist(self):
         if os.path.exists(self.watchlist_file):
             try:
                 with open(self.watchlist_file, 'r') as f:
-                    return json.load(f)
+                    watchlist = json.load(f)
+                # Also accept the {"stocks": [...], ...} layout
+                if isinstance(watchlist, dict):
+                    watchlist = watchlist.get('stocks', [])
+                return [str(ticker).upper() for ticker in watchlist]
             except:
                 return []
         return []
     
     def save_watchlist(self):
         try:
+            saved = self.watchlist
+            if os.path.exists(self.watchlist_file):
+                with open(self.watchlist_file, 'r') as f:
+                    existing = json.load(f)
+                # Keep the other keys of a {"stocks": [...], ...} file
+                if isinstance(existing, dict):
+                    saved = {**existing, 'stocks': self.watchlist}
             with open(self.watchlist_file, 'w') as f:
-                json.dump(self.watchlist, f)
+                json.dump(saved, f)
         except:
             pass
     
@@ -105,7 +276,10 @@ class StockAnalyzerPremium:
         if os.path.exists(self.alerts_file):
             try:
                 with open(self.alerts_file, 'r') as f:
-                    return json.load(f)
+                    alerts = json.load(f)
+                # Older files hold a single alert dict per ticker
+                return {ticker: entries if isinstance(entries, list) else [entries]
+                        for ticker, entries in alerts.items()}
             except:
                 return {}
         return {}
@@ -125,11 +299,12 @@ class StockAnalyzerPremium:
     def refresh_ui(self):
         """Refresh UI with new theme"""
         # Just rebuild everything - simpler than updating each widget
+        self.stop_live()
         for widget in self.root.winfo_children():
             widget.destroy()
         self.build_ui()
         if self.current_ticker and self.chart_data is not None:
-            self.create_chart(self.chart_data, self.current_ticker, None)
+            self.create_chart(self.chart_data, self.current_ticker)
     
     def build_ui(self):
         """Build the user interface"""
@@ -179,21 +354,32 @@ class StockAnalyzerPremium:
                                     width=8, state='readonly', font=('Arial', 9))
         period_combo.grid(row=0, column=3, padx=5)
         
+        # Interval
+        tk.Label(search_inner, text="Interval:", font=('Arial', 9, 'bold'),
+                fg=self.colors['text'], bg=self.colors['sidebar']).grid(row=0, column=4, padx=(15,5), sticky=tk.W)
+        
+        self.interval_var = tk.StringVar(value="1d")
+        interval_combo = ttk.Combobox(search_inner, textvariable=self.interval_var,
+                                      values=["1m", "5m", "1h", "1d", "1wk"],
+                                      width=5, state='readonly', font=('Arial', 9))
+        interval_combo.grid(row=0, column=5, padx=5)
+        
         # Chart type
         tk.Label(search_inner, text="Chart:", font=('Arial', 9, 'bold'),
-                fg=self.colors['text'], bg=self.colors['sidebar']).grid(row=0, column=4, padx=(15,5), sticky=tk.W)
+                fg=self.colors['text'], bg=self.colors['sidebar']).grid(row=0, column=6, padx=(15,5), sticky=tk.W)
         
         chart_combo = ttk.Combobox(search_inner, textvariable=self.chart_type,
                                    values=["candlestick", "line"],
                                    width=10, state='readonly', font=('Arial', 9))
-        chart_combo.grid(row=0, column=5, padx=5)
+        chart_combo.grid(row=0, column=7, padx=5)
+        chart_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_chart())
         
         # Analyze button
         analyze_btn = tk.Button(search_inner, text="⚡ ANALYZE", command=self.analyze,
                                font=('Arial', 10, 'bold'), bg=self.colors['accent'],
                                fg='white', bd=0, padx=20, pady=8, cursor='hand2',
                                activebackground=self.colors['accent'])
-        analyze_btn.grid(row=0, column=6, padx=15)
+        analyze_btn.grid(row=0, column=8, padx=15)
         
         # Right side buttons
         btn_frame = tk.Frame(top_bar, bg=self.colors['card'])
@@ -212,12 +398,30 @@ class StockAnalyzerPremium:
                  fg=self.colors['text'], bd=0, padx=12, pady=8,
                  cursor='hand2').pack(side=tk.LEFT, padx=5)
         
+        # Backtest
+        tk.Button(btn_frame, text="🧪 Backtest", command=self.show_backtest,
+                 font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                 fg=self.colors['text'], bd=0, padx=12, pady=8,
+                 cursor='hand2').pack(side=tk.LEFT, padx=5)
+        
+        # Timings
+        tk.Button(btn_frame, text="⏱ Timings", command=self.show_timings,
+                 font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                 fg=self.colors['text'], bd=0, padx=12, pady=8,
+                 cursor='hand2').pack(side=tk.LEFT, padx=5)
+        
         # Compare
         tk.Button(btn_frame, text="📈 Compare", command=self.compare_stocks,
                  font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
                  fg=self.colors['text'], bd=0, padx=12, pady=8,
                  cursor='hand2').pack(side=tk.LEFT, padx=5)
         
+        # Screener
+        tk.Button(btn_frame, text="🔎 Screener", command=self.show_screener,
+                 font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                 fg=self.colors['text'], bd=0, padx=12, pady=8,
+                 cursor='hand2').pack(side=tk.LEFT, padx=5)
+        
         # Watchlist
         tk.Button(btn_frame, text="⭐ Watchlist", command=self.show_watchlist,
                  font=('Arial', 9, 'bold'), bg=self.colors['warning'],
@@ -308,12 +512,20 @@ class StockAnalyzerPremium:
                                    cursor='hand2', state='disabled')
         self.alert_btn.pack(side=tk.LEFT, padx=5)
         
+        self.live_btn = tk.Button(header_right, text="🔴 Live",
+                                  command=self.toggle_live,
+                                  font=('Arial', 9), bg=self.colors['danger'],
+                                  fg='white', bd=0, padx=12, pady=6,
+                                  cursor='hand2', state='disabled')
+        self.live_btn.pack(side=tk.LEFT, padx=5)
+        
         # Separator
         tk.Frame(chart_card, bg=self.colors['border'], height=1).pack(fill=tk.X)
         
         # Chart area
         self.chart_frame = tk.Frame(chart_card, bg=self.colors['card'])
         self.chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self.chart_view = None
         
         # Welcome message
         self.show_welcome()
@@ -422,21 +634,25 @@ class StockAnalyzerPremium:
         content.pack(fill=tk.BOTH, expand=True, padx=25, pady=25)
         
         tk.Checkbutton(content, text="Moving Average (20)", variable=self.show_ma20,
+                      command=self.refresh_chart,
                       font=('Arial', 10), bg=self.colors['bg'], fg=self.colors['text'],
                       selectcolor=self.colors['card'], activebackground=self.colors['bg'],
                       activeforeground=self.colors['text']).pack(anchor=tk.W, pady=8)
         
         tk.Checkbutton(content, text="Moving Average (50)", variable=self.show_ma50,
+                      command=self.refresh_chart,
                       font=('Arial', 10), bg=self.colors['bg'], fg=self.colors['text'],
                       selectcolor=self.colors['card'], activebackground=self.colors['bg'],
                       activeforeground=self.colors['text']).pack(anchor=tk.W, pady=8)
         
         tk.Checkbutton(content, text="Bollinger Bands", variable=self.show_bollinger,
+                      command=self.refresh_chart,
                       font=('Arial', 10), bg=self.colors['bg'], fg=self.colors['text'],
                       selectcolor=self.colors['card'], activebackground=self.colors['bg'],
                       activeforeground=self.colors['text']).pack(anchor=tk.W, pady=8)
         
         tk.Checkbutton(content, text="MACD", variable=self.show_macd,
+                      command=self.refresh_chart,
                       font=('Arial', 10), bg=self.colors['bg'], fg=self.colors['text'],
                       selectcolor=self.colors['card'], activebackground=self.colors['bg'],
                       activeforeground=self.colors['text']).pack(anchor=tk.W, pady=8)
@@ -448,10 +664,77 @@ class StockAnalyzerPremium:
                  fg='white', bd=0, padx=20, pady=10,
                  cursor='hand2').pack(pady=20)
     
+    def show_timings(self):
+        """Stage timings of recent analyses, with profiling and JSON export"""
+        win = tk.Toplevel(self.root)
+        win.title("Analysis Timings")
+        win.geometry("620x480")
+        win.configure(bg=self.colors['bg'])
+        
+        # Header
+        header = tk.Frame(win, bg=self.colors['card'], height=60)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="⏱ Analysis Timings", font=('Arial', 13, 'bold'),
+                fg=self.colors['text'], bg=self.colors['card']).pack(side=tk.LEFT, pady=20, padx=20)
+        
+        tk.Frame(header, bg=self.colors['border'], height=1).pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Controls
+        controls = tk.Frame(win, bg=self.colors['bg'])
+        controls.pack(fill=tk.X, padx=20, pady=(10, 0))
+        
+        profiling = tk.BooleanVar(value=self.trace_log.profiling)
+        tk.Checkbutton(controls, text="Capture cProfile + tracemalloc (slower)",
+                      variable=profiling,
+                      command=lambda: self.trace_log.set_profiling(profiling.get()),
+                      font=('Arial', 10), bg=self.colors['bg'], fg=self.colors['text'],
+                      selectcolor=self.colors['card'], activebackground=self.colors['bg'],
+                      activeforeground=self.colors['text']).pack(side=tk.LEFT)
+        
+        def export():
+            filename = filedialog.asksaveasfilename(
+                parent=win, defaultextension=".json",
+                initialfile=f"timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                filetypes=[("JSON", "*.json"), ("All Files", "*.*")]
+            )
+            if filename:
+                try:
+                    self.trace_log.export_json(filename)
+                    messagebox.showinfo("Success", f"Timings exported to:\n{filename}", parent=win)
+                except Exception as e:
+                    messagebox.showerror("Error", f"Export failed:\n{str(e)}", parent=win)
+        
+        tk.Button(controls, text="💾 Export JSON", command=export,
+                 font=('Arial', 9, 'bold'), bg=self.colors['accent'],
+                 fg='white', bd=0, padx=12, pady=6,
+                 cursor='hand2').pack(side=tk.RIGHT)
+        
+        # Stage summary and recent traces
+        text = scrolledtext.ScrolledText(win, font=('Courier', 9), wrap=tk.NONE,
+                                         bg=self.colors['card'], fg=self.colors['text'],
+                                         bd=0, padx=10, pady=10)
+        text.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        
+        report = f"{'Stage':<12} {'Runs':>5} {'Median':>9} {'Max':>9}\n"
+        report += f"{'-'*38}\n"
+        for stage, stats in self.trace_log.stage_stats().items():
+            report += (f"{stage:<12} {stats['count']:>5} {stats['median']*1000:>7.0f}ms "
+                       f"{stats['max']*1000:>7.0f}ms\n")
+        
+        report += "\nRECENT ANALYSES\n"
+        for trace in reversed(self.trace_log.traces()[-20:]):
+            started = datetime.fromtimestamp(trace.started).strftime('%H:%M:%S')
+            report += f"{started}  {trace.name}\n    {trace.summary()}\n"
+        
+        text.insert(tk.END, report)
+        text.config(state='disabled')
+    
     def refresh_chart(self):
         """Refresh chart with new settings"""
-        if self.current_ticker and self.chart_data is not None:
-            self.create_chart(self.chart_data, self.current_ticker, None)
+        if self.chart_view is not None:
+            self.chart_view.apply_settings(**self.chart_settings())
     
     def analyze(self):
         """Analyze stock"""
@@ -460,28 +743,38 @@ class StockAnalyzerPremium:
             messagebox.showwarning("Input Required", "Please enter a ticker symbol")
             return
         
-        self.current_ticker = ticker
-        self.status_label.config(text=f"Analyzing {ticker}...")
+        self.analysis_scheduler.submit(ticker, self.period_var.get(), self.interval_var.get())
+        stats = self.analysis_scheduler.stats()
+        status = f"Analyzing {ticker}..."
+        if stats['dropped']:
+            status += f" ({stats['dropped']} superseded)"
+        self.status_label.config(text=status)
         self.progress.pack(side=tk.RIGHT, padx=20)
         self.progress.start(10)
         
         # Clear
         self.info_text.delete(1.0, tk.END)
         self.signals_text.delete(1.0, tk.END)
-        
-        # Run in thread
-        thread = threading.Thread(target=self._analyze_thread, args=(ticker,))
-        thread.daemon = True
-        thread.start()
     
-    def _analyze_thread(self, ticker):
-        """Analysis thread"""
+    def _analyze_thread(self, request):
+        """Analysis job, run by the scheduler's worker thread"""
+        ticker, period, interval = request.key
+        trace = self.trace_log.start(f"{ticker} {period} {interval}")
         try:
-            period = self.period_var.get()
+            with trace.span('load'):
+                self.ensure_services()
+            
+            # Intraday history only goes back so far, so shorten the period if needed
+            clamped = clamp_period(period, interval)
+            if clamped != period:
+                period = clamped
+                self.root.after(0, self.period_var.set, period)
             
-            # Fetch data
-            stock = yf.Ticker(ticker)
-            data = stock.history(period=period)
+            # Fetch data (served from the local bar cache when possible, and
+            # resampled from finer cached bars rather than downloaded again)
+            with trace.span('fetch'):
+                data = self.bar_cache.bars(ticker, period, interval)
+            request.check()
             
             if data.empty:
                 self.root.after(0, messagebox.showerror, "Error", 
@@ -489,224 +782,212 @@ class StockAnalyzerPremium:
                 return
             
             # Calculate indicators
-            data = self.calculate_indicators(data)
-            self.chart_data = data
+            with trace.span('indicators'):
+                data = self.update_indicators(ticker, period, data, interval)
+                # The chart and later reads share the store's compact arrays,
+                # so the analysed series is held once
+                data = self.bar_store.put((ticker, interval), data, period).to_frame()
+                self.indicator_state = self.indicator_state[:2] + (data,)
+                if interval == "1d":
+                    self.screener_table.update(ticker, data)
+            request.check()
             
             # Update UI
-            self.root.after(0, self.create_chart, data, ticker, stock)
-            self.root.after(0, self.show_analysis, data, ticker, stock)
-            
-            # Enable buttons
-            if ticker not in self.watchlist:
-                self.root.after(0, self.add_watchlist_btn.config,
-                              {'text': '⭐ Add to Watchlist', 'state': 'normal'})
-            else:
-                self.root.after(0, self.add_watchlist_btn.config,
-                              {'text': '✓ In Watchlist', 'state': 'disabled'})
-            
-            self.root.after(0, self.alert_btn.config, {'state': 'normal'})
-            
-            self.root.after(0, self.status_label.config, 
-                          {'text': f'Analysis complete • {ticker}'})
+            self.root.after(0, self._show_result, request, data, trace)
             
+        except Superseded:
+            raise
         except Exception as e:
+            if request.cancelled:
+                return
             self.root.after(0, messagebox.showerror, "Error", 
                           f"Analysis failed:\n{str(e)}")
             self.root.after(0, self.status_label.config, {'text': 'Error'})
-        finally:
-            self.root.after(0, self.progress.stop)
-            self.root.after(0, self.progress.pack_forget)
     
-    def calculate_indicators(self, data):
-        """Calculate technical indicators"""
-        # Moving averages
-        data['MA_20'] = data['Close'].rolling(window=20).mean()
-        data['MA_50'] = data['Close'].rolling(window=50).mean()
-        data['MA_200'] = data['Close'].rolling(window=200).mean()
-        
-        # RSI
-        delta = data['Close'].diff()
-        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-        loss = -delta.where(delta < 0, 0).rolling(window=14).mean()
-        rs = gain / loss
-        data['RSI'] = 100 - (100 / (1 + rs))
-        
-        # MACD
-        ema_12 = data['Close'].ewm(span=12, adjust=False).mean()
-        ema_26 = data['Close'].ewm(span=26, adjust=False).mean()
-        data['MACD'] = ema_12 - ema_26
-        data['MACD_Signal'] = data['MACD'].ewm(span=9, adjust=False).mean()
-        data['MACD_Hist'] = data['MACD'] - data['MACD_Signal']
-        
-        # Bollinger Bands
-        sma = data['Close'].rolling(window=20).mean()
-        std = data['Close'].rolling(window=20).std()
-        data['BB_Upper'] = sma + (std * 2)
-        data['BB_Lower'] = sma - (std * 2)
-        
-        # Volume MA
-        data['Volume_MA'] = data['Volume'].rolling(window=20).mean()
+    def _show_result(self, request, data, trace):
+        """Render a finished analysis unless a newer request replaced it"""
+        if request.cancelled:
+            return
+        ticker = request.key[0]
+        self.stop_live()
+        self.current_ticker = ticker
+        self.chart_interval = request.key[2]
+        self.chart_data = data
+        
+        with trace.span('chart'):
+            self.create_chart(data, ticker)
+        # The canvas draws on idle; run it now so the draw gets its own span
+        with trace.span('draw'):
+            self.root.update_idletasks()
+        with trace.span('analysis'):
+            self.show_analysis(data, ticker)
+        
+        # Enable buttons
+        if ticker not in self.watchlist:
+            self.add_watchlist_btn.config(text='⭐ Add to Watchlist', state='normal')
+        else:
+            self.add_watchlist_btn.config(text='✓ In Watchlist', state='disabled')
         
+        self.alert_btn.config(state='normal')
+        self.live_btn.config(state='normal')
+        self.trace_log.record(trace)
+        self.status_label.config(text=f'{ticker} • {trace.summary()}')
+    
+    def _analysis_idle(self):
+        """Hide the progress bar once no analysis is queued or running"""
+        if self.analysis_scheduler.depth == 0:
+            self.progress.stop()
+            self.progress.pack_forget()
+    
+    def update_indicators(self, ticker, period, data, interval="1d"):
+        """Calculate indicators, only running new bars when refreshing the same chart"""
+        key = (ticker, period, interval)
+        if self.indicator_state is not None and self.indicator_state[0] == key:
+            _, engine, previous = self.indicator_state
+            last = engine.last_timestamp
+            head = previous[(previous.index >= data.index[0]) & (previous.index < last)]
+            same_head = (head.index.equals(data.index[data.index < last]) and
+                         np.allclose(head['Close'].to_numpy(), data['Close'].to_numpy()[:len(head)],
+                                     rtol=FLOAT32_RTOL, atol=0))
+            # Adjusted history (splits, dividends) changes old closes - recompute then
+            if last in data.index and same_head:
+                tail = engine.update_frame(data[data.index >= last].copy())
+                tail['Score'] = score_series(tail)
+                data = pd.concat([head, tail])
+                self.indicator_state = (key, engine, data)
+                return data
+        
+        data = self.calculate_indicators(data)
+        self.indicator_state = (key, IndicatorEngine().seed(data), data)
         return data
     
-    def create_chart(self, data, ticker, stock):
+    def calculate_indicators(self, data):
+        """Calculate technical indicators"""
+        return calculate_indicators(data)
+    
+    def chart_settings(self):
+        """Current chart type and indicator toggles"""
+        return {
+            'chart_type': self.chart_type.get(),
+            'show_ma20': self.show_ma20.get(),
+            'show_ma50': self.show_ma50.get(),
+            'show_bollinger': self.show_bollinger.get(),
+            'show_macd': self.show_macd.get(),
+        }
+    
+    def create_chart(self, data, ticker):
         """Create interactive chart with candlesticks"""
-        # Clear previous
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-        
         # Update title
+        self.chart_title.config(
+            text=f"{ticker} • {self.period_var.get().upper()} • {self.interval_var.get()}")
+        self.show_price(data)
+        
+        # The figure, canvas and toolbar are built once and reused
+        if self.chart_view is None:
+            for widget in self.chart_frame.winfo_children():
+                widget.destroy()
+            self.chart_view = ChartView(self.chart_frame, self.colors)
+            self.current_canvas = self.chart_view.canvas
+        
+        self.chart_view.show(data, ticker, **self.chart_settings())
+    
+    def show_price(self, data):
+        """Last price and change from the previous bar in the chart header"""
         current_price = data['Close'].iloc[-1]
         prev_price = data['Close'].iloc[-2]
         change = ((current_price - prev_price) / prev_price) * 100
         change_color = self.colors['success'] if change >= 0 else self.colors['danger']
-        
-        self.chart_title.config(text=f"{ticker} • {self.period_var.get().upper()}")
         self.price_label.config(
             text=f"${current_price:.2f} ({change:+.2f}%)",
             fg=change_color
         )
-        
-        # Create figure
-        fig = plt.figure(figsize=(15, 10), facecolor=self.colors['card'])
-        
-        # Grid layout based on indicators
-        ratios = [3, 1, 1] if self.show_macd.get() else [3, 1]
-        gs = fig.add_gridspec(len(ratios), 1, height_ratios=ratios, hspace=0.05)
-        
-        ax_idx = 0
-        ax1 = fig.add_subplot(gs[ax_idx])  # Price
-        ax_idx += 1
-        ax2 = fig.add_subplot(gs[ax_idx], sharex=ax1)  # Volume
-        ax_idx += 1
-        
-        axes = [ax1, ax2]
-        
-        if self.show_macd.get():
-            ax3 = fig.add_subplot(gs[ax_idx], sharex=ax1)  # MACD
-            axes.append(ax3)
-        
-        # Style all axes
-        for ax in axes:
-            ax.set_facecolor(self.colors['card'])
-            for spine in ax.spines.values():
-                spine.set_color(self.colors['border'])
-            ax.tick_params(colors=self.colors['text_dim'], labelsize=9)
-            ax.grid(True, alpha=0.2, color=self.colors['border'], linestyle='-')
-        
-        # PRICE CHART
-        if self.chart_type.get() == "candlestick":
-            self.plot_candlesticks(ax1, data)
-        else:
-            ax1.plot(data.index, data['Close'], linewidth=2.5,
-                    color=self.colors['accent'], label='Close', zorder=5)
-        
-        # Moving averages
-        if self.show_ma20.get():
-            ax1.plot(data.index, data['MA_20'], linewidth=2,
-                    label='MA 20', color=self.colors['success'], alpha=0.8, zorder=4)
-        
-        if self.show_ma50.get():
-            ax1.plot(data.index, data['MA_50'], linewidth=2,
-                    label='MA 50', color=self.colors['warning'], alpha=0.8, zorder=4)
-        
-        # Bollinger Bands
-        if self.show_bollinger.get():
-            ax1.fill_between(data.index, data['BB_Upper'], data['BB_Lower'],
-                            alpha=0.1, color=self.colors['accent'], zorder=1)
-            ax1.plot(data.index, data['BB_Upper'], linewidth=1,
-                    color=self.colors['accent'], alpha=0.3, linestyle='--', zorder=2)
-            ax1.plot(data.index, data['BB_Lower'], linewidth=1,
-                    color=self.colors['accent'], alpha=0.3, linestyle='--', zorder=2)
-        
-        ax1.set_ylabel('Price ($)', color=self.colors['text'], fontsize=11, fontweight='bold')
-        ax1.set_title(f'{ticker} Technical Analysis', color=self.colors['text'],
-                     fontsize=13, fontweight='bold', pad=15)
-        ax1.legend(loc='upper left', fontsize=9, framealpha=0.9,
-                  facecolor=self.colors['card'], edgecolor=self.colors['border'])
-        
-        # VOLUME
-        colors = [self.colors['success'] if data['Close'].iloc[i] >= data['Open'].iloc[i]
-                 else self.colors['danger'] for i in range(len(data))]
-        ax2.bar(data.index, data['Volume'], color=colors, alpha=0.6, width=0.8)
-        ax2.plot(data.index, data['Volume_MA'], linewidth=2,
-                color=self.colors['warning'], label='Volume MA', alpha=0.8)
-        ax2.set_ylabel('Volume', color=self.colors['text'], fontsize=10, fontweight='bold')
-        ax2.legend(loc='upper left', fontsize=9, framealpha=0.9,
-                  facecolor=self.colors['card'], edgecolor=self.colors['border'])
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(
-            lambda x, p: f'{x/1e6:.1f}M' if x >= 1e6 else f'{x/1e3:.0f}K'))
-        
-        # MACD (if enabled)
-        if self.show_macd.get():
-            ax3.plot(data.index, data['MACD'], linewidth=2,
-                    color=self.colors['accent'], label='MACD')
-            ax3.plot(data.index, data['MACD_Signal'], linewidth=2,
-                    color=self.colors['warning'], label='Signal')
-            
-            macd_colors = [self.colors['success'] if val >= 0 else self.colors['danger']
-                          for val in data['MACD_Hist']]
-            ax3.bar(data.index, data['MACD_Hist'], color=macd_colors, alpha=0.5, width=0.8)
-            ax3.axhline(0, color=self.colors['border'], linewidth=1)
-            
-            ax3.set_ylabel('MACD', color=self.colors['text'], fontsize=10, fontweight='bold')
-            ax3.set_xlabel('Date', color=self.colors['text'], fontsize=10)
-            ax3.legend(loc='upper left', fontsize=9, framealpha=0.9,
-                      facecolor=self.colors['card'], edgecolor=self.colors['border'])
+    
+    # Live mode
+    
+    def toggle_live(self):
+        if self.live is None:
+            self.start_live()
         else:
-            ax2.set_xlabel('Date', color=self.colors['text'], fontsize=10)
-        
-        # Hide x labels except bottom
-        for ax in axes[:-1]:
-            plt.setp(ax.get_xticklabels(), visible=False)
-        
-        plt.tight_layout()
-        
-        # Embed with toolbar (for zoom/pan)
-        canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-        canvas.draw()
-        
-        # Toolbar
-        toolbar = NavigationToolbar2Tk(canvas, self.chart_frame)
-        toolbar.update()
-        toolbar.config(bg=self.colors['sidebar'])
-        for child in toolbar.winfo_children():
-            if isinstance(child, tk.Button):
-                child.config(bg=self.colors['sidebar'], fg=self.colors['text'])
-        
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.stop_live()
+            self.status_label.config(text=f"{self.current_ticker} • live mode off")
+    
+    def start_live(self):
+        """Stream quotes into the chart's forming bar, redrawing at most LIVE_FPS times a second"""
+        if self.chart_data is None or self.chart_view is None:
+            return
+        ticker = self.current_ticker
+        try:
+            # Offline data sources replay the chart's last bars instead of streaming
+            feed, data = make_feed(self.bar_cache.provider, ticker, self.chart_data)
+            session = LiveSession(data, self.chart_interval)
+        except ValueError as e:
+            messagebox.showerror("Live Mode", str(e))
+            return
         
-        self.current_canvas = canvas
+        self.live = (session, feed)
+        self.chart_data = session.data
+        self.chart_view.show(session.data, ticker, **self.chart_settings())
+        self.chart_view.set_live(True)
+        self.live_btn.config(text="⏹ Stop Live")
+        
+        feed.start(session.on_tick,
+                   on_error=lambda e: self.root.after(0, self._live_failed, session, e),
+                   on_end=lambda: self.root.after(0, self._live_ended, session))
+        self._live_frame(session)
+        self._live_status(session)
     
-    def plot_candlesticks(self, ax, data):
-        """Plot candlestick chart"""
-        width = 0.6
-        width2 = 0.05
-        
-        for idx in range(len(data)):
-            date = mdates.date2num(data.index[idx])
-            open_price = data['Open'].iloc[idx]
-            close_price = data['Close'].iloc[idx]
-            high = data['High'].iloc[idx]
-            low = data['Low'].iloc[idx]
-            
-            color = self.colors['success'] if close_price >= open_price else self.colors['danger']
-            
-            # Wick
-            ax.plot([date, date], [low, high], color=color, linewidth=1, alpha=0.8, zorder=3)
-            
-            # Body
-            height = abs(close_price - open_price)
-            if height < 0.001:
-                height = 0.001
-            bottom = min(open_price, close_price)
-            
-            rect = Rectangle((date - width/2, bottom), width, height,
-                           facecolor=color, edgecolor=color, alpha=0.9, zorder=3)
-            ax.add_patch(rect)
+    def stop_live(self):
+        if self.live is None:
+            return
+        session, feed = self.live
+        self.live = None
+        feed.stop()
+        if self.chart_view is not None:
+            self.chart_view.set_live(False)
+        self.live_btn.config(text="🔴 Live")
     
-    def show_analysis(self, data, ticker, stock):
-        """Show detailed analysis with AI insights"""
+    def _live_frame(self, session):
+        """Apply the ticks that arrived since the last frame and redraw once"""
+        if self.live is None or self.live[0] is not session:
+            return
+        if session.apply():
+            self.chart_data = session.data
+            self.chart_view.update_live(session.data)
+            self.show_price(session.data)
+        # Scheduled after the work, so a slow redraw lowers the rate instead of queueing
+        self.root.after(1000 // LIVE_FPS, self._live_frame, session)
+    
+    def _live_status(self, session):
+        """Tick throughput in the status bar, once a second"""
+        if self.live is None or self.live[0] is not session:
+            return
+        stats = session.metrics.snapshot()
+        self.status_label.config(
+            text=f"🔴 LIVE {self.current_ticker} ({self.live[1].name}) • "
+                 f"{stats['ticks_per_sec']:.0f} ticks/s • {stats['dropped_per_sec']:.0f} dropped/s • "
+                 f"{stats['fps']:.1f} fps • {stats['ticks_per_frame']:.1f} ticks/frame • "
+                 f"{stats['processed']} ticks, {stats['dropped']} dropped")
+        self.root.after(1000, self._live_status, session)
+    
+    def _live_failed(self, session, error):
+        if self.live is None or self.live[0] is not session:
+            return
+        self.stop_live()
+        messagebox.showerror("Live Mode", f"Quote stream failed:\n{error}")
+    
+    def _live_ended(self, session):
+        if self.live is None or self.live[0] is not session:
+            return
+        # Take in the last ticks before the feed goes quiet
+        self._live_frame(session)
+        stats = session.metrics.snapshot()
+        self.stop_live()
+        self.status_label.config(
+            text=f"{self.current_ticker} • live feed ended after {stats['processed']} ticks "
+                 f"({stats['dropped']} dropped)")
+    
+    def build_info_text(self, data, ticker, info):
+        """Company and indicator summary for the info panel"""
         current_price = data['Close'].iloc[-1]
         prev_price = data['Close'].iloc[-2]
         change = ((current_price - prev_price) / prev_price) * 100
@@ -718,18 +999,11 @@ class StockAnalyzerPremium:
         macd = data['MACD'].iloc[-1]
         macd_signal = data['MACD_Signal'].iloc[-1]
         
-        # Get company info
-        try:
-            info = stock.info
-            name = info.get('longName', ticker)
-            market_cap = info.get('marketCap', 0)
-            sector = info.get('sector', 'N/A')
-            pe_ratio = info.get('trailingPE', 0)
-        except:
-            name = ticker
-            market_cap = 0
-            sector = 'N/A'
-            pe_ratio = 0
+        info = info or {}
+        name = info.get('longName') or ticker
+        market_cap = info.get('marketCap') or 0
+        sector = info.get('sector') or 'N/A'
+        pe_ratio = info.get('trailingPE') or 0
         
         # Stock info with color coding
         info_text = f"{'='*40}\n"
@@ -757,11 +1031,37 @@ class StockAnalyzerPremium:
         info_text += f"MACD:   {macd:.3f}\n"
         info_text += f"Signal: {macd_signal:.3f}\n"
         
-        self.info_text.insert(tk.END, info_text)
+        return info_text
+    
+    def _fundamentals_arrived(self, ticker, info):
+        """Fresh fundamentals from the cache's worker thread"""
+        self.root.after(0, self._refresh_info, ticker, info)
+    
+    def _refresh_info(self, ticker, info):
+        if ticker != self.current_ticker or self.chart_data is None:
+            return
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.insert(tk.END, self.build_info_text(self.chart_data, ticker, info))
+    
+    def show_analysis(self, data, ticker):
+        """Show detailed analysis with AI insights"""
+        current_price = data['Close'].iloc[-1]
+        
+        ma20 = data['MA_20'].iloc[-1]
+        ma50 = data['MA_50'].iloc[-1]
+        rsi = data['RSI'].iloc[-1]
+        macd = data['MACD'].iloc[-1]
+        macd_signal = data['MACD_Signal'].iloc[-1]
+        
+        # Company info is served from the fundamentals cache; a fetch, when
+        # one is needed, runs in the background and redraws this panel
+        info = self.fundamentals.lookup(ticker, self._fundamentals_arrived)
+        self.info_text.insert(tk.END, self.build_info_text(data, ticker, info))
         
-        # Trading signals with detailed analysis
+        # Trading signals with detailed analysis - the score itself comes
+        # from the vectorized Score column, this only builds the text
         signals = ""
-        score = 0
+        score = int(data['Score'].iloc[-1])
         insights = []
         
         # MA Analysis
@@ -773,24 +1073,20 @@ class StockAnalyzerPremium:
                 signals += "🟢 Bullish MA Crossover\n"
                 signals += f"   20-MA (${ma20:.2f}) > 50-MA (${ma50:.2f})\n"
                 insights.append("Golden cross detected - bullish momentum")
-                score += 2
             else:
                 signals += "🔴 Bearish MA Crossover\n"
                 signals += f"   20-MA (${ma20:.2f}) < 50-MA (${ma50:.2f})\n"
                 insights.append("Death cross present - bearish trend")
-                score -= 2
         
         # Price vs MA
         if current_price > ma20:
             signals += "🟢 Price Above 20-MA\n"
             pct_above = ((current_price - ma20) / ma20) * 100
             signals += f"   {pct_above:.1f}% above MA\n"
-            score += 1
         else:
             signals += "🔴 Price Below 20-MA\n"
             pct_below = ((ma20 - current_price) / ma20) * 100
             signals += f"   {pct_below:.1f}% below MA\n"
-            score -= 1
         
         signals += "\n"
         
@@ -802,12 +1098,10 @@ class StockAnalyzerPremium:
             signals += "🔴 Overbought Territory\n"
             signals += f"   RSI = {rsi:.1f} (> 70)\n"
             insights.append("Overbought - possible pullback ahead")
-            score -= 1
         elif rsi < 30:
             signals += "🟢 Oversold Territory\n"
             signals += f"   RSI = {rsi:.1f} (< 30)\n"
             insights.append("Oversold - potential bounce opportunity")
-            score += 2
         else:
             signals += "⚪ Neutral Zone\n"
             signals += f"   RSI = {rsi:.1f} (30-70)\n"
@@ -828,14 +1122,12 @@ class StockAnalyzerPremium:
             if data['MACD_Hist'].iloc[-1] > data['MACD_Hist'].iloc[-2]:
                 signals += "   📈 Momentum increasing\n"
                 insights.append("MACD shows strengthening uptrend")
-            score += 2
         else:
             signals += "🔴 Bearish MACD\n"
             signals += "   MACD < Signal Line\n"
             if data['MACD_Hist'].iloc[-1] < data['MACD_Hist'].iloc[-2]:
                 signals += "   📉 Momentum weakening\n"
                 insights.append("MACD signals downward pressure")
-            score -= 2
         
         signals += "\n"
         
@@ -849,7 +1141,6 @@ class StockAnalyzerPremium:
             signals += "🟢 High Volume\n"
             signals += f"   {(current_vol/avg_vol):.1f}x above average\n"
             insights.append("Strong volume confirms price action")
-            score += 1
         elif current_vol < avg_vol * 0.5:
             signals += "⚪ Low Volume\n"
             signals += f"   {(avg_vol/current_vol):.1f}x below average\n"
@@ -872,22 +1163,23 @@ class StockAnalyzerPremium:
         rec_inner.pack(fill=tk.BOTH, expand=True, pady=15)
         
         # Recommendation based on score
-        if score >= 5:
+        rec_label = recommendation(score)
+        if rec_label == "STRONG BUY":
             rec = "🚀 STRONG BUY"
             rec_color = self.colors['success']
             probability = "High probability of upward movement"
             desc = "Multiple strong bullish indicators aligned. " + " ".join(insights[:2])
-        elif score >= 2:
+        elif rec_label == "BUY":
             rec = "📈 BUY"
             rec_color = self.colors['success']
             probability = "Favorable risk/reward ratio"
             desc = "Positive momentum detected. " + " ".join(insights[:2])
-        elif score >= -1:
+        elif rec_label == "HOLD":
             rec = "⚪ HOLD"
             rec_color = self.colors['warning']
             probability = "Mixed signals - wait for clarity"
             desc = "Conflicting indicators suggest neutral stance. Monitor for breakout."
-        elif score >= -4:
+        elif rec_label == "SELL":
             rec = "📉 SELL"
             rec_color = self.colors['danger']
             probability = "Bearish pressure building"
@@ -953,21 +1245,242 @@ class StockAnalyzerPremium:
                  fg='white', bd=0, padx=20, pady=10,
                  cursor='hand2').pack(pady=10)
         
-        tk.Label(content, text="Feature coming soon: Side-by-side comparison\nof technical indicators and returns",
+        tk.Label(content, text="Normalized returns overlay plus a side-by-side\ntable of technical indicators",
                 font=('Arial', 9), fg=self.colors['text_dim'],
                 bg=self.colors['bg'], justify=tk.CENTER).pack(pady=30)
     
     def do_comparison(self, tickers_str, window):
         """Perform stock comparison"""
-        messagebox.showinfo("Coming Soon", 
-                          "Multi-stock comparison feature\nwill be available in the next update!")
+        tickers = list(dict.fromkeys(t.strip().upper() for t in tickers_str.split(',') if t.strip()))
+        if len(tickers) < 2:
+            messagebox.showwarning("Input Required", "Enter at least two tickers to compare",
+                                   parent=window)
+            return
         window.destroy()
+        
+        period = self.period_var.get()
+        self.status_label.config(text=f"Comparing {len(tickers)} stocks...")
+        self.progress.pack(side=tk.RIGHT, padx=20)
+        self.progress.start(10)
+        
+        thread = threading.Thread(target=self._comparison_thread, args=(tickers, period))
+        thread.daemon = True
+        thread.start()
+    
+    def _comparison_thread(self, tickers, period):
+        """Fetch all tickers and build the comparison panel"""
+        try:
+            self.ensure_services()
+            # Reuse series already analysed this session, fetch the rest concurrently
+            frames = {}
+            for ticker in tickers:
+                stored = self.bar_store.frame((ticker, "1d"), ['Close', 'Volume'], period)
+                if stored is not None:
+                    frames[ticker] = stored
+            
+            missing = [t for t in tickers if t not in frames]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                fetched = pool.map(lambda t: (t, self.bar_cache.history(t, period)), missing)
+                for ticker, data in fetched:
+                    if not data.empty:
+                        frames[ticker] = data
+            
+            if len(frames) < 2:
+                raise ValueError("Not enough data to compare")
+            
+            result = compare({t: frames[t] for t in tickers if t in frames})
+            self.root.after(0, self.show_comparison, result, period)
+            self.root.after(0, self.status_label.config,
+                            {'text': f'Comparison complete • {len(frames)} stocks'})
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error",
+                            f"Comparison failed:\n{str(e)}")
+            self.root.after(0, self.status_label.config, {'text': 'Error'})
+        finally:
+            self.root.after(0, self.progress.stop)
+            self.root.after(0, self.progress.pack_forget)
+    
+    def show_comparison(self, result, period):
+        """Show the returns overlay and indicator table"""
+        win = tk.Toplevel(self.root)
+        win.title("Stock Comparison")
+        win.geometry("1200x850")
+        win.configure(bg=self.colors['bg'])
+        
+        returns = result['returns']
+        summary = result['summary']
+        
+        # Overlay chart - one plot call draws every ticker's column
+        fig = Figure(figsize=(12, 5), facecolor=self.colors['card'])
+        ax = fig.add_subplot()
+        ax.set_facecolor(self.colors['card'])
+        for spine in ax.spines.values():
+            spine.set_color(self.colors['border'])
+        ax.tick_params(colors=self.colors['text_dim'], labelsize=9)
+        ax.grid(True, alpha=0.2, color=self.colors['border'], linestyle='-')
+        
+        lines = ax.plot(returns.index, returns.to_numpy(), linewidth=1.5)
+        ax.axhline(0, color=self.colors['border'], linewidth=1)
+        ax.set_ylabel('Return (%)', color=self.colors['text'], fontsize=10, fontweight='bold')
+        ax.set_title(f'Normalized Returns • {period.upper()}', color=self.colors['text'],
+                     fontsize=12, fontweight='bold')
+        if len(lines) <= 12:
+            ax.legend(lines, returns.columns, loc='upper left', fontsize=9, framealpha=0.9,
+                      facecolor=self.colors['card'], edgecolor=self.colors['border'])
+        fig.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(fig, win)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=15, pady=(15,0))
+        
+        # Indicator table
+        columns = list(summary.columns)
+        tree = ttk.Treeview(win, columns=columns, height=10)
+        tree.heading('#0', text='Ticker')
+        tree.column('#0', width=80)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100, anchor=tk.E)
+        tree.tag_configure('up', foreground=self.colors['success'])
+        tree.tag_configure('down', foreground=self.colors['danger'])
+        
+        for ticker, row in summary.iterrows():
+            tree.insert('', tk.END, iid=ticker, text=ticker,
+                        tags=('up' if row['Return %'] >= 0 else 'down',), values=(
+                f"${row['Price']:.2f}",
+                f"{row['Return %']:+.1f}%",
+                f"{row['Volatility %']:.1f}%",
+                f"{row['Max DD %']:.1f}%",
+                f"{row['RSI']:.1f}",
+                row['MACD'],
+                row['Trend'],
+                f"{row['Score']:+d}",
+                row['Signal'],
+            ))
+        
+        tree.bind('<Double-1>', lambda e: tree.focus() and self.quick_analyze(tree.focus()))
+        tree.pack(fill=tk.X, padx=15, pady=15)
+    
+    def show_backtest(self):
+        """Backtest the composite-score signals on the current stock and watchlist"""
+        if self.chart_data is None:
+            messagebox.showwarning("No Data", "Analyze a stock first!")
+            return
+        
+        win = tk.Toplevel(self.root)
+        win.title("Signal Backtest")
+        win.geometry("1100x820")
+        win.configure(bg=self.colors['bg'])
+        
+        # Header
+        header = tk.Frame(win, bg=self.colors['card'], height=60)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        tk.Label(header, text=f"🧪 Backtest • {self.current_ticker} • {self.period_var.get().upper()}",
+                font=('Arial', 13, 'bold'), fg=self.colors['text'],
+                bg=self.colors['card']).pack(side=tk.LEFT, pady=20, padx=20)
+        
+        allow_short = tk.BooleanVar(value=False)
+        tk.Checkbutton(header, text="Short on SELL", variable=allow_short,
+                      command=lambda: draw(),
+                      font=('Arial', 9), bg=self.colors['card'], fg=self.colors['text'],
+                      selectcolor=self.colors['sidebar'], activebackground=self.colors['card'],
+                      activeforeground=self.colors['text']).pack(side=tk.RIGHT, padx=20)
+        
+        # Equity curve vs buy & hold
+        fig = Figure(figsize=(11, 4), facecolor=self.colors['card'])
+        ax = fig.add_subplot()
+        canvas = FigureCanvasTkAgg(fig, win)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=15, pady=(15,0))
+        
+        metrics_label = tk.Label(win, text="", font=('Courier', 9), justify=tk.LEFT,
+                                 fg=self.colors['text'], bg=self.colors['bg'])
+        metrics_label.pack(anchor=tk.W, padx=20, pady=10)
+        
+        data = self.chart_data
+        # Metrics annualize by the chart's bars per year, not trading days
+        periods_per_year = bars_per_year(self.chart_interval)
+        
+        def draw():
+            result = backtest_frame(data, allow_short=allow_short.get(),
+                                    periods_per_year=periods_per_year)
+            hold = data['Close'] / data['Close'].iloc[0]
+            
+            ax.clear()
+            ax.set_facecolor(self.colors['card'])
+            for spine in ax.spines.values():
+                spine.set_color(self.colors['border'])
+            ax.tick_params(colors=self.colors['text_dim'], labelsize=9)
+            ax.grid(True, alpha=0.2, color=self.colors['border'], linestyle='-')
+            ax.plot(data.index, result['equity'], linewidth=2,
+                    color=self.colors['accent'], label='Signals')
+            ax.plot(data.index, hold, linewidth=1.5,
+                    color=self.colors['text_dim'], label='Buy & Hold')
+            ax.set_ylabel('Growth of $1', color=self.colors['text'], fontsize=10, fontweight='bold')
+            ax.legend(loc='upper left', fontsize=9, framealpha=0.9,
+                      facecolor=self.colors['card'], edgecolor=self.colors['border'])
+            fig.tight_layout()
+            canvas.draw_idle()
+            
+            metrics_label.config(text="   ".join(
+                f"{name}: {value:.2f}" for name, value in result['metrics'].items()))
+        
+        draw()
+        
+        # Watchlist universe
+        bottom = tk.Frame(win, bg=self.colors['bg'])
+        bottom.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0,15))
+        
+        columns = ('Total Return %', 'CAGR %', 'Sharpe', 'Max DD %', 'Hit Rate %', 'Turnover/yr')
+        tree = ttk.Treeview(bottom, columns=columns, height=8)
+        tree.heading('#0', text='Ticker')
+        tree.column('#0', width=80)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120, anchor=tk.E)
+        
+        def run_universe():
+            tickers = list(self.watchlist)
+            if not tickers:
+                messagebox.showinfo("Watchlist Empty", "Add stocks to your watchlist first",
+                                    parent=win)
+                return
+            run_btn.config(state='disabled', text="Running...")
+            period = self.period_var.get()
+            short = allow_short.get()
+            
+            def worker():
+                try:
+                    table, _, errors = backtest_universe(tickers, period, allow_short=short)
+                    self.root.after(0, show_table, table, errors)
+                except Exception as e:
+                    self.root.after(0, messagebox.showerror, "Error", f"Backtest failed:\n{str(e)}")
+            
+            threading.Thread(target=worker, daemon=True).start()
+        
+        def show_table(table, errors):
+            if not win.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for ticker, row in table.iterrows():
+                tree.insert('', tk.END, text=ticker,
+                            values=tuple(f"{row[col]:.2f}" for col in columns))
+            run_btn.config(state='normal', text="▶ Run on Watchlist")
+            if errors:
+                self.status_label.config(text=f"Backtest skipped {len(errors)} tickers without data")
+        
+        run_btn = tk.Button(bottom, text="▶ Run on Watchlist", command=run_universe,
+                           font=('Arial', 10, 'bold'), bg=self.colors['accent'],
+                           fg='white', bd=0, padx=20, pady=8, cursor='hand2')
+        run_btn.pack(anchor=tk.W, pady=(0,10))
+        tree.pack(fill=tk.BOTH, expand=True)
     
     def show_watchlist(self):
-        """Show watchlist with enhanced UI"""
+        """Show the watchlist as a virtualized table with live prices"""
         win = tk.Toplevel(self.root)
         win.title("Watchlist")
-        win.geometry("500x600")
+        win.geometry("720x640")
         win.configure(bg=self.colors['bg'])
         
         # Header
@@ -983,65 +1496,375 @@ class StockAnalyzerPremium:
                  command=lambda: self.quick_add_to_watchlist(win),
                  font=('Arial', 9, 'bold'), bg=self.colors['accent'],
                  fg='white', bd=0, padx=15, pady=8,
-                 cursor='hand2').pack(side=tk.RIGHT, padx=25, pady=20)
+                 cursor='hand2').pack(side=tk.RIGHT, padx=(0,25), pady=20)
+        
+        tk.Button(header, text="📡 Dashboard",
+                 command=lambda: [win.destroy(), self.show_watchlist_dashboard()],
+                 font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                 fg=self.colors['text'], bd=0, padx=15, pady=8,
+                 cursor='hand2').pack(side=tk.RIGHT, padx=10, pady=20)
+        
+        tk.Button(header, text="💾 Export",
+                 command=self.export_watchlist,
+                 font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                 fg=self.colors['text'], bd=0, padx=15, pady=8,
+                 cursor='hand2').pack(side=tk.RIGHT, pady=20)
         
         tk.Frame(header, bg=self.colors['border'], height=1).pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Content with scrollbar
-        content_frame = tk.Frame(win, bg=self.colors['bg'])
-        content_frame.pack(fill=tk.BOTH, expand=True)
+        if not self.watchlist:
+            tk.Label(win, 
+                    text="No stocks in watchlist\n\nClick '+ Add Stock' to get started",
+                    font=('Arial', 11), fg=self.colors['text_dim'],
+                    bg=self.colors['bg'], justify=tk.CENTER).pack(expand=True, pady=50)
+            return
         
-        canvas = tk.Canvas(content_frame, bg=self.colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        tk.Label(win, text=f"{len(self.watchlist)} stocks • double-click to analyze • ✕ or Delete to remove",
+                font=('Arial', 9), fg=self.colors['text_dim'],
+                bg=self.colors['bg']).pack(anchor=tk.W, padx=20, pady=(10,0))
+        
+        def open_ticker(ticker):
+            win.destroy()
+            self.quick_analyze(ticker)
+        
+        # Only the rows in view exist as canvas items, however long the list
+        view = VirtualList(win, self.colors, on_open=open_ticker,
+                           on_remove=lambda ticker: [self.remove_from_watchlist(ticker),
+                                                     view.remove_row(ticker)])
+        view.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5,20))
+        
+        tickers = list(self.watchlist)
+        view.set_rows(tickers)
+        win.update_idletasks()
+        
+        # Live columns load in the background and reach the view in per-frame batches
+        stop = threading.Event()
+        win.bind('<Destroy>', lambda e: stop.set() if e.widget is win else None)
+        threading.Thread(target=self._watchlist_feed,
+                         args=(view, tickers, self.period_var.get(), stop),
+                         daemon=True).start()
+    
+    def _watchlist_feed(self, view, tickers, period, stop):
+        """Fill a watchlist view: indexed values, a full refresh, then polled prices"""
+        self.ensure_services()
+        prev_close = {}
+        
+        # Tickers already in the screener table show their last known values at once
+        indexed, columns, _ = self.screener_table.columns()
+        wanted = set(tickers)
+        for i, ticker in enumerate(indexed):
+            if ticker in wanted:
+                score = columns['Score'][i]
+                view.post(ticker, price=columns['Close'][i], change=columns['Change'][i],
+                          rsi=columns['RSI'][i], score=score,
+                          recommendation=recommendation(int(score)) if score == score else '—')
+        
+        def show_row(ticker, row, error):
+            if error is not None:
+                view.post(ticker, recommendation='No data')
+                return
+            if row['change'] == row['change']:
+                prev_close[ticker] = row['price'] / (1 + row['change'] / 100)
+            view.post(ticker, price=row['price'], change=row['change'], rsi=row['rsi'],
+                      score=row['score'], recommendation=row['recommendation'])
+        
+        refresher = WatchlistRefresher(self.bar_cache.history, self.calculate_indicators,
+                                       on_frame=self.screener_table.update)
+        done = threading.Event()
+        refresher.refresh(tickers, period, on_row=show_row, on_done=done.set)
+        while not done.wait(0.5):
+            if stop.is_set():
+                refresher.cancel()
+                return
         
-        scrollable_frame.bind("<Configure>",
-                             lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        # Then poll last prices in one batched request per cycle
+        while not stop.wait(WATCHLIST_POLL_SECONDS):
+            try:
+                ranges = self.bar_cache.provider.price_ranges(tickers)
+            except Exception:
+                continue
+            for ticker, (last, high, low) in ranges.items():
+                if ticker in prev_close:
+                    view.post(ticker, price=last,
+                              change=(last - prev_close[ticker]) / prev_close[ticker] * 100)
+    
+    def show_watchlist_dashboard(self):
+        """Refresh the whole watchlist at once and show a live summary table"""
+        if not self.services_ready(self.show_watchlist_dashboard):
+            return
+        win = tk.Toplevel(self.root)
+        win.title("Watchlist Dashboard")
+        win.geometry("820x600")
+        win.configure(bg=self.colors['bg'])
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Header
+        header = tk.Frame(win, bg=self.colors['card'], height=70)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="📡 Watchlist Dashboard", font=('Arial', 14, 'bold'),
+                fg=self.colors['text'], bg=self.colors['card']).pack(side=tk.LEFT,
+                                                                      pady=25, padx=25)
         
-        canvas.pack(side="left", fill="both", expand=True, padx=20, pady=20)
-        scrollbar.pack(side="right", fill="y", pady=20)
+        progress_label = tk.Label(header, text="", font=('Arial', 9),
+                                  fg=self.colors['text_dim'], bg=self.colors['card'])
+        progress_label.pack(side=tk.RIGHT, padx=25)
+        
+        tk.Frame(header, bg=self.colors['border'], height=1).pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Table
+        style = ttk.Style(win)
+        style.configure("Dashboard.Treeview", background=self.colors['card'],
+                        fieldbackground=self.colors['card'], foreground=self.colors['text'],
+                        rowheight=26, font=('Arial', 10))
+        style.configure("Dashboard.Treeview.Heading", font=('Arial', 9, 'bold'))
+        
+        columns = ('price', 'change', 'rsi', 'macd', 'score', 'rec')
+        headings = ('Price', 'Change', 'RSI', 'MACD', 'Score', 'Signal')
+        tree = ttk.Treeview(win, columns=columns, style="Dashboard.Treeview")
+        tree.heading('#0', text='Ticker')
+        tree.column('#0', width=90)
+        for col, title in zip(columns, headings):
+            tree.heading(col, text=title)
+            tree.column(col, width=110, anchor=tk.E if col != 'rec' else tk.CENTER)
+        tree.tag_configure('up', foreground=self.colors['success'])
+        tree.tag_configure('down', foreground=self.colors['danger'])
+        tree.tag_configure('error', foreground=self.colors['text_dim'])
+        
+        scrollbar = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=20)
+        tree.pack(fill=tk.BOTH, expand=True, padx=(20,0), pady=20)
+        
+        def open_ticker(event):
+            item = tree.focus()
+            if item:
+                win.destroy()
+                self.quick_analyze(item)
+        
+        tree.bind('<Double-1>', open_ticker)
         
         if not self.watchlist:
-            tk.Label(scrollable_frame, 
-                    text="No stocks in watchlist\n\nClick '+ Add Stock' to get started",
-                    font=('Arial', 11), fg=self.colors['text_dim'],
-                    bg=self.colors['bg'], justify=tk.CENTER).pack(expand=True, pady=50)
-        else:
-            for ticker in self.watchlist:
-                self.create_watchlist_card(scrollable_frame, ticker, win)
+            progress_label.config(text="Watchlist is empty")
+            return
+        
+        # Placeholder rows fill in as each symbol finishes
+        for ticker in self.watchlist:
+            tree.insert('', tk.END, iid=ticker, text=ticker, values=('…',) * len(columns))
+        
+        done = [0]
+        total = len(self.watchlist)
+        
+        def show_row(ticker, row, error):
+            if not win.winfo_exists():
+                return
+            done[0] += 1
+            progress_label.config(text=f"Refreshed {done[0]}/{total}")
+            if error is not None:
+                tree.item(ticker, values=('—', '—', '—', '—', '—', 'No data'), tags=('error',))
+                return
+            tree.item(ticker, tags=('up' if row['change'] >= 0 else 'down',), values=(
+                f"${row['price']:.2f}",
+                f"{row['change']:+.2f}%",
+                f"{row['rsi']:.1f}",
+                row['macd'],
+                f"{row['score']:+d}",
+                row['recommendation'],
+            ))
+        
+        refresher = WatchlistRefresher(self.bar_cache.history, self.calculate_indicators,
+                                       on_frame=self.screener_table.update)
+        refresher.refresh(list(self.watchlist), self.period_var.get(),
+                          on_row=lambda *args: self.root.after(0, show_row, *args))
+        win.bind('<Destroy>', lambda e: refresher.cancel() if e.widget is win else None)
     
-    def create_watchlist_card(self, parent, ticker, window):
-        """Create a card for watchlist item"""
-        card = tk.Frame(parent, bg=self.colors['card'],
-                       highlightbackground=self.colors['border'],
-                       highlightthickness=1)
-        card.pack(fill=tk.X, pady=5)
+    def show_screener(self):
+        """Screen every indexed ticker with an expression over the indicator columns"""
+        if not self.services_ready(self.show_screener):
+            return
+        table = self.screener_table
         
-        inner = tk.Frame(card, bg=self.colors['card'])
-        inner.pack(fill=tk.X, padx=20, pady=15)
+        win = tk.Toplevel(self.root)
+        win.title("Screener")
+        win.geometry("900x650")
+        win.configure(bg=self.colors['bg'])
         
-        # Ticker
-        tk.Label(inner, text=ticker, font=('Arial', 13, 'bold'),
-                fg=self.colors['text'], bg=self.colors['card']).pack(side=tk.LEFT)
+        # Header
+        header = tk.Frame(win, bg=self.colors['card'], height=70)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="🔎 Screener", font=('Arial', 14, 'bold'),
+                fg=self.colors['text'], bg=self.colors['card']).pack(side=tk.LEFT,
+                                                                      pady=25, padx=25)
         
-        # Buttons
-        btn_frame = tk.Frame(inner, bg=self.colors['card'])
-        btn_frame.pack(side=tk.RIGHT)
+        status_label = tk.Label(header, text="", font=('Arial', 9),
+                                fg=self.colors['text_dim'], bg=self.colors['card'])
+        status_label.pack(side=tk.RIGHT, padx=25)
         
-        tk.Button(btn_frame, text="Analyze",
-                 command=lambda: [window.destroy(), self.quick_analyze(ticker)],
-                 font=('Arial', 9), bg=self.colors['accent'],
-                 fg='white', bd=0, padx=12, pady=6,
-                 cursor='hand2').pack(side=tk.LEFT, padx=3)
+        tk.Frame(header, bg=self.colors['border'], height=1).pack(side=tk.BOTTOM, fill=tk.X)
         
-        tk.Button(btn_frame, text="Remove",
-                 command=lambda: self.remove_from_watchlist_ui(ticker, card),
-                 font=('Arial', 9), bg=self.colors['danger'],
-                 fg='white', bd=0, padx=12, pady=6,
-                 cursor='hand2').pack(side=tk.LEFT, padx=3)
+        # Screen expression
+        controls = tk.Frame(win, bg=self.colors['bg'])
+        controls.pack(fill=tk.X, padx=20, pady=(15,5))
+        
+        tk.Label(controls, text="Screen", font=('Arial', 9, 'bold'), width=8, anchor=tk.W,
+                fg=self.colors['text_dim'], bg=self.colors['bg']).grid(row=0, column=0, sticky=tk.W)
+        query_entry = tk.Entry(controls, font=('Courier', 10), bg=self.colors['card'],
+                               fg=self.colors['text'], insertbackground=self.colors['text'],
+                               relief='flat')
+        query_entry.grid(row=0, column=1, sticky=tk.EW, ipady=6, padx=(0,10))
+        query_entry.insert(0, "RSI < 30 and MA_20 > MA_50 and Volume > 1.5*Volume_MA")
+        
+        tk.Button(controls, text="Run", command=lambda: run(),
+                 font=('Arial', 9, 'bold'), bg=self.colors['accent'],
+                 fg='white', bd=0, padx=15, pady=6,
+                 cursor='hand2').grid(row=0, column=2, sticky=tk.EW)
+        
+        # Universe of tickers to refresh into the table
+        tk.Label(controls, text="Universe", font=('Arial', 9, 'bold'), width=8, anchor=tk.W,
+                fg=self.colors['text_dim'], bg=self.colors['bg']).grid(row=1, column=0,
+                                                                      sticky=tk.W, pady=(8,0))
+        universe_entry = tk.Entry(controls, font=('Arial', 10), bg=self.colors['card'],
+                                  fg=self.colors['text'], insertbackground=self.colors['text'],
+                                  relief='flat')
+        universe_entry.grid(row=1, column=1, sticky=tk.EW, ipady=6, padx=(0,10), pady=(8,0))
+        universe = self.screener_universe or sorted(set(self.watchlist) | set(table.tickers))
+        universe_entry.insert(0, " ".join(universe))
+        
+        buttons = tk.Frame(controls, bg=self.colors['bg'])
+        buttons.grid(row=1, column=2, pady=(8,0))
+        tk.Button(buttons, text="📂", command=lambda: load_list(),
+                 font=('Arial', 9), bg=self.colors['sidebar'], fg=self.colors['text'],
+                 bd=0, padx=8, pady=6, cursor='hand2').pack(side=tk.LEFT, padx=(0,5))
+        refresh_btn = tk.Button(buttons, text="🔄 Refresh", command=lambda: refresh(),
+                                font=('Arial', 9, 'bold'), bg=self.colors['sidebar'],
+                                fg=self.colors['text'], bd=0, padx=10, pady=6, cursor='hand2')
+        refresh_btn.pack(side=tk.LEFT)
+        controls.columnconfigure(1, weight=1)
+        
+        tk.Label(win, text="Columns: " + ", ".join(SCREEN_COLUMNS) + " • and, or, not, abs()",
+                font=('Arial', 8), fg=self.colors['text_dim'], bg=self.colors['bg'],
+                wraplength=840, justify=tk.LEFT).pack(anchor=tk.W, padx=20)
+        
+        # Results
+        style = ttk.Style(win)
+        style.configure("Screener.Treeview", background=self.colors['card'],
+                        fieldbackground=self.colors['card'], foreground=self.colors['text'],
+                        rowheight=24, font=('Arial', 10))
+        style.configure("Screener.Treeview.Heading", font=('Arial', 9, 'bold'))
+        
+        columns = ('Close', 'Change', 'RSI', 'MACD_Hist', 'Volume', 'Score', 'As Of')
+        formats = {'Close': '${:.2f}', 'Change': '{:+.2f}%', 'RSI': '{:.1f}',
+                   'MACD_Hist': '{:+.3f}', 'Volume': '{:,.0f}', 'Score': '{:+.0f}'}
+        tree = ttk.Treeview(win, columns=columns, style="Screener.Treeview")
+        tree.heading('#0', text='Ticker', command=lambda: sort_by(None))
+        tree.column('#0', width=90)
+        for col in columns:
+            tree.heading(col, text=col.replace('_', ' '), command=lambda c=col: sort_by(c))
+            tree.column(col, width=105, anchor=tk.E)
+        tree.tag_configure('up', foreground=self.colors['success'])
+        tree.tag_configure('down', foreground=self.colors['danger'])
+        
+        scrollbar = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=15)
+        tree.pack(fill=tk.BOTH, expand=True, padx=(20,0), pady=15)
+        
+        # Double-click opens the ticker in the main chart; the window stays open
+        def open_ticker(event):
+            item = tree.focus()
+            if item:
+                self.quick_analyze(item)
+        
+        tree.bind('<Double-1>', open_ticker)
+        
+        state = {'result': None, 'sort': ('Score', False), 'query': None}
+        
+        def show(result):
+            tree.delete(*tree.get_children())
+            shown = result.iloc[:SCREEN_MAX_ROWS]
+            for ticker, row in shown.iterrows():
+                values = [formats[col].format(row[col]) if col in formats and row[col] == row[col]
+                          else '—' for col in columns[:-1]]
+                values.append(row['As Of'].strftime('%Y-%m-%d'))
+                tree.insert('', tk.END, iid=ticker, text=ticker, values=values,
+                            tags=('up' if row['Change'] >= 0 else 'down',))
+            return len(shown)
+        
+        def run():
+            column, ascending = state['sort']
+            start = datetime.now()
+            try:
+                query = Query(query_entry.get())
+                result = table.screen(query, sort_by=column, ascending=ascending)
+            except QueryError as e:
+                status_label.config(text=f"⚠️ {e}", fg=self.colors['danger'])
+                return
+            elapsed = (datetime.now() - start).total_seconds() * 1000
+            state['result'], state['query'] = result, query
+            shown = show(result)
+            text = f"{len(result)} of {len(table)} tickers match • {elapsed:.0f}ms"
+            if shown < len(result):
+                text += f" • showing {shown}"
+            status_label.config(text=text, fg=self.colors['text_dim'])
+        
+        def sort_by(column):
+            if state['result'] is None:
+                return
+            current, ascending = state['sort']
+            ascending = not ascending if column == current else column is None
+            state['sort'] = (column, ascending)
+            result = state['result']
+            if column is None:
+                result = result.sort_index(ascending=ascending)
+            else:
+                result = result.sort_values(column, ascending=ascending, na_position='last')
+            state['result'] = result
+            show(result)
+        
+        def load_list():
+            filename = filedialog.askopenfilename(
+                parent=win, filetypes=[("Text", "*.txt *.csv"), ("All Files", "*.*")])
+            if filename:
+                with open(filename) as f:
+                    tickers = [line.split(',')[0].strip().upper() for line in f if line.strip()]
+                universe_entry.delete(0, tk.END)
+                universe_entry.insert(0, " ".join(tickers))
+        
+        def refresh():
+            tickers = sorted({t.strip().upper() for t in universe_entry.get().replace(',', ' ').split()
+                              if t.strip()})
+            if not tickers:
+                return
+            self.screener_universe = tickers
+            refresh_btn.config(state='disabled')
+            done = [0]
+            
+            def progress(ticker, row, error):
+                done[0] += 1
+                if win.winfo_exists():
+                    status_label.config(text=f"Refreshed {done[0]}/{len(tickers)}",
+                                        fg=self.colors['text_dim'])
+            
+            def finished():
+                table.save()
+                if win.winfo_exists():
+                    refresh_btn.config(state='normal')
+                    run()
+            
+            refresher = WatchlistRefresher(self.bar_cache.history, self.calculate_indicators,
+                                           on_frame=table.update)
+            refresher.refresh(tickers, SCREEN_PERIOD,
+                              on_row=lambda *args: self.root.after(0, progress, *args),
+                              on_done=lambda: self.root.after(0, finished))
+            win.bind('<Destroy>', lambda e: refresher.cancel() if e.widget is win else None)
+        
+        query_entry.bind('<Return>', lambda e: run())
+        if len(table):
+            run()
+        else:
+            status_label.config(text="No tickers indexed yet - enter a universe and refresh")
     
     def quick_add_to_watchlist(self, parent_win):
         """Quick add to watchlist"""
@@ -1087,16 +1910,15 @@ class StockAnalyzerPremium:
             messagebox.showinfo("Added", f"{self.current_ticker} added to watchlist!")
             self.add_watchlist_btn.config(text="✓ In Watchlist", state='disabled')
     
-    def remove_from_watchlist_ui(self, ticker, card_widget):
-        """Remove from watchlist with UI update"""
+    def remove_from_watchlist(self, ticker):
+        """Remove a ticker from the watchlist"""
         if ticker in self.watchlist:
             self.watchlist.remove(ticker)
             self.save_watchlist()
-            card_widget.destroy()
     
     def set_alert(self):
         """Set price alert"""
-        if not self.current_ticker:
+        if not self.current_ticker or not self.services_ready(self.set_alert):
             return
         
         dialog = tk.Toplevel(self.root)
@@ -1137,13 +1959,14 @@ class StockAnalyzerPremium:
         def save_alert():
             try:
                 price = float(price_entry.get())
-                self.alerts[self.current_ticker] = {
+                self.alerts.setdefault(self.current_ticker, []).append({
                     'type': alert_type.get(),
                     'price': price
-                }
+                })
                 self.save_alerts()
+                self.alert_monitor.add(self.current_ticker, alert_type.get(), price)
                 messagebox.showinfo("Alert Set", 
-                                  f"You'll be notified when {self.current_ticker} goes {alert_type.get()} ${price:.2f}\n\n(Note: Real-time monitoring coming soon)")
+                                  f"You'll be notified when {self.current_ticker} goes {alert_type.get()} ${price:.2f}")
                 dialog.destroy()
             except ValueError:
                 messagebox.showerror("Invalid Price", "Please enter a valid number")
@@ -1153,6 +1976,36 @@ class StockAnalyzerPremium:
                  fg='white', bd=0, padx=20, pady=8,
                  cursor='hand2').pack(pady=20)
     
+    def _alert_triggered(self, ticker, alert_type, level, last_price):
+        """Called from the alert monitor thread"""
+        self.root.after(0, self.notify_alert, ticker, alert_type, level, last_price)
+    
+    def notify_alert(self, ticker, alert_type, level, last_price):
+        """Show a triggered alert and drop it from alerts.json"""
+        entries = self.alerts.get(ticker, [])
+        for alert in entries:
+            if alert['type'] == alert_type and alert['price'] == level:
+                entries.remove(alert)
+                break
+        if not entries:
+            self.alerts.pop(ticker, None)
+        self.save_alerts()
+        
+        self.root.bell()
+        self.status_label.config(text=f"🔔 {ticker} went {alert_type} ${level:.2f}")
+        
+        toast = tk.Toplevel(self.root)
+        toast.title("Price Alert")
+        toast.configure(bg=self.colors['card'])
+        toast.attributes('-topmost', True)
+        
+        tk.Label(toast, text=f"🔔 {ticker} Alert", font=('Arial', 12, 'bold'),
+                fg=self.colors['accent'], bg=self.colors['card']).pack(padx=30, pady=(20,5))
+        tk.Label(toast, text=f"Price went {alert_type} ${level:.2f}\nLast: ${last_price:.2f}",
+                font=('Arial', 10), fg=self.colors['text'], bg=self.colors['card'],
+                justify=tk.CENTER).pack(padx=30, pady=(0,20))
+        toast.after(10000, toast.destroy)
+    
     def export_menu(self):
         """Show export options"""
         if not self.current_ticker:
@@ -1163,13 +2016,15 @@ class StockAnalyzerPremium:
         menu.add_command(label="📊 Export Chart (PNG)", command=self.export_chart_png)
         menu.add_command(label="📄 Export Analysis (TXT)", command=self.export_analysis_txt)
         menu.add_command(label="📑 Export Data (CSV)", command=self.export_data_csv)
+        menu.add_separator()
+        menu.add_command(label="📦 Export Watchlist...", command=self.export_watchlist)
         
         # Show menu at mouse position
         menu.post(self.root.winfo_pointerx(), self.root.winfo_pointery())
     
     def export_chart_png(self):
         """Export chart as PNG"""
-        if not hasattr(self, 'current_canvas') or not self.current_ticker:
+        if self.chart_data is None or not self.current_ticker:
             return
         
         filename = filedialog.asksaveasfilename(
@@ -1179,13 +2034,12 @@ class StockAnalyzerPremium:
         )
         
         if filename:
-            try:
-                self.current_canvas.figure.savefig(filename, dpi=300,
-                                                   bbox_inches='tight',
-                                                   facecolor=self.colors['card'])
-                messagebox.showinfo("Success", "Chart exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+            # Re-rendered off-screen from the stored data, so the live chart is untouched
+            data, ticker = self.chart_data, self.current_ticker
+            colors, settings = dict(self.colors), self.chart_settings()
+            self.export_queue.submit(f"{ticker} chart", [(filename, lambda: render_chart(
+                data, ticker, colors, filename, settings, dpi=300,
+                bbox_inches='tight', facecolor=colors['card']))])
     
     def export_analysis_txt(self):
         """Export analysis as text"""
@@ -1199,20 +2053,22 @@ class StockAnalyzerPremium:
         )
         
         if filename:
-            try:
+            # Widget text has to be read here; the write happens in the background
+            report = (f"Stock Analysis Report - {self.current_ticker}\n"
+                      f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                      + "="*60 + "\n\n"
+                      "STOCK INFORMATION\n"
+                      + "-"*60 + "\n"
+                      + self.info_text.get(1.0, tk.END)
+                      + "\n\nTRADING SIGNALS\n"
+                      + "-"*60 + "\n"
+                      + self.signals_text.get(1.0, tk.END))
+            
+            def write():
                 with open(filename, 'w') as f:
-                    f.write(f"Stock Analysis Report - {self.current_ticker}\n")
-                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("="*60 + "\n\n")
-                    f.write("STOCK INFORMATION\n")
-                    f.write("-"*60 + "\n")
-                    f.write(self.info_text.get(1.0, tk.END))
-                    f.write("\n\nTRADING SIGNALS\n")
-                    f.write("-"*60 + "\n")
-                    f.write(self.signals_text.get(1.0, tk.END))
-                messagebox.showinfo("Success", "Analysis exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+                    f.write(report)
+            
+            self.export_queue.submit(f"{self.current_ticker} analysis", [(filename, write)])
     
     def export_data_csv(self):
         """Export data as CSV"""
@@ -1226,11 +2082,99 @@ class StockAnalyzerPremium:
         )
         
         if filename:
-            try:
-                self.chart_data.to_csv(filename)
-                messagebox.showinfo("Success", "Data exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+            data = self.chart_data
+            self.export_queue.submit(f"{self.current_ticker} data",
+                                     [(filename, lambda: write_frame(data, filename, 'csv'))])
+    
+    def export_watchlist(self):
+        """Write every watchlist ticker's indicator frame to one directory"""
+        if not self.watchlist:
+            messagebox.showwarning("Empty Watchlist", "Add stocks to the watchlist first!")
+            return
+        if not self.services_ready(self.export_watchlist):
+            return
+        
+        win = tk.Toplevel(self.root)
+        win.title("Export Watchlist")
+        win.configure(bg=self.colors['card'])
+        win.resizable(False, False)
+        
+        tk.Label(win, text=f"📦 Export {len(self.watchlist)} stocks", font=('Arial', 12, 'bold'),
+                fg=self.colors['text'], bg=self.colors['card']).pack(padx=30, pady=(20,5), anchor=tk.W)
+        tk.Label(win, text=f"Indicator data for the {self.period_var.get()} period, one file per stock",
+                font=('Arial', 9), fg=self.colors['text_dim'],
+                bg=self.colors['card']).pack(padx=30, pady=(0,10), anchor=tk.W)
+        
+        available = available_formats()
+        choices = {}
+        for fmt, label in (('csv', 'CSV'), ('parquet', 'Parquet'), ('feather', 'Feather')):
+            choices[fmt] = tk.BooleanVar(value=fmt == 'csv')
+            tk.Checkbutton(win, text=label, variable=choices[fmt],
+                          state='normal' if fmt in available else 'disabled',
+                          font=('Arial', 10), fg=self.colors['text'], bg=self.colors['card'],
+                          selectcolor=self.colors['sidebar'],
+                          activebackground=self.colors['card']).pack(padx=30, anchor=tk.W)
+        if len(available) < len(choices):
+            tk.Label(win, text="Parquet and Feather need pyarrow (pip install pyarrow)",
+                    font=('Arial', 8), fg=self.colors['text_dim'],
+                    bg=self.colors['card']).pack(padx=30, pady=(5,0), anchor=tk.W)
+        
+        def start():
+            formats = [fmt for fmt, var in choices.items() if var.get()]
+            if not formats:
+                return
+            directory = filedialog.askdirectory(parent=win, title="Export to folder")
+            if not directory:
+                return
+            win.destroy()
+            self._queue_watchlist_export(list(self.watchlist), self.period_var.get(),
+                                         directory, formats)
+        
+        tk.Button(win, text="Export", command=start, font=('Arial', 10, 'bold'),
+                 bg=self.colors['accent'], fg='white', bd=0, padx=20, pady=8,
+                 cursor='hand2').pack(padx=30, pady=20, anchor=tk.E)
+    
+    def _queue_watchlist_export(self, tickers, period, directory, formats):
+        """One background job with a step per ticker, fetched in parallel"""
+        def export_one(ticker):
+            # Analysed series are reused; anything else comes through the bar cache
+            data = self.bar_store.frame((ticker, "1d"), period=period)
+            if data is None:
+                data = self.bar_cache.bars(ticker, period)
+                if data.empty:
+                    raise ValueError(f"No data found for {ticker}")
+                data = self.calculate_indicators(data)
+                self.bar_store.put((ticker, "1d"), data, period)
+                self.screener_table.update(ticker, data)
+            for fmt in formats:
+                filename = f"{ticker}_{period}{DATA_FORMATS[fmt]}"
+                write_frame(data, os.path.join(directory, filename), fmt)
+        
+        steps = [(ticker, lambda ticker=ticker: export_one(ticker)) for ticker in tickers]
+        self.export_queue.submit(f"watchlist to {directory}", steps, workers=8)
+        self.status_label.config(text=f"💾 Exporting {len(tickers)} stocks...")
+    
+    def _export_progress(self, job):
+        if job.total > 1:
+            self.status_label.config(text=f"💾 Exporting {job.label}: {job.done}/{job.total}")
+        else:
+            self.status_label.config(text=f"💾 Exporting {job.label}...")
+    
+    def _export_done(self, job):
+        """Report a finished export in the status bar, and any failures once"""
+        if job.cancelled:
+            self.status_label.config(text=f"Export of {job.label} cancelled")
+            return
+        written = job.total - len(job.errors)
+        if job.total > 1:
+            self.status_label.config(text=f"✓ Exported {job.label} ({written}/{job.total})")
+        elif not job.errors:
+            self.status_label.config(text=f"✓ Exported {job.label} to {job.steps[0][0]}")
+        if job.errors:
+            details = "\n".join(f"{name}: {error}" for name, error in job.errors[:10])
+            if len(job.errors) > 10:
+                details += f"\n... and {len(job.errors) - 10} more"
+            messagebox.showerror("Error", f"Export failed:\n{details}")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,100 @@
+"""Alert levels against a fake price_ranges feed"""
+
+from alert_monitor import AlertIndex, AlertMonitor
+
+
+class FakeFeed:
+    """Serves one (last, high, low) per ticker per poll and logs each call"""
+
+    def __init__(self, *polls):
+        self.polls = list(polls)
+        self.calls = []
+
+    def price_ranges(self, tickers, since=None):
+        self.calls.append((sorted(tickers), since))
+        return self.polls.pop(0)
+
+
+def monitor(feed, alerts):
+    fired = []
+    m = AlertMonitor(feed, lambda *alert: fired.append(alert))
+    m.load(alerts)
+    return m, fired
+
+
+def test_levels_touched_exactly_fire():
+    index = AlertIndex()
+    index.add('above', 110.0)
+    index.add('below', 90.0)
+
+    assert sorted(index.pop_triggered(low=90.0, high=110.0)) == [('above', 110.0), ('below', 90.0)]
+    assert len(index) == 0
+
+
+def test_levels_just_outside_the_range_wait():
+    index = AlertIndex()
+    index.add('above', 110.01)
+    index.add('below', 89.99)
+
+    assert index.pop_triggered(low=90.0, high=110.0) == []
+    assert len(index) == 2
+
+
+def test_only_crossed_levels_on_each_side_fire():
+    index = AlertIndex()
+    for level in (95.0, 105.0, 110.0, 120.0):
+        index.add('above', level)
+    for level in (80.0, 90.0, 100.0):
+        index.add('below', level)
+
+    triggered = index.pop_triggered(low=92.0, high=110.0)
+
+    assert sorted(triggered) == [('above', 95.0), ('above', 105.0), ('above', 110.0),
+                                 ('below', 100.0)]
+    assert index.above == [120.0] and index.below == [80.0, 90.0]
+
+
+def test_equal_levels_fire_together():
+    index = AlertIndex()
+    index.add('above', 100.0)
+    index.add('above', 100.0)
+    index.remove('above', 100.0)
+
+    assert index.pop_triggered(low=99.0, high=100.0) == [('above', 100.0)]
+
+
+def test_alerts_fire_once_across_polls():
+    feed = FakeFeed({'AAPL': (150.0, 151.0, 149.0), 'MSFT': (300.0, 301.0, 299.0)},
+                    {'MSFT': (310.0, 312.0, 300.0)},
+                    {'MSFT': (310.0, 312.0, 300.0)})
+    m, fired = monitor(feed, {
+        'AAPL': [{'type': 'above', 'price': 151.0}, {'type': 'below', 'price': 140.0}],
+        'MSFT': [{'type': 'above', 'price': 310.0}],
+    })
+
+    assert m.check_once() == [('AAPL', 'above', 151.0, 150.0)]
+    assert m.check_once() == [('MSFT', 'above', 310.0, 310.0)]
+    # MSFT has no alerts left, so it is no longer polled
+    assert m.tickers() == ['AAPL']
+    assert m.check_once() == []
+    assert fired == [('AAPL', 'above', 151.0, 150.0), ('MSFT', 'above', 310.0, 310.0)]
+    assert feed.calls[-1][0] == ['AAPL']
+
+
+def test_no_polls_without_alerts():
+    feed = FakeFeed()
+    m, fired = monitor(feed, {'AAPL': [{'type': 'above', 'price': 151.0}]})
+    m.remove('AAPL', 'above', 151.0)
+
+    assert m.check_once() == [] and feed.calls == [] and fired == []
+
+
+def test_each_poll_asks_for_ranges_since_the_last_one():
+    feed = FakeFeed({}, {})
+    m, _ = monitor(feed, {'AAPL': [{'type': 'above', 'price': 151.0}]})
+
+    m.check_once()
+    m.check_once()
+
+    assert feed.calls[0][1] is None
+    assert feed.calls[1][1] is not None
@@ -0,0 +1,144 @@
+"""BarCache against a stub provider that records every fetch"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bar_cache import BarCache
+from data_sources import DATA_DIR_ENV, LocalFileProvider, make_provider, slice_period
+
+
+def make_bars(index):
+    close = 100 + np.arange(len(index), dtype=float)
+    return pd.DataFrame({'Open': close - 0.5, 'High': close + 1, 'Low': close - 1,
+                         'Close': close, 'Volume': np.full(len(index), 1000.0)}, index=index)
+
+
+def assert_same_bars(left, right):
+    # Cached files reload at nanosecond resolution; the timestamps themselves must match
+    pd.testing.assert_frame_equal(left, right, check_index_type=False, check_freq=False)
+    assert left.index.equals(right.index)
+
+
+class StubProvider:
+    """Serves fixed series per (ticker, interval) and logs each fetch"""
+
+    local = False
+
+    def __init__(self, series):
+        self.series = series
+        self.calls = []
+
+    def fetch(self, ticker, interval="1d", period=None, start=None):
+        self.calls.append((ticker, interval, period, start))
+        data = self.series[(ticker, interval)]
+        if start is not None:
+            return data[data.index >= start].copy()
+        return slice_period(data, period or "1y").copy()
+
+
+@pytest.fixture
+def daily():
+    end = pd.Timestamp.now(tz='America/New_York').normalize()
+    index = pd.bdate_range(end=end, periods=600, tz='America/New_York', name='Date')
+    return make_bars(index)
+
+
+@pytest.fixture
+def hourly():
+    end = pd.Timestamp.now(tz='America/New_York').floor('h')
+    index = pd.date_range(end=end, periods=24 * 45, freq='h', name='Datetime')
+    return make_bars(index)
+
+
+def test_first_request_fetches_the_full_period(tmp_path, daily):
+    provider = StubProvider({('AAPL', '1d'): daily})
+    cache = BarCache(provider, cache_dir=str(tmp_path))
+
+    data = cache.history('aapl', '1y')
+
+    assert provider.calls == [('AAPL', '1d', '1y', None)]
+    assert_same_bars(data, slice_period(daily, '1y'))
+    assert cache.stats()['misses'] == 1
+
+
+def test_stale_series_fetches_only_the_tail(tmp_path, daily):
+    provider = StubProvider({('AAPL', '1d'): daily.iloc[:-1]})
+    cache = BarCache(provider, cache_dir=str(tmp_path), refresh_after=0)
+    cache.history('AAPL', '1y')
+
+    # The last cached bar was still forming; its final values arrive with a new bar
+    revised = daily.copy()
+    revised.iloc[-2, revised.columns.get_loc('Close')] += 0.25
+    provider.series[('AAPL', '1d')] = revised
+    data = cache.history('AAPL', '1y')
+
+    _, _, period, start = provider.calls[-1]
+    assert period is None and start == daily.index[-2].normalize()
+    assert data.index.is_unique and data.index.is_monotonic_increasing
+    assert_same_bars(data, slice_period(revised, '1y'))
+    assert cache.stats()['tail_refreshes'] == 1
+
+
+def test_covers(tmp_path, daily):
+    provider = StubProvider({('AAPL', '1d'): daily})
+    cache = BarCache(provider, cache_dir=str(tmp_path))
+    assert not cache.covers('AAPL', '6mo')
+
+    cache.history('AAPL', '1y')
+
+    assert cache.covers('AAPL', '6mo')
+    assert cache.covers('AAPL', '1y')
+    assert cache.covers('AAPL', '5d')
+    assert not cache.covers('AAPL', '2y')
+    assert not cache.covers('AAPL', 'max')
+    assert not cache.covers('AAPL', '1y', '1h')
+
+
+def test_bars_prefers_the_cached_interval(tmp_path, daily, hourly):
+    provider = StubProvider({('AAPL', '1d'): daily, ('AAPL', '1h'): hourly})
+    cache = BarCache(provider, cache_dir=str(tmp_path))
+    cache.history('AAPL', '1mo', '1h')
+    cache.history('AAPL', '1mo', '1d')
+    fetched = len(provider.calls)
+
+    data = cache.bars('AAPL', '1mo', '1d')
+
+    assert len(provider.calls) == fetched
+    assert_same_bars(data, slice_period(daily, '1mo'))
+
+
+def test_bars_resamples_finer_cached_bars(tmp_path, daily, hourly):
+    provider = StubProvider({('AAPL', '1d'): daily, ('AAPL', '1h'): hourly})
+    cache = BarCache(provider, cache_dir=str(tmp_path))
+    cache.history('AAPL', '1mo', '1h')
+    fetched = len(provider.calls)
+
+    data = cache.bars('AAPL', '1mo', '1d')
+
+    assert len(provider.calls) == fetched
+    assert data.index.is_unique
+    days = slice_period(hourly, '1mo').index.normalize()
+    assert len(data) == len(days.unique())
+    assert data['Volume'].sum() == slice_period(hourly, '1mo')['Volume'].sum()
+
+
+def test_npz_round_trip(tmp_path, daily):
+    provider = StubProvider({('AAPL', '1d'): daily})
+    BarCache(provider, cache_dir=str(tmp_path)).history('AAPL', '2y')
+
+    # A new cache over the same directory serves the saved file untouched
+    reopened = BarCache(StubProvider({}), cache_dir=str(tmp_path), refresh_after=3600)
+    data = reopened.history('AAPL', '2y')
+
+    assert reopened.provider.calls == []
+    assert (tmp_path / 'AAPL_1d.npz').exists()
+    assert_same_bars(data, slice_period(daily, '2y'))
+    assert str(data.index.tz) == 'America/New_York' and data.index.name == 'Date'
+
+
+def test_make_provider_uses_local_files_when_configured(tmp_path, monkeypatch):
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    assert isinstance(make_provider(), LocalFileProvider)
+    monkeypatch.delenv(DATA_DIR_ENV)
+    assert not getattr(make_provider(), 'local', False)
@@ -0,0 +1,80 @@
+"""
+Concurrent watchlist refresh
+Fetches and analyses every watchlist symbol on a bounded thread pool and
+reports each row as soon as its symbol finishes
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from signals import composite_score, recommendation
+
+
+def summarize(ticker, data):
+    """Dashboard row for one analysed symbol"""
+    last = data.iloc[-1]
+    prev_close = data['Close'].iloc[-2] if len(data) > 1 else last['Close']
+    score = composite_score(data)
+    return {
+        'ticker': ticker,
+        'price': last['Close'],
+        'change': (last['Close'] - prev_close) / prev_close * 100,
+        'rsi': last['RSI'],
+        'macd': "Bullish" if last['MACD'] > last['MACD_Signal'] else "Bearish",
+        'score': score,
+        'recommendation': recommendation(score),
+    }
+
+
+class WatchlistRefresher:
+    """Refresh many symbols at once with a bounded number of fetches in flight"""
+
+    def __init__(self, fetch, indicators, max_workers=8, on_frame=None):
+        # fetch(ticker, period) -> bars, indicators(bars) -> indicator frame
+        self.fetch = fetch
+        self.indicators = indicators
+        self.max_workers = max_workers
+        # on_frame(ticker, frame) sees each indicator frame (e.g. to index it for screening)
+        self.on_frame = on_frame
+        self._cancelled = threading.Event()
+
+    def refresh(self, tickers, period, on_row, on_done=None):
+        """Start refreshing in the background.
+
+        on_row(ticker, row, error) is called from a worker thread as each
+        symbol finishes, with either a summary row or the exception.
+        """
+        self._cancelled.clear()
+        pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                  thread_name_prefix="watchlist")
+        futures = [pool.submit(self._refresh_one, ticker, period, on_row)
+                   for ticker in tickers]
+
+        def finish():
+            for future in futures:
+                future.result()
+            pool.shutdown()
+            if on_done is not None:
+                on_done()
+
+        threading.Thread(target=finish, daemon=True).start()
+
+    def cancel(self):
+        """Skip symbols that have not started yet"""
+        self._cancelled.set()
+
+    def _refresh_one(self, ticker, period, on_row):
+        if self._cancelled.is_set():
+            return
+        try:
+            data = self.fetch(ticker, period)
+            if len(data) < 2:
+                raise ValueError(f"No data found for {ticker}")
+            frame = self.indicators(data)
+            if self.on_frame is not None:
+                self.on_frame(ticker, frame)
+            row = summarize(ticker, frame)
+        except Exception as e:
+            on_row(ticker, None, e)
+        else:
+            on_row(ticker, row, None)
@@ -0,0 +1,299 @@
+"""
+Virtualized watchlist
+A scrolling table drawn on one Canvas that only keeps items for the rows in
+view, so thousands of symbols open instantly and scroll smoothly. Cell
+updates may come from any thread; they are queued and applied together
+once per UI frame, touching only the cells that are on screen.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+# Queued cell updates are applied at most this often
+FRAME_MS = 16
+
+
+def _number(spec, suffix=""):
+    return lambda value: format(value, spec) + suffix if value == value else '—'
+
+
+# (key, title, width, anchor, format) for each column
+COLUMNS = [
+    ('ticker', 'Ticker', 90, tk.W, str),
+    ('price', 'Last', 100, tk.E, lambda v: f"${v:,.2f}" if v == v else '—'),
+    ('change', 'Change', 90, tk.E, _number('+.2f', '%')),
+    ('rsi', 'RSI', 70, tk.E, _number('.1f')),
+    ('score', 'Score', 70, tk.E, _number('+.0f')),
+    ('recommendation', 'Signal', 120, tk.CENTER, str),
+]
+
+
+class VirtualList:
+    """Watchlist table keyed by ticker that materializes only the visible rows"""
+
+    def __init__(self, parent, colors, row_height=30, on_open=None, on_remove=None):
+        # on_open(ticker) on double-click or Enter, on_remove(ticker) on ✕ or Delete
+        self.colors = colors
+        self.row_height = row_height
+        self.on_open = on_open
+        self.on_remove = on_remove
+
+        self.keys = []
+        self.values = {}
+        self.selected = None
+        self.flushes = 0
+        self.cell_updates = 0
+
+        self._first = 0
+        self._slots = []
+        self._sort = (None, True)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        self.frame = tk.Frame(parent, bg=colors['bg'])
+        self.header = tk.Canvas(self.frame, height=row_height, bg=colors['sidebar'],
+                                highlightthickness=0)
+        self.header.pack(side=tk.TOP, fill=tk.X)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self.frame, bg=colors['card'], highlightthickness=0,
+                                takefocus=True)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._x = []
+        x = 10
+        for key, title, width, anchor, _ in COLUMNS:
+            self._x.append((x, width, anchor))
+            self.header.create_text(self._anchor_x(x, width, anchor), row_height // 2,
+                                    text=title, anchor=anchor, fill=colors['text_dim'],
+                                    font=('Arial', 9, 'bold'), tags=(f"col:{key}",))
+            x += width
+        self._remove_x = x + 10
+
+        self.header.bind('<Button-1>', self._on_header_click)
+        self.canvas.bind('<Configure>', lambda e: self._layout())
+        self.canvas.bind('<Button-1>', self._on_click)
+        self.canvas.bind('<Double-1>', lambda e: self._open(self._row_at(e.y)))
+        self.canvas.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.canvas.bind('<Button-4>', lambda e: self.scroll(-1))
+        self.canvas.bind('<Button-5>', lambda e: self.scroll(1))
+        self.canvas.bind('<Up>', lambda e: self._move_selection(-1))
+        self.canvas.bind('<Down>', lambda e: self._move_selection(1))
+        self.canvas.bind('<Return>', lambda e: self._open(self._selected_row()))
+        self.canvas.bind('<Delete>', lambda e: self._remove(self._selected_row()))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    # Rows
+
+    def set_rows(self, keys, values=None):
+        """Replace the rows; `values` optionally maps key -> {column: value}"""
+        self.keys = list(keys)
+        self.values = {key: {'ticker': key} for key in self.keys}
+        for key, row in (values or {}).items():
+            if key in self.values:
+                self.values[key].update(row)
+        self._first = 0
+        self._render()
+
+    def add_row(self, key, **values):
+        if key in self.values:
+            return
+        self.keys.append(key)
+        self.values[key] = {'ticker': key, **values}
+        self._render()
+
+    def remove_row(self, key):
+        if key not in self.values:
+            return
+        self.keys.remove(key)
+        del self.values[key]
+        if self.selected == key:
+            self.selected = None
+        self._first = max(min(self._first, len(self.keys) - self._visible_rows()), 0)
+        self._render()
+
+    def post(self, key, **values):
+        """Queue new cell values for a row; safe to call from any thread"""
+        with self._pending_lock:
+            self._pending.setdefault(key, {}).update(values)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            self.canvas.after(FRAME_MS, self._flush)
+        except (tk.TclError, RuntimeError):
+            # The window was closed; late updates are dropped
+            pass
+
+    def sort(self, column, ascending=True):
+        """Order the rows by a column's current values (missing values last)"""
+        self._sort = (column, ascending)
+        present, missing = [], []
+        for key in self.keys:
+            value = self.values[key].get(column)
+            (missing if value is None or value != value else present).append(key)
+        present.sort(key=lambda key: self.values[key][column], reverse=not ascending)
+        self.keys = present + missing
+        self._render()
+
+    def scroll(self, rows):
+        self._scroll_to(self._first + rows)
+
+    # Drawing
+
+    def _anchor_x(self, x, width, anchor):
+        return {tk.W: x, tk.E: x + width - 10, tk.CENTER: x + width // 2}[anchor]
+
+    def _visible_rows(self):
+        return max(self.canvas.winfo_height() // self.row_height, 1)
+
+    def _layout(self):
+        """Keep one slot of canvas items per row that fits, plus one partial row"""
+        wanted = self._visible_rows() + 1
+        width = max(self.canvas.winfo_width(), self._remove_x + 30)
+        while len(self._slots) < wanted:
+            y = len(self._slots) * self.row_height
+            background = self.canvas.create_rectangle(0, y, width, y + self.row_height,
+                                                      outline='', fill=self.colors['card'])
+            cells = [self.canvas.create_text(self._anchor_x(x, w, anchor),
+                                             y + self.row_height // 2, text='', anchor=anchor,
+                                             fill=self.colors['text'], font=('Arial', 10))
+                     for x, w, anchor in self._x]
+            self.canvas.itemconfig(cells[0], font=('Arial', 10, 'bold'))
+            remove = self.canvas.create_text(self._remove_x, y + self.row_height // 2, text='',
+                                             anchor=tk.W, fill=self.colors['text_dim'],
+                                             font=('Arial', 10))
+            self._slots.append((background, cells, remove))
+        while len(self._slots) > wanted:
+            background, cells, remove = self._slots.pop()
+            self.canvas.delete(background, remove, *cells)
+        for background, _, _ in self._slots:
+            x0, y0, _, y1 = self.canvas.coords(background)
+            self.canvas.coords(background, x0, y0, width, y1)
+        self._scroll_to(self._first)
+
+    def _scroll_to(self, first):
+        self._first = max(min(first, len(self.keys) - self._visible_rows()), 0)
+        self._render()
+
+    def _render(self):
+        """Point every slot at the row it now shows"""
+        for i, (background, cells, remove) in enumerate(self._slots):
+            row = self._first + i
+            if row < len(self.keys):
+                key = self.keys[row]
+                self._fill(key, background, cells, remove, self.values[key])
+            else:
+                self.canvas.itemconfig(background, fill=self.colors['card'])
+                for cell in cells:
+                    self.canvas.itemconfig(cell, text='')
+                self.canvas.itemconfig(remove, text='')
+        total = len(self.keys)
+        if total:
+            self.scrollbar.set(self._first / total,
+                               min((self._first + self._visible_rows()) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _fill(self, key, background, cells, remove, values):
+        c = self.colors
+        shade = c['hover'] if key == self.selected else c['card']
+        self.canvas.itemconfig(background, fill=shade)
+        for cell, (column, _, _, _, fmt) in zip(cells, COLUMNS):
+            self._set_cell(cell, column, values, fmt)
+        self.canvas.itemconfig(remove, text='✕')
+
+    def _set_cell(self, cell, column, values, fmt):
+        value = values.get(column)
+        text = fmt(value) if value is not None else '…'
+        fill = self.colors['text']
+        if column == 'change' and value is not None and value == value:
+            fill = self.colors['success'] if value >= 0 else self.colors['danger']
+        self.canvas.itemconfig(cell, text=text, fill=fill)
+
+    def _flush(self):
+        """Apply every queued update at once, reconfiguring only visible cells"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._flush_scheduled = False
+        if not self.canvas.winfo_exists():
+            return
+        self.flushes += 1
+
+        for key, values in pending.items():
+            if key in self.values:
+                self.values[key].update(values)
+
+        columns = {key: i for i, (key, _, _, _, _) in enumerate(COLUMNS)}
+        for i, (_, cells, _) in enumerate(self._slots):
+            row = self._first + i
+            if row >= len(self.keys):
+                break
+            key = self.keys[row]
+            changed = pending.get(key)
+            if not changed:
+                continue
+            for column in changed:
+                index = columns.get(column)
+                if index is not None:
+                    self._set_cell(cells[index], column, self.values[key], COLUMNS[index][4])
+                    self.cell_updates += 1
+
+    # Input
+
+    def _yview(self, *args):
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.keys)))
+        elif args[0] == 'scroll':
+            step = self._visible_rows() if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def _row_at(self, y):
+        row = self._first + int(y // self.row_height)
+        return row if row < len(self.keys) else None
+
+    def _selected_row(self):
+        return self.keys.index(self.selected) if self.selected in self.values else None
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        row = self._row_at(event.y)
+        if row is None:
+            return
+        if event.x >= self._remove_x - 5:
+            self._remove(row)
+            return
+        self.selected = self.keys[row]
+        self._render()
+
+    def _on_header_click(self, event):
+        for (key, _, _, _, _), (x, width, _) in zip(COLUMNS, self._x):
+            if x <= event.x < x + width:
+                column, ascending = self._sort
+                ascending = not ascending if column == key else key in ('ticker', 'recommendation')
+                self.sort(key, ascending)
+                return
+
+    def _move_selection(self, step):
+        if not self.keys:
+            return
+        row = self._selected_row()
+        row = 0 if row is None else max(min(row + step, len(self.keys) - 1), 0)
+        self.selected = self.keys[row]
+        if row < self._first:
+            self._first = row
+        elif row >= self._first + self._visible_rows():
+            self._first = row - self._visible_rows() + 1
+        self._render()
+
+    def _open(self, row):
+        if row is not None and self.on_open is not None:
+            self.on_open(self.keys[row])
+
+    def _remove(self, row):
+        if row is not None and self.on_remove is not None:
+            self.on_remove(self.keys[row])